@@ -0,0 +1,9 @@
+"""
+오프라인 벤치마크 패키지
+
+합성 PDF와 로컬 가짜 Gemini 모델로 PDFProcessor의 전체 번역 과정을 네트워크 없이 실행하고
+처리량, 최대 메모리 사용량(RSS), 단계별 소요 시간을 보고합니다.
+
+실행 예:
+    python -m benchmarks --pages 20,200 --kinds text,scanned,mixed --workers 8 --latency 0.2
+"""
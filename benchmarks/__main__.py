@@ -0,0 +1,9 @@
+"""
+python -m benchmarks 진입점
+"""
+
+import sys
+from .run import main
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,203 @@
+"""
+가짜 Gemini 모델 모듈
+
+google.generativeai.GenerativeModel의 generate_content / generate_content_async를 흉내 내는
+로컬 모델입니다. 네트워크 요청 없이 설정한 분포로 지연 시간과 일시적인 오류를 만들어,
+동시성, 재시도, 캐시 설정이 처리량에 주는 영향을 재현 가능하게 측정할 수 있습니다.
+"""
+
+import math
+import time
+import random
+import asyncio
+import threading
+from typing import Any, Iterator, List, Optional, Tuple
+from pdf_translator.gemini_client import GeminiClient, PAGE_DELIMITER, PAGE_DELIMITER_PATTERN
+from pdf_translator.tokens import estimate_tokens, IMAGE_TOKENS
+
+# 텍스트 번역 프롬프트에서 원본 텍스트가 시작되는 표시
+_SOURCE_MARKER = "원본 텍스트:"
+
+class FakeAPIError(Exception):
+    """
+    가짜 모델이 일으키는 API 오류
+
+    google.api_core 예외처럼 HTTP 상태 코드를 code 속성으로 제공하므로
+    RetryPolicy가 실제 오류와 같은 방식으로 재시도 여부를 판단합니다.
+    """
+
+    def __init__(self, code: int, message: str, retry_after: Optional[float] = None):
+        super().__init__(f"{code} {message}")
+        self.code = code
+        self.retry_after = retry_after
+
+class FakeUsageMetadata:
+    """응답의 토큰 사용량 메타데이터"""
+
+    def __init__(self, prompt_token_count: int, candidates_token_count: int):
+        self.prompt_token_count = prompt_token_count
+        self.candidates_token_count = candidates_token_count
+
+class FakeResponse:
+    """generate_content 응답 (스트리밍 응답 조각으로도 사용)"""
+
+    def __init__(self, text: str, usage_metadata: Optional[FakeUsageMetadata] = None):
+        self.text = text
+        self.usage_metadata = usage_metadata
+
+class FakeStreamResponse:
+    """스트리밍 generate_content 응답. 조각을 차례로 반환합니다."""
+
+    def __init__(self, chunks: List[str], usage_metadata: FakeUsageMetadata, chunk_delay: float = 0.0):
+        self._chunks = chunks
+        self._chunk_delay = chunk_delay
+        self.usage_metadata = usage_metadata
+
+    def __iter__(self) -> Iterator[FakeResponse]:
+        for chunk in self._chunks:
+            if self._chunk_delay:
+                time.sleep(self._chunk_delay)
+            yield FakeResponse(chunk)
+
+    async def __aiter__(self):
+        for chunk in self._chunks:
+            if self._chunk_delay:
+                await asyncio.sleep(self._chunk_delay)
+            yield FakeResponse(chunk)
+
+def fake_translation(contents: Any, target_prefix: str = "[번역]") -> Tuple[str, int, int]:
+    """
+    요청 콘텐츠에 대한 가짜 번역문을 만듭니다.
+
+    묶음 요청은 구분선을 같은 순서로 유지하므로 GeminiClient가 응답을 페이지별로 나눌 수 있습니다.
+
+    Args:
+        contents: generate_content에 전달된 요청 콘텐츠 (문자열 또는 파트 목록)
+        target_prefix: 번역문 앞에 붙일 표시
+
+    Returns:
+        (번역문, 입력 토큰 수, 출력 토큰 수) 튜플
+    """
+    parts = [contents] if isinstance(contents, str) else list(contents)
+    prompt = "".join(part for part in parts if isinstance(part, str))
+    images = sum(1 for part in parts if not isinstance(part, str))
+    input_tokens = estimate_tokens(prompt) + images * IMAGE_TOKENS
+
+    pages = PAGE_DELIMITER_PATTERN.split(prompt)
+    if len(pages) > 1:
+        # [머리말, 번호1, 본문1, 번호2, 본문2, ...]
+        text = "\n\n".join(
+            f"{PAGE_DELIMITER.format(index=index)}\n{target_prefix} {body.strip()}"
+            for index, body in zip(pages[1::2], pages[2::2])
+        )
+    elif images:
+        text = f"{target_prefix} 이미지 {images}개의 텍스트"
+    else:
+        source = prompt.split(_SOURCE_MARKER, 1)[-1].strip()
+        text = f"{target_prefix} {source}"
+    return text, input_tokens, estimate_tokens(text)
+
+class FakeGenerativeModel:
+    """
+    지연 시간과 오류 분포를 설정할 수 있는 가짜 GenerativeModel
+
+    지연 시간은 요청마다 `latency`를 중앙값으로 하는 로그정규분포에서 뽑고, 출력 토큰마다
+    `seconds_per_output_token`을 더합니다. 요청은 `error_rate` 확률로 `error_code` 오류를
+    일으킵니다. 같은 seed로 만들면 같은 순서의 요청에 같은 지연 시간과 오류가 나옵니다.
+    """
+
+    def __init__(self, latency: float = 0.0, latency_sigma: float = 0.0, seconds_per_output_token: float = 0.0,
+                 error_rate: float = 0.0, error_code: int = 429, stream_chunks: int = 4, seed: int = 0):
+        """
+        FakeGenerativeModel 초기화
+
+        Args:
+            latency: 요청 지연 시간의 중앙값 (초)
+            latency_sigma: 로그정규분포의 표준편차. 0이면 항상 latency만큼 기다립니다.
+            seconds_per_output_token: 출력 토큰 하나당 추가 지연 시간 (초)
+            error_rate: 요청이 오류로 실패할 확률 (0~1)
+            error_code: 실패한 요청의 HTTP 상태 코드 (예: 429, 503, 400)
+            stream_chunks: 스트리밍 응답을 나눌 조각 수
+            seed: 난수 시드
+        """
+        self.latency = latency
+        self.latency_sigma = latency_sigma
+        self.seconds_per_output_token = seconds_per_output_token
+        self.error_rate = error_rate
+        self.error_code = error_code
+        self.stream_chunks = max(1, stream_chunks)
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.errors = 0
+
+    def plan(self, contents: Any) -> Tuple[float, Optional[FakeAPIError], str, FakeUsageMetadata]:
+        """
+        요청 하나의 지연 시간, 오류, 응답 텍스트, 사용량을 정합니다.
+
+        Args:
+            contents: 요청 콘텐츠
+
+        Returns:
+            (지연 시간, 오류 또는 None, 응답 텍스트, 사용량) 튜플
+        """
+        text, input_tokens, output_tokens = fake_translation(contents)
+        with self._lock:
+            self.calls += 1
+            delay = self.latency
+            if self.latency > 0 and self.latency_sigma > 0:
+                delay = self._rng.lognormvariate(math.log(self.latency), self.latency_sigma)
+            failed = self._rng.random() < self.error_rate
+            if failed:
+                self.errors += 1
+
+        if failed:
+            # 오류 응답은 모델이 출력을 생성하지 않으므로 기본 지연 시간만 걸림
+            return delay, FakeAPIError(self.error_code, "가짜 모델이 만든 오류입니다."), "", FakeUsageMetadata(0, 0)
+        delay += output_tokens * self.seconds_per_output_token
+        return delay, None, text, FakeUsageMetadata(input_tokens, output_tokens)
+
+    def split_stream(self, text: str) -> List[str]:
+        """응답 텍스트를 스트리밍 조각으로 나눕니다."""
+        size = max(1, math.ceil(len(text) / self.stream_chunks))
+        return [text[start:start + size] for start in range(0, len(text), size)]
+
+    def generate_content(self, contents: Any, stream: bool = False) -> Any:
+        """GenerativeModel.generate_content와 같은 방식으로 가짜 응답을 반환합니다."""
+        delay, error, text, usage = self.plan(contents)
+        if stream and not error:
+            # 스트리밍 응답은 지연 시간이 첫 조각과 나머지 조각에 나뉘어 걸림
+            chunks = self.split_stream(text)
+            time.sleep(delay / 2)
+            return FakeStreamResponse(chunks, usage, delay / 2 / len(chunks))
+        time.sleep(delay)
+        if error:
+            raise error
+        return FakeResponse(text, usage)
+
+    async def generate_content_async(self, contents: Any, stream: bool = False) -> Any:
+        """GenerativeModel.generate_content_async와 같은 방식으로 가짜 응답을 반환합니다."""
+        delay, error, text, usage = self.plan(contents)
+        if stream and not error:
+            chunks = self.split_stream(text)
+            await asyncio.sleep(delay / 2)
+            return FakeStreamResponse(chunks, usage, delay / 2 / len(chunks))
+        await asyncio.sleep(delay)
+        if error:
+            raise error
+        return FakeResponse(text, usage)
+
+def install_fake_model(client: GeminiClient, model: FakeGenerativeModel) -> GeminiClient:
+    """
+    GeminiClient의 텍스트/비전 모델을 가짜 모델로 바꿉니다.
+
+    Args:
+        client: GeminiClient 또는 AsyncGeminiClient
+        model: 사용할 가짜 모델
+
+    Returns:
+        같은 클라이언트
+    """
+    client.text_model = model
+    client.vision_model = model
+    return client
@@ -0,0 +1,306 @@
+"""
+가짜 Gemini HTTP 서버 모듈
+
+Gemini REST API의 generateContent / streamGenerateContent 요청을 처리하는 로컬 서버입니다.
+응답 내용, 지연 시간, 오류는 FakeGenerativeModel로 만들고, 분당 요청 수 할당량을 넘으면
+실제 서비스처럼 429 오류를 반환합니다. GeminiClient의 base_url을 이 서버로 지정하면
+네트워크 없이 속도 제한, 재시도, 동시성을 실제 HTTP 요청으로 부하 테스트할 수 있습니다.
+
+실행 예:
+    python -m benchmarks.mock_server --port 8080 --latency 0.5 --rpm 600
+    GEMINI_BASE_URL=http://127.0.0.1:8080 python main.py doc.pdf --workers 32
+"""
+
+import re
+import sys
+import json
+import time
+import base64
+import argparse
+import threading
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Deque, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+from .fake_gemini import FakeAPIError, FakeGenerativeModel
+
+# /v1beta/models/gemini-1.5-flash:generateContent 형태의 경로
+_PATH_PATTERN = re.compile(r"^/(?P<version>v1\w*)/(?P<model>(?:tuned)?[mM]odels/[^:/]+):(?P<method>\w+)$")
+
+# HTTP 상태 코드별 Google API 오류 상태
+_ERROR_STATUS = {
+    400: "INVALID_ARGUMENT",
+    403: "PERMISSION_DENIED",
+    404: "NOT_FOUND",
+    429: "RESOURCE_EXHAUSTED",
+    500: "INTERNAL",
+    503: "UNAVAILABLE",
+    504: "DEADLINE_EXCEEDED",
+}
+
+def parse_contents(body: Dict[str, Any]) -> List[Any]:
+    """
+    generateContent 요청 본문을 FakeGenerativeModel이 받는 콘텐츠 목록으로 바꿉니다.
+
+    Args:
+        body: 요청 JSON 본문
+
+    Returns:
+        텍스트 파트는 문자열, 이미지 파트는 {"mime_type", "data"} 딕셔너리인 목록
+    """
+    contents = []
+    for content in body.get("contents", []):
+        for part in content.get("parts", []):
+            if "text" in part:
+                contents.append(part["text"])
+            else:
+                inline = part.get("inlineData") or part.get("inline_data") or {}
+                contents.append({
+                    "mime_type": inline.get("mimeType") or inline.get("mime_type"),
+                    "data": base64.b64decode(inline.get("data", "")),
+                })
+    return contents
+
+def make_response(text: str, model: str, prompt_tokens: int = 0, output_tokens: int = 0,
+                  finished: bool = True) -> Dict[str, Any]:
+    """
+    GenerateContentResponse 형식의 JSON 객체를 만듭니다.
+
+    Args:
+        text: 응답 텍스트
+        model: 모델 이름
+        prompt_tokens: 입력 토큰 수
+        output_tokens: 출력 토큰 수
+        finished: 마지막 응답(조각)인지 여부
+
+    Returns:
+        응답 딕셔너리
+    """
+    candidate = {"content": {"parts": [{"text": text}], "role": "model"}, "index": 0}
+    if finished:
+        candidate["finishReason"] = "STOP"
+    return {
+        "candidates": [candidate],
+        "usageMetadata": {
+            "promptTokenCount": prompt_tokens,
+            "candidatesTokenCount": output_tokens,
+            "totalTokenCount": prompt_tokens + output_tokens,
+        },
+        "modelVersion": model,
+    }
+
+class MockGeminiServer:
+    """
+    가짜 Gemini REST API 서버
+
+    요청마다 별도 스레드에서 처리하므로 동시에 들어온 요청의 지연 시간이 서로 겹칩니다.
+    """
+
+    def __init__(self, model: Optional[FakeGenerativeModel] = None, host: str = "127.0.0.1", port: int = 0,
+                 requests_per_minute: Optional[int] = None):
+        """
+        MockGeminiServer 초기화
+
+        Args:
+            model: 응답 내용, 지연 시간, 오류를 만들 가짜 모델. 제공되지 않으면 지연 없는 모델을 사용합니다.
+            host: 바인딩할 주소
+            port: 바인딩할 포트. 0이면 빈 포트를 자동으로 선택합니다.
+            requests_per_minute: 분당 요청 수 할당량. 넘으면 429 오류와 Retry-After 헤더를 반환합니다.
+        """
+        self.model = model or FakeGenerativeModel()
+        self.requests_per_minute = requests_per_minute
+        self._request_times: Deque[float] = deque()
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self.rejected = 0
+
+        server = self
+
+        class Handler(_GeminiRequestHandler):
+            mock = server
+
+        self.httpd = ThreadingHTTPServer((host, port), Handler)
+        self.httpd.daemon_threads = True
+        # 연결을 유지 중인 클라이언트가 있어도 종료할 때 기다리지 않음
+        self.httpd.block_on_close = False
+
+    @property
+    def url(self) -> str:
+        """GeminiClient의 base_url에 지정할 서버 주소"""
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def check_quota(self) -> Optional[FakeAPIError]:
+        """
+        분당 요청 수 할당량을 확인하고 요청을 기록합니다.
+
+        Returns:
+            할당량을 넘었으면 429 오류, 아니면 None
+        """
+        if not self.requests_per_minute:
+            return None
+        now = time.monotonic()
+        with self._lock:
+            while self._request_times and now - self._request_times[0] >= 60:
+                self._request_times.popleft()
+            if len(self._request_times) >= self.requests_per_minute:
+                self.rejected += 1
+                retry_after = 60 - (now - self._request_times[0])
+                return FakeAPIError(429, "Resource has been exhausted (e.g. check quota).", retry_after)
+            self._request_times.append(now)
+        return None
+
+    def start(self) -> "MockGeminiServer":
+        """백그라운드 스레드에서 서버를 시작합니다."""
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """서버를 종료합니다."""
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self) -> "MockGeminiServer":
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+class _GeminiRequestHandler(BaseHTTPRequestHandler):
+    """generateContent / streamGenerateContent 요청 처리기"""
+
+    protocol_version = "HTTP/1.1"
+    mock: MockGeminiServer
+
+    def log_message(self, format: str, *args):
+        """요청마다 로그를 출력하지 않습니다."""
+
+    def _send_json(self, status: int, payload: Any, headers: Optional[Dict[str, str]] = None):
+        """JSON 응답을 보냅니다."""
+        data = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=UTF-8")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _send_error(self, error: FakeAPIError):
+        """Google API 오류 형식으로 오류 응답을 보냅니다."""
+        headers = {}
+        if error.retry_after is not None:
+            headers["Retry-After"] = str(max(1, round(error.retry_after)))
+        message = str(error).split(" ", 1)[-1]
+        self._send_json(error.code, {
+            "error": {"code": error.code, "message": message, "status": _ERROR_STATUS.get(error.code, "UNKNOWN")}
+        }, headers)
+
+    def _write_chunk(self, data: bytes):
+        """chunked 전송 인코딩으로 데이터 조각 하나를 보냅니다."""
+        self.wfile.write(f"{len(data):x}\r\n".encode("ascii") + data + b"\r\n")
+        self.wfile.flush()
+
+    def _stream(self, chunks: List[str], model: str, usage: Tuple[int, int], chunk_delay: float, sse: bool):
+        """
+        응답 조각을 차례로 보냅니다. alt=sse이면 서버 전송 이벤트로, 아니면 JSON 배열로 보냅니다.
+        """
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream" if sse else "application/json; charset=UTF-8")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        if not sse:
+            self._write_chunk(b"[")
+        for index, chunk in enumerate(chunks):
+            last = index == len(chunks) - 1
+            payload = json.dumps(
+                make_response(chunk, model, *(usage if last else (0, 0)), finished=last), ensure_ascii=False
+            )
+            if sse:
+                data = f"data: {payload}\r\n\r\n"
+            else:
+                data = payload + ("]" if last else ",\r\n")
+            if chunk_delay:
+                time.sleep(chunk_delay)
+            self._write_chunk(data.encode("utf-8"))
+        self.wfile.write(b"0\r\n\r\n")
+        self.wfile.flush()
+
+    def do_POST(self):
+        """generateContent / streamGenerateContent 요청을 처리합니다."""
+        url = urlparse(self.path)
+        match = _PATH_PATTERN.match(url.path)
+        length = int(self.headers.get("Content-Length") or 0)
+        raw_body = self.rfile.read(length) if length else b""
+        if not match or match.group("method") not in ("generateContent", "streamGenerateContent"):
+            self._send_error(FakeAPIError(404, f"지원되지 않는 경로입니다: {url.path}"))
+            return
+
+        try:
+            contents = parse_contents(json.loads(raw_body or b"{}"))
+        except (ValueError, TypeError) as e:
+            self._send_error(FakeAPIError(400, f"요청 본문을 해석할 수 없습니다: {e}"))
+            return
+
+        error = self.mock.check_quota()
+        if error:
+            self._send_error(error)
+            return
+
+        model = self.mock.model
+        delay, error, text, usage = model.plan(contents)
+        model_name = match.group("model").split("/", 1)[1]
+        usage_counts = (usage.prompt_token_count, usage.candidates_token_count)
+
+        if match.group("method") == "streamGenerateContent" and not error:
+            # 지연 시간의 절반은 첫 조각 전에, 나머지는 조각 사이에 나누어 걸림
+            chunks = model.split_stream(text)
+            time.sleep(delay / 2)
+            sse = parse_qs(url.query).get("alt") == ["sse"]
+            self._stream(chunks, model_name, usage_counts, delay / 2 / len(chunks), sse)
+            return
+
+        time.sleep(delay)
+        if error:
+            self._send_error(error)
+            return
+        self._send_json(200, make_response(text, model_name, *usage_counts))
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    가짜 Gemini 서버 명령행 진입점
+    """
+    parser = argparse.ArgumentParser(description="부하 테스트용 가짜 Gemini REST API 서버")
+    parser.add_argument("--host", default="127.0.0.1", help="바인딩할 주소 (기본값: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8080, help="바인딩할 포트 (기본값: 8080)")
+    parser.add_argument("--latency", type=float, default=0.2, help="요청 지연 시간 중앙값(초) (기본값: 0.2)")
+    parser.add_argument("--latency-sigma", type=float, default=0.5, help="지연 시간 로그정규분포의 표준편차 (기본값: 0.5)")
+    parser.add_argument("--seconds-per-token", type=float, default=0.0, help="출력 토큰당 추가 지연 시간(초) (기본값: 0)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="요청 실패 확률 0~1 (기본값: 0)")
+    parser.add_argument("--error-code", type=int, default=429, help="실패한 요청의 HTTP 상태 코드 (기본값: 429)")
+    parser.add_argument("--rpm", type=int, help="분당 요청 수 할당량. 넘으면 429 오류를 반환 (기본값: 제한 없음)")
+    parser.add_argument("--seed", type=int, default=0, help="난수 시드 (기본값: 0)")
+    args = parser.parse_args(argv)
+
+    model = FakeGenerativeModel(
+        latency=args.latency, latency_sigma=args.latency_sigma, seconds_per_output_token=args.seconds_per_token,
+        error_rate=args.error_rate, error_code=args.error_code, seed=args.seed
+    )
+    server = MockGeminiServer(model, args.host, args.port, requests_per_minute=args.rpm)
+    print(f"가짜 Gemini 서버 실행 중: {server.url} (종료: Ctrl+C)")
+    print(f"GEMINI_BASE_URL={server.url} 또는 --base-url {server.url} 옵션으로 연결하세요.")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+        print(f"요청 {model.calls}개, 오류 {model.errors}개, 할당량 초과 {server.rejected}개")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
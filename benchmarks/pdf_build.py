@@ -0,0 +1,95 @@
+"""
+PDF 작성 확장성 벤치마크 모듈
+
+합성 번역 결과로 번역 PDF를 작성하는 시간을 페이지 수별로 측정합니다. 페이지당 작성 시간이
+페이지 수와 관계없이 거의 일정하면 작성 시간이 문서 크기에 선형으로 늘어난다는 뜻입니다.
+
+실행 예:
+    python -m benchmarks.pdf_build --pages 10 100 1000 10000
+    python -m benchmarks.pdf_build --pages 2000 --workers 4
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import tempfile
+from typing import Any, Dict, List, Optional, Tuple
+from pdf_translator.pdf_writer import write_translated_pdf
+from .synthetic import make_paragraphs
+
+DEFAULT_PAGE_COUNTS = (10, 100, 1000, 10000)
+
+def make_translated_results(page_count: int, seed: int = 0) -> List[Tuple[int, str]]:
+    """
+    번역 결과와 같은 형식의 합성 페이지 텍스트를 생성합니다.
+
+    Args:
+        page_count: 페이지 수
+        seed: 난수 시드
+
+    Returns:
+        (페이지 번호, 텍스트) 튜플의 리스트
+    """
+    rng = random.Random(seed)
+    return [(page_num, "\n\n".join(make_paragraphs(rng))) for page_num in range(1, page_count + 1)]
+
+def run_pdf_build(page_count: int, seed: int = 0, workers: int = 1) -> Dict[str, Any]:
+    """
+    페이지 수 하나에 대해 번역 PDF 작성 시간을 측정합니다.
+
+    Args:
+        page_count: 번역 결과의 페이지 수
+        seed: 난수 시드
+        workers: PDF 빌드에 사용할 프로세스 수
+
+    Returns:
+        페이지 수, 프로세스 수, 작성 시간, 페이지당 시간, 출력 파일 크기를 담은 딕셔너리
+    """
+    results = make_translated_results(page_count, seed)
+    with tempfile.TemporaryDirectory() as temp_dir:
+        output_path = os.path.join(temp_dir, "translated.pdf")
+        start = time.perf_counter()
+        write_translated_pdf(results, output_path, workers=workers)
+        seconds = time.perf_counter() - start
+        size = os.path.getsize(output_path)
+    return {
+        "pages": page_count,
+        "workers": workers,
+        "seconds": seconds,
+        "ms_per_page": seconds / page_count * 1000,
+        "output_bytes": size,
+    }
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    PDF 작성 벤치마크 명령행 진입점
+    """
+    parser = argparse.ArgumentParser(description="번역 PDF 작성 확장성 벤치마크")
+    parser.add_argument("--pages", type=int, nargs="+", default=list(DEFAULT_PAGE_COUNTS),
+                        help=f"측정할 페이지 수 (기본값: {' '.join(map(str, DEFAULT_PAGE_COUNTS))})")
+    parser.add_argument("--workers", type=int, default=1, help="PDF 빌드에 사용할 프로세스 수 (기본값: 1)")
+    parser.add_argument("--seed", type=int, default=0, help="난수 시드 (기본값: 0)")
+    parser.add_argument("-o", "--output", help="결과를 저장할 JSON 파일 경로")
+    args = parser.parse_args(argv)
+
+    # 폰트 등록 시간이 첫 측정에 섞이지 않도록 미리 한 번 작성
+    run_pdf_build(1, args.seed)
+
+    reports = []
+    for page_count in args.pages:
+        report = run_pdf_build(page_count, args.seed, args.workers)
+        reports.append(report)
+        print(f"{page_count:>6}페이지: {report['seconds']:8.2f}초  "
+              f"페이지당 {report['ms_per_page']:6.2f}ms  {report['output_bytes'] / 1024 / 1024:7.1f}MB")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as file:
+            json.dump(reports, file, ensure_ascii=False, indent=2)
+        print(f"벤치마크 결과가 저장되었습니다: {args.output}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
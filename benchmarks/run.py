@@ -0,0 +1,198 @@
+"""
+벤치마크 실행 모듈
+
+합성 PDF를 만들고 가짜 Gemini 모델을 연결한 PDFProcessor로 전체 번역 과정을 실행한 뒤,
+처리량, 최대 RSS, 단계별 소요 시간을 보고합니다. 시나리오마다 새 프로세스에서 실행하여
+앞선 시나리오의 메모리 사용량이 최대 RSS에 섞이지 않게 합니다.
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import tempfile
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional
+from pdf_translator.gemini_client import GeminiClient
+from pdf_translator.pdf_processor import PDFProcessor
+from pdf_translator.metrics import Metrics
+from pdf_translator.retry import RetryPolicy
+from .synthetic import PDF_KINDS, generate_pdf
+from .fake_gemini import FakeGenerativeModel, install_fake_model
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+# 문서 종류별 번역 모드: 텍스트 문서는 텍스트 전용, 스캔 문서는 멀티모달, 혼합 문서는 하이브리드
+MODES = {"text": "text", "scanned": "multimodal", "mixed": "hybrid"}
+
+def peak_rss_mb() -> Optional[Dict[str, float]]:
+    """
+    현재 프로세스와 종료된 자식 프로세스(렌더링 워커)의 최대 RSS를 반환합니다.
+
+    Returns:
+        {"self": MB, "children": MB}. resource 모듈이 없는 플랫폼에서는 None
+    """
+    if resource is None:
+        return None
+    # Linux는 KB, macOS는 바이트 단위
+    unit = 1 if sys.platform == "darwin" else 1024
+    return {
+        "self": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * unit / 2**20, 1),
+        "children": round(resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss * unit / 2**20, 1),
+    }
+
+def run_scenario(kind: str, pages: int, workers: int = 8, render_workers: int = 1, latency: float = 0.0,
+                 latency_sigma: float = 0.0, seconds_per_output_token: float = 0.0, error_rate: float = 0.0,
+                 error_code: int = 429, pack_tokens: int = 0, stream: bool = False, dpi: Any = 150,
+                 image_format: str = "png", seed: int = 0, work_dir: Optional[str] = None) -> Dict[str, Any]:
+    """
+    시나리오 하나를 실행하고 결과를 반환합니다.
+
+    Args:
+        kind: 합성 문서 종류 ("text", "scanned", "mixed")
+        pages: 페이지 수
+        workers: 동시에 번역할 페이지 수
+        render_workers: 렌더링 프로세스 수
+        latency: 가짜 모델의 요청 지연 시간 중앙값 (초)
+        latency_sigma: 지연 시간 로그정규분포의 표준편차
+        seconds_per_output_token: 출력 토큰 하나당 추가 지연 시간 (초)
+        error_rate: 요청이 실패할 확률
+        error_code: 실패한 요청의 HTTP 상태 코드
+        pack_tokens: 텍스트 전용 모드에서 짧은 페이지를 묶을 토큰 예산
+        stream: 스트리밍 응답 사용 여부
+        dpi: 렌더링 해상도
+        image_format: 페이지 이미지 형식
+        seed: 합성 문서와 가짜 모델의 난수 시드
+        work_dir: 합성 PDF와 출력 파일을 둘 디렉터리. 제공되지 않으면 임시 디렉터리를 사용합니다.
+
+    Returns:
+        시나리오 설정, 실행 지표 보고서, 최대 RSS를 담은 딕셔너리
+    """
+    with tempfile.TemporaryDirectory(dir=work_dir) as temp_dir:
+        pdf_path = generate_pdf(os.path.join(temp_dir, f"{kind}_{pages}.pdf"), pages, kind, seed)
+        mode = MODES[kind]
+        output_path = os.path.join(temp_dir, "output.txt" if mode == "text" else "output.pdf")
+
+        metrics = Metrics()
+        model = FakeGenerativeModel(
+            latency=latency, latency_sigma=latency_sigma, seconds_per_output_token=seconds_per_output_token,
+            error_rate=error_rate, error_code=error_code, seed=seed
+        )
+        # 재시도 대기 시간은 가짜 모델의 지연 시간에 맞춰 짧게 설정
+        client = install_fake_model(GeminiClient(
+            api_key="benchmark", rate_limit=False, stream=stream, metrics=metrics,
+            retry_policy=RetryPolicy(max_attempts=5, base_delay=max(latency, 0.01), max_delay=1.0)
+        ), model)
+        processor = PDFProcessor(
+            gemini_client=client, max_workers=workers, dpi=dpi, image_format=image_format,
+            render_workers=render_workers, pack_tokens=pack_tokens, metrics=metrics
+        )
+
+        start = time.perf_counter()
+        error = None
+        try:
+            processor.translate(
+                pdf_path, output_path, text_only=mode == "text", hybrid=mode == "hybrid"
+            )
+        except Exception as e:
+            error = str(e)
+        seconds = time.perf_counter() - start
+
+        result = {
+            "kind": kind,
+            "mode": mode,
+            "pages": pages,
+            "workers": workers,
+            "render_workers": render_workers,
+            "latency": latency,
+            "error_rate": error_rate,
+            "seconds": round(seconds, 3),
+            "pages_per_second": round(pages / seconds, 2) if seconds > 0 else 0.0,
+            "model_calls": model.calls,
+            "model_errors": model.errors,
+            "peak_rss_mb": peak_rss_mb(),
+            "metrics": metrics.report(),
+        }
+        if error is not None:
+            result["error"] = error
+        return result
+
+def _run_isolated(kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    """새 프로세스에서 시나리오를 실행합니다."""
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+        return executor.submit(run_scenario, **kwargs).result()
+
+def _parse_list(value: str, cast=str) -> List:
+    """쉼표로 구분된 인자를 목록으로 바꿉니다."""
+    return [cast(item.strip()) for item in value.split(",") if item.strip()]
+
+def format_result(result: Dict[str, Any]) -> str:
+    """시나리오 결과를 한 줄 요약으로 만듭니다."""
+    stages = result["metrics"]["stages"]
+    stage_text = ", ".join(
+        f"{stage} p50 {summary['p50_seconds'] * 1000:.1f}ms" for stage, summary in stages.items()
+    )
+    rss = result["peak_rss_mb"]
+    rss_text = f"RSS {rss['self']}MB (자식 {rss['children']}MB)" if rss else "RSS 측정 불가"
+    line = (f"{result['kind']:>7} {result['pages']:>5}페이지: {result['seconds']:.2f}초, "
+            f"초당 {result['pages_per_second']}페이지, 요청 {result['model_calls']}개 "
+            f"(오류 {result['model_errors']}개), {rss_text} | {stage_text}")
+    if "error" in result:
+        line += f" | 실패: {result['error']}"
+    return line
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    벤치마크 명령행 진입점
+    """
+    parser = argparse.ArgumentParser(description="가짜 Gemini 모델로 PDF 번역 과정을 측정하는 오프라인 벤치마크")
+    parser.add_argument("--pages", default="20,200", help="쉼표로 구분한 문서 페이지 수 (기본값: 20,200)")
+    parser.add_argument("--kinds", default=",".join(PDF_KINDS),
+                        help=f"쉼표로 구분한 합성 문서 종류 (기본값: {','.join(PDF_KINDS)})")
+    parser.add_argument("-w", "--workers", default="8", help="쉼표로 구분한 번역 워커 수 (기본값: 8)")
+    parser.add_argument("--render-workers", type=int, default=1, help="렌더링 프로세스 수 (기본값: 1)")
+    parser.add_argument("--latency", type=float, default=0.05, help="가짜 모델 지연 시간 중앙값(초) (기본값: 0.05)")
+    parser.add_argument("--latency-sigma", type=float, default=0.5, help="지연 시간 로그정규분포의 표준편차 (기본값: 0.5)")
+    parser.add_argument("--seconds-per-token", type=float, default=0.0, help="출력 토큰당 추가 지연 시간(초) (기본값: 0)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="요청 실패 확률 0~1 (기본값: 0)")
+    parser.add_argument("--error-code", type=int, default=429, help="실패한 요청의 HTTP 상태 코드 (기본값: 429)")
+    parser.add_argument("--pack-tokens", type=int, default=0, help="텍스트 페이지 묶음 토큰 예산 (기본값: 0)")
+    parser.add_argument("--stream", action="store_true", help="스트리밍 응답 사용")
+    parser.add_argument("--dpi", type=int, default=150, help="렌더링 해상도 (기본값: 150)")
+    parser.add_argument("--image-format", choices=["png", "jpeg", "webp"], default="png", help="페이지 이미지 형식 (기본값: png)")
+    parser.add_argument("--seed", type=int, default=0, help="난수 시드 (기본값: 0)")
+    parser.add_argument("--in-process", action="store_true", help="시나리오를 현재 프로세스에서 실행 (최대 RSS가 누적됨)")
+    parser.add_argument("-o", "--output", help="결과를 저장할 JSON 파일 경로")
+    args = parser.parse_args(argv)
+
+    kinds = _parse_list(args.kinds)
+    for kind in kinds:
+        if kind not in PDF_KINDS:
+            parser.error(f"지원되지 않는 문서 종류입니다: {kind}")
+
+    results = []
+    for kind in kinds:
+        for pages in _parse_list(args.pages, int):
+            for workers in _parse_list(args.workers, int):
+                kwargs = dict(
+                    kind=kind, pages=pages, workers=workers, render_workers=args.render_workers,
+                    latency=args.latency, latency_sigma=args.latency_sigma,
+                    seconds_per_output_token=args.seconds_per_token, error_rate=args.error_rate,
+                    error_code=args.error_code, pack_tokens=args.pack_tokens, stream=args.stream,
+                    dpi=args.dpi, image_format=args.image_format, seed=args.seed
+                )
+                result = run_scenario(**kwargs) if args.in_process else _run_isolated(kwargs)
+                results.append(result)
+                print(format_result(result))
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as file:
+            json.dump(results, file, ensure_ascii=False, indent=2)
+        print(f"벤치마크 결과가 저장되었습니다: {args.output}")
+    return 1 if any("error" in result for result in results) else 0
@@ -0,0 +1,112 @@
+"""
+CLI 시작 시간 벤치마크 모듈
+
+`main.py --list-models`처럼 번역하지 않는 명령의 실행 시간과, 각 명령이 불러온 무거운 모듈을
+측정합니다. 빈 인터프리터(`python -c pass`)의 실행 시간을 함께 보고하므로 인터프리터 자체의
+시작 시간과 이 프로젝트가 더한 시간을 구분할 수 있습니다.
+
+실행 예:
+    python -m benchmarks.startup --runs 20
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import subprocess
+from typing import Dict, List, Optional
+from pdf_translator.metrics import summarize
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 시작 시간에 큰 영향을 주는 모듈. 번역하지 않는 명령에서는 불러오지 않아야 합니다.
+HEAVY_MODULES = ("google.generativeai", "fitz", "PyPDF2", "reportlab", "tqdm")
+
+# 측정할 명령 (이름, 인터프리터 인자)
+COMMANDS = (
+    ("python -c pass", ["-c", "pass"]),
+    ("main.py --list-models", ["main.py", "--list-models"]),
+    ("main.py --help", ["main.py", "--help"]),
+    ("import pdf_translator.pdf_processor", ["-c", "import pdf_translator.pdf_processor"]),
+)
+
+def time_command(args: List[str], runs: int = 10) -> List[float]:
+    """
+    인터프리터 명령을 여러 번 실행하여 실행 시간을 잽니다.
+
+    Args:
+        args: 인터프리터에 전달할 인자
+        runs: 실행 횟수
+
+    Returns:
+        실행마다 걸린 시간 (초) 목록
+    """
+    # 환경 변수의 API 키 유무와 관계없이 같은 경로를 측정
+    env = dict(os.environ, GEMINI_API_KEY=os.getenv("GEMINI_API_KEY") or "benchmark")
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, *args], cwd=PROJECT_ROOT, env=env,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False)
+        timings.append(time.perf_counter() - start)
+    return timings
+
+def loaded_heavy_modules(code: str) -> List[str]:
+    """
+    새 인터프리터에서 코드를 실행한 뒤 불러온 무거운 모듈 목록을 반환합니다.
+
+    Args:
+        code: 실행할 파이썬 코드
+
+    Returns:
+        HEAVY_MODULES 중 불러온 모듈 이름 목록
+    """
+    probe = (
+        "import sys, json\n"
+        f"{code}\n"
+        f"print(json.dumps([m for m in {HEAVY_MODULES!r} if m in sys.modules]))\n"
+    )
+    result = subprocess.run([sys.executable, "-c", probe], cwd=PROJECT_ROOT,
+                            capture_output=True, text=True, check=True)
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+def run_startup_benchmark(runs: int = 10) -> Dict[str, Dict[str, float]]:
+    """
+    모든 명령의 실행 시간을 측정합니다.
+
+    Args:
+        runs: 명령마다 실행할 횟수
+
+    Returns:
+        명령 이름별 실행 시간 요약 (summarize 형식)
+    """
+    return {name: summarize(time_command(args, runs)) for name, args in COMMANDS}
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    시작 시간 벤치마크 명령행 진입점
+    """
+    parser = argparse.ArgumentParser(description="CLI 시작 시간 벤치마크")
+    parser.add_argument("--runs", type=int, default=10, help="명령마다 실행할 횟수 (기본값: 10)")
+    parser.add_argument("-o", "--output", help="결과를 저장할 JSON 파일 경로")
+    args = parser.parse_args(argv)
+
+    results = run_startup_benchmark(args.runs)
+    baseline = results["python -c pass"]["p50_seconds"]
+    for name, summary in results.items():
+        overhead = summary["p50_seconds"] - baseline
+        print(f"{name:<40} p50 {summary['p50_seconds'] * 1000:7.1f}ms  p95 {summary['p95_seconds'] * 1000:7.1f}ms  "
+              f"(인터프리터 대비 +{overhead * 1000:.1f}ms)")
+
+    heavy = loaded_heavy_modules("import sys; sys.argv = ['main.py', '--list-models']; import main; main.main()")
+    print(f"--list-models가 불러온 무거운 모듈: {', '.join(heavy) or '없음'}")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as file:
+            json.dump({"commands": results, "list_models_heavy_modules": heavy}, file, ensure_ascii=False, indent=2)
+        print(f"벤치마크 결과가 저장되었습니다: {args.output}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
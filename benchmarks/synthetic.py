@@ -0,0 +1,86 @@
+"""
+합성 PDF 생성 모듈
+
+벤치마크에 사용할 PDF를 재현 가능하게 생성합니다. 같은 인자로 만들면 항상 같은 내용이 됩니다.
+
+- text: 텍스트 레이어만 있는 페이지
+- scanned: 텍스트 레이어 없이 페이지 전체가 이미지인 스캔 페이지
+- mixed: 텍스트 페이지 사이에 세 페이지마다 스캔 페이지가 섞인 문서
+"""
+
+import random
+from typing import List
+import fitz  # PyMuPDF
+
+PDF_KINDS = ("text", "scanned", "mixed")
+
+# 스캔 페이지 이미지의 해상도
+SCAN_DPI = 100
+
+_WORDS = (
+    "translation model document page layout context quality latency request response "
+    "throughput concurrency cache budget token section figure table paragraph summary "
+    "result method analysis system network memory process render encode schedule"
+).split()
+
+def make_paragraphs(rng: random.Random, count: int = 4, sentences: int = 5) -> List[str]:
+    """
+    무작위 단어로 이루어진 문단 목록을 생성합니다.
+
+    Args:
+        rng: 난수 생성기
+        count: 문단 수
+        sentences: 문단 하나의 문장 수
+
+    Returns:
+        문단 문자열 목록
+    """
+    paragraphs = []
+    for _ in range(count):
+        sentence_list = []
+        for _ in range(sentences):
+            words = rng.choices(_WORDS, k=rng.randint(8, 16))
+            sentence_list.append(" ".join(words).capitalize() + ".")
+        paragraphs.append(" ".join(sentence_list))
+    return paragraphs
+
+def _add_text_page(document: fitz.Document, rng: random.Random, page_num: int):
+    """텍스트 레이어가 있는 페이지를 추가합니다."""
+    page = document.new_page()
+    text = f"Page {page_num}\n\n" + "\n\n".join(make_paragraphs(rng))
+    page.insert_textbox(page.rect + (54, 54, -54, -54), text, fontsize=10)
+
+def _add_scanned_page(document: fitz.Document, rng: random.Random, page_num: int):
+    """텍스트 페이지를 이미지로 렌더링하여 텍스트 레이어가 없는 스캔 페이지를 추가합니다."""
+    with fitz.open() as source:
+        _add_text_page(source, rng, page_num)
+        pix = source[0].get_pixmap(matrix=fitz.Matrix(SCAN_DPI / 72, SCAN_DPI / 72), colorspace=fitz.csGRAY)
+    page = document.new_page()
+    page.insert_image(page.rect, stream=pix.tobytes("png"))
+
+def generate_pdf(path: str, page_count: int, kind: str = "text", seed: int = 0) -> str:
+    """
+    합성 PDF 파일을 생성합니다.
+
+    Args:
+        path: 저장할 PDF 파일 경로
+        page_count: 페이지 수
+        kind: 문서 종류 ("text", "scanned", "mixed")
+        seed: 난수 시드
+
+    Returns:
+        저장한 PDF 파일 경로
+    """
+    if kind not in PDF_KINDS:
+        raise ValueError(f"지원되지 않는 문서 종류입니다: {kind} (사용 가능: {', '.join(PDF_KINDS)})")
+
+    rng = random.Random(seed)
+    with fitz.open() as document:
+        for page_num in range(1, page_count + 1):
+            scanned = kind == "scanned" or (kind == "mixed" and page_num % 3 == 0)
+            if scanned:
+                _add_scanned_page(document, rng, page_num)
+            else:
+                _add_text_page(document, rng, page_num)
+        document.save(path, deflate=True)
+    return path
@@ -9,9 +9,8 @@ import os
 import argparse
 import sys
 from dotenv import load_dotenv
-from pdf_translator.gemini_client import GeminiClient
-from pdf_translator.pdf_processor import PDFProcessor
 from pdf_translator.gemini_models import GeminiModel
+from pdf_translator.translation_cache import DEFAULT_CACHE_DIR
 
 def main():
     """
@@ -20,19 +19,10 @@ def main():
     # 환경 변수 로드
     load_dotenv()
     
-    # API 키 확인
-    api_key = os.getenv("GEMINI_API_KEY")
-    if not api_key or api_key == "your_gemini_api_key_here":
-        print("오류: Gemini API 키가 설정되지 않았습니다.")
-        print("다음 방법 중 하나로 API 키를 설정하세요:")
-        print("1. .env 파일에 GEMINI_API_KEY=your_key 추가")
-        print("2. 환경 변수 GEMINI_API_KEY 설정")
-        print("3. --api-key 인자 사용")
-        return 1
-    
     # 명령행 인자 파싱
     parser = argparse.ArgumentParser(description="PDF 파일을 한국어로 번역하는 도구")
-    parser.add_argument("pdf_file", nargs="?", help="번역할 PDF 파일 경로")
+    parser.add_argument("pdf_files", nargs="*", metavar="pdf_file",
+                      help="번역할 PDF 파일 경로. 여러 파일, 디렉터리, glob 패턴을 지정하면 일괄 번역합니다.")
     parser.add_argument("-o", "--output", help="번역 결과를 저장할 파일 경로")
     parser.add_argument("-l", "--language", default="한국어", help="번역할 대상 언어 (기본값: 한국어)")
     parser.add_argument("-k", "--api-key", help="Gemini API 키 (환경 변수나 .env 파일 대신 사용)")
@@ -40,9 +30,44 @@ def main():
                       choices=[m.name for m in GeminiModel if not m.name.startswith("_")], 
                       default="GEMINI_1_5_FLASH", 
                       help="사용할 Gemini 모델 (기본값: GEMINI_1_5_FLASH)")
+    parser.add_argument("--base-url", help="Gemini API 대신 연결할 서버 주소 (예: 로컬 가짜 서버 http://127.0.0.1:8080, 기본값: 환경 변수 GEMINI_BASE_URL)")
     parser.add_argument("--list-models", action="store_true", help="사용 가능한 모델 목록 표시")
     parser.add_argument("--text-only", action="store_true", help="텍스트만 추출하여 번역 (멀티모달 번역 비활성화)")
-    parser.add_argument("--pdf-output", action="store_true", help="번역 결과를 PDF 파일로 저장 (멀티모달 모드에서만 사용 가능)")
+    parser.add_argument("--hybrid", action="store_true",
+                      help="텍스트 레이어가 있는 페이지는 텍스트로, 스캔/그림 위주 페이지는 이미지로 번역")
+    parser.add_argument("--pdf-output", action="store_true", help="번역 결과를 PDF 파일로 저장 (멀티모달/하이브리드 모드는 항상 PDF로 저장하므로 생략 가능)")
+    parser.add_argument("-w", "--workers", type=int, default=1, help="동시에 번역할 페이지 수 (기본값: 1)")
+    parser.add_argument("--pack-tokens", type=int, default=0,
+                      help="텍스트 전용 모드에서 연속한 짧은 페이지를 이 토큰 수까지 한 요청으로 묶음 (기본값: 0, 묶지 않음)")
+    parser.add_argument("--chunk-tokens", type=int,
+                      help="긴 페이지 텍스트를 나눌 때 조각 하나의 최대 토큰 수 (기본값: 모델의 최대 출력 토큰 수에 맞춰 자동 설정)")
+    parser.add_argument("--render-workers", type=int, default=1,
+                      help="멀티모달 모드에서 페이지 렌더링에 사용할 프로세스 수 (기본값: 1)")
+    parser.add_argument("--pdf-workers", type=int, default=1,
+                      help="번역 PDF 빌드에 사용할 프로세스 수. 큰 문서를 페이지 범위로 나누어 빌드한 뒤 합침 (기본값: 1)")
+    parser.add_argument("--text-backend", choices=["pymupdf", "pypdf2"], default="pymupdf",
+                      help="텍스트 추출 백엔드 (기본값: pymupdf)")
+    parser.add_argument("--dpi", default="300",
+                      help="멀티모달 모드의 페이지 렌더링 해상도. 'auto'이면 페이지마다 글자 크기에 맞춰 선택 (기본값: 300)")
+    parser.add_argument("--image-format", choices=["png", "jpeg", "webp"], default="png",
+                      help="멀티모달 모드에서 모델에 보낼 페이지 이미지 형식 (기본값: png, webp는 Pillow 필요)")
+    parser.add_argument("--image-quality", type=int, default=85, help="JPEG/WebP 인코딩 품질 1~100 (기본값: 85)")
+    parser.add_argument("--cache-dir", default=os.getenv("PDF_TRANSLATOR_CACHE_DIR", DEFAULT_CACHE_DIR),
+                      help=f"번역 캐시 디렉터리 (기본값: {DEFAULT_CACHE_DIR})")
+    parser.add_argument("--cache-size-mb", type=int, default=1024, help="번역 캐시 최대 크기(MB) (기본값: 1024)")
+    parser.add_argument("--no-cache", action="store_true", help="번역 캐시를 사용하지 않음")
+    parser.add_argument("--max-retries", type=int, default=5, help="일시적인 API 오류 발생 시 최대 시도 횟수 (기본값: 5)")
+    parser.add_argument("--rpm", type=int, help="분당 최대 요청 수 (기본값: 모델별 할당량)")
+    parser.add_argument("--tpm", type=int, help="분당 최대 입력 토큰 수 (기본값: 모델별 할당량)")
+    parser.add_argument("--stream", action="store_true", help="모델 응답을 스트리밍으로 받음 (텍스트 모드에서는 번역문을 받는 대로 출력 파일에 기록)")
+    parser.add_argument("--no-rate-limit", action="store_true", help="클라이언트 측 요청 속도 제한을 사용하지 않음")
+    parser.add_argument("--manifest", help="일괄 번역할 입력을 한 줄에 하나씩 적은 매니페스트 파일")
+    parser.add_argument("--output-dir", default=".", help="일괄 번역 결과를 저장할 디렉터리 (기본값: 현재 디렉터리)")
+    parser.add_argument("--schedule", choices=["shortest", "deadline", "fifo"], default="shortest",
+                      help="일괄 번역에서 문서 간 페이지 처리 순서. shortest: 짧은 문서 우선, deadline: 매니페스트의 마감 시각 우선, fifo: 입력 순서 (기본값: shortest)")
+    parser.add_argument("--summary", help="일괄 번역 요약 JSON 파일 경로 (기본값: <output-dir>/batch_summary.json)")
+    parser.add_argument("--resume", action="store_true", help="체크포인트에 기록된 페이지는 건너뛰고 중단된 번역을 이어서 진행")
+    parser.add_argument("--metrics-out", help="단계별 소요 시간, 요청 지연 시간, 토큰 사용량, 예상 비용을 기록할 JSON 파일 경로")
     
     args = parser.parse_args()
     
@@ -55,25 +80,109 @@ def main():
         return 0
     
     # PDF 파일이 제공되지 않은 경우 도움말 출력
-    if not args.pdf_file:
+    if not args.pdf_files and not args.manifest:
         parser.print_help()
         return 1
     
-    # 입력 파일 확인
-    if not os.path.exists(args.pdf_file):
-        print(f"오류: PDF 파일을 찾을 수 없습니다: {args.pdf_file}")
+    # API 키 확인 (모델 목록 표시처럼 API를 호출하지 않는 명령에는 필요 없음)
+    api_key = args.api_key or os.getenv("GEMINI_API_KEY")
+    if not api_key or api_key == "your_gemini_api_key_here":
+        print("오류: Gemini API 키가 설정되지 않았습니다.")
+        print("다음 방법 중 하나로 API 키를 설정하세요:")
+        print("1. .env 파일에 GEMINI_API_KEY=your_key 추가")
+        print("2. 환경 변수 GEMINI_API_KEY 설정")
+        print("3. --api-key 인자 사용")
+        return 1
+    
+    # google.generativeai, PyMuPDF, reportlab 등 무거운 모듈은 실제로 번역할 때만 불러옴
+    from pdf_translator.batch import BatchTranslator, collect_pdf_files, is_batch_input
+    from pdf_translator.checkpoint import TranslationCheckpoint
+    from pdf_translator.gemini_client import GeminiClient
+    from pdf_translator.metrics import Metrics
+    from pdf_translator.pdf_processor import PDFProcessor
+    from pdf_translator.retry import RetryPolicy
+    from pdf_translator.translation_cache import TranslationCache
+    
+    batch = is_batch_input(args.pdf_files, args.manifest)
+    if batch:
+        deadlines = {}
+        try:
+            pdf_files = collect_pdf_files(args.pdf_files, args.manifest, deadlines)
+        except OSError as e:
+            print(f"오류: 매니페스트 파일을 읽을 수 없습니다: {args.manifest} ({e.strerror or e})")
+            return 1
+        except ValueError as e:
+            print(f"오류: {e}")
+            return 1
+        if not pdf_files:
+            print("오류: 번역할 PDF 파일이 없습니다.")
+            return 1
+        if args.output:
+            print("오류: 일괄 번역에서는 -o 대신 --output-dir을 사용하세요.")
+            return 1
+    else:
+        args.pdf_file = args.pdf_files[0]
+        # 입력 파일 확인
+        if not os.path.exists(args.pdf_file):
+            print(f"오류: PDF 파일을 찾을 수 없습니다: {args.pdf_file}")
+            return 1
+    
+    if args.text_only and args.hybrid:
+        print("오류: --text-only와 --hybrid는 함께 사용할 수 없습니다.")
+        return 1
+    
+    if args.workers < 1:
+        print("오류: --workers 값은 1 이상이어야 합니다.")
+        return 1
+    
+    if args.pack_tokens < 0:
+        print("오류: --pack-tokens 값은 0 이상이어야 합니다.")
+        return 1
+    
+    if args.chunk_tokens is not None and args.chunk_tokens < 1:
+        print("오류: --chunk-tokens 값은 1 이상이어야 합니다.")
+        return 1
+    
+    if args.render_workers < 1:
+        print("오류: --render-workers 값은 1 이상이어야 합니다.")
+        return 1
+    
+    if args.pdf_workers < 1:
+        print("오류: --pdf-workers 값은 1 이상이어야 합니다.")
+        return 1
+    
+    # 렌더링 해상도 확인
+    dpi = args.dpi
+    if dpi != "auto":
+        if not dpi.isdigit() or int(dpi) <= 0:
+            print(f"오류: --dpi 값은 양의 정수 또는 'auto'여야 합니다: {dpi}")
+            return 1
+        dpi = int(dpi)
+    
+    if not 1 <= args.image_quality <= 100:
+        print("오류: --image-quality 값은 1에서 100 사이여야 합니다.")
         return 1
     
     # 출력 파일 설정
     output_path = args.output
-    if not output_path:
+    if not output_path and not batch:
         base_name = os.path.basename(args.pdf_file)
         file_name = os.path.splitext(base_name)[0]
-        # 멀티모달 모드와 PDF 출력 옵션이 사용된 경우 PDF 출력 확장자 사용
-        if not args.text_only and args.pdf_output:
-            output_path = f"{file_name}_translated.pdf"
-        else:
-            output_path = f"{file_name}_translated.txt"
+        # 텍스트 전용 모드만 텍스트 파일로 쓰고 멀티모달/하이브리드 모드는 PDF로 저장
+        extension = ".txt" if args.text_only else ".pdf"
+        output_path = f"{file_name}_translated{extension}"
+    
+    # 실행 지표 보고서 경로 확인. 번역이 끝난 뒤에야 실패하지 않도록 디렉터리를 미리 만듦
+    if args.metrics_out:
+        metrics_dir = os.path.dirname(os.path.abspath(args.metrics_out))
+        try:
+            os.makedirs(metrics_dir, exist_ok=True)
+        except OSError as e:
+            print(f"오류: 실행 지표 보고서 디렉터리를 만들 수 없습니다: {metrics_dir} ({e.strerror or e})")
+            return 1
+    
+    # 실행 지표 수집
+    metrics = Metrics() if args.metrics_out else None
     
     try:
         # 선택한 모델 확인
@@ -87,9 +196,53 @@ def main():
         model_id = GeminiModel[model_name].value
         print(f"선택한 모델: {model_name} ({model_id})")
         
+        # 번역 캐시 설정
+        cache = None
+        if not args.no_cache:
+            cache = TranslationCache(args.cache_dir, max_size_bytes=args.cache_size_mb * 1024 * 1024)
+            print(f"번역 캐시 사용: {args.cache_dir}")
+        
         # Gemini 클라이언트 및 PDF 프로세서 초기화
-        gemini_client = GeminiClient(api_key=args.api_key or api_key, model_name=model_id)
-        pdf_processor = PDFProcessor(gemini_client=gemini_client)
+        gemini_client = GeminiClient(
+            api_key=api_key,
+            model_name=model_id,
+            cache=cache,
+            retry_policy=RetryPolicy(max_attempts=args.max_retries),
+            rate_limit=not args.no_rate_limit,
+            requests_per_minute=args.rpm,
+            tokens_per_minute=args.tpm,
+            stream=args.stream,
+            metrics=metrics,
+            base_url=args.base_url
+        )
+        pdf_processor = PDFProcessor(
+            gemini_client=gemini_client,
+            max_workers=args.workers,
+            checkpoint=True,
+            dpi=dpi,
+            image_format=args.image_format,
+            image_quality=args.image_quality,
+            text_backend=args.text_backend,
+            render_workers=args.render_workers,
+            pdf_workers=args.pdf_workers,
+            pack_tokens=args.pack_tokens,
+            chunk_tokens=args.chunk_tokens,
+            metrics=metrics
+        )
+        
+        # 일괄 번역
+        if batch:
+            print(f"{len(pdf_files)}개 파일의 일괄 번역을 시작합니다...")
+            summary = BatchTranslator(
+                pdf_processor,
+                output_dir=args.output_dir,
+                target_language=args.language,
+                text_only=args.text_only,
+                hybrid=args.hybrid,
+                resume=args.resume,
+                policy=args.schedule
+            ).run(pdf_files, summary_path=args.summary, deadlines=deadlines)
+            return 1 if summary["failed"] else 0
         
         # PDF 번역
         if args.text_only:
@@ -97,22 +250,26 @@ def main():
             pdf_processor.translate_text_only(
                 pdf_path=args.pdf_file,
                 output_path=output_path,
-                target_language=args.language
+                target_language=args.language,
+                resume=args.resume,
+                collect=False
             )
             print(f"번역이 완료되었습니다. 결과는 {output_path}에 저장되었습니다.")
         else:
-            print("멀티모달 모드로 번역을 시작합니다...")
+            print("하이브리드 모드로 번역을 시작합니다..." if args.hybrid else "멀티모달 모드로 번역을 시작합니다...")
             
-            # PDF 출력 옵션이 사용되지 않았고 출력 확장자가 .pdf가 아닌 경우, 확장자 변경
-            if args.pdf_output and not output_path.lower().endswith('.pdf'):
+            # 멀티모달/하이브리드 모드는 PDF로 저장하므로 출력 확장자가 .pdf가 아니면 변경
+            if not output_path.lower().endswith('.pdf'):
                 output_path = os.path.splitext(output_path)[0] + '.pdf'
-                print(f"PDF 출력 옵션이 지정되어 출력 파일을 {output_path}로 변경합니다.")
+                print(f"멀티모달/하이브리드 모드는 PDF로 저장하므로 출력 파일을 {output_path}로 변경합니다.")
             
             pdf_processor.translate(
                 pdf_path=args.pdf_file,
                 output_path=output_path,
                 target_language=args.language,
-                text_only=False
+                text_only=False,
+                resume=args.resume,
+                hybrid=args.hybrid
             )
             print(f"번역이 완료되었습니다. 결과는 {output_path}에 저장되었습니다.")
         
@@ -124,8 +281,20 @@ def main():
         return 1
     except Exception as e:
         print(f"오류가 발생했습니다: {e}")
+        if output_path and os.path.exists(TranslationCheckpoint.path_for(output_path)):
+            print("완료된 페이지는 체크포인트에 저장되었습니다. '--resume' 옵션으로 이어서 번역할 수 있습니다.")
         print("다른 모델을 시도해보세요. '--list-models' 옵션으로 사용 가능한 모델 목록을 확인할 수 있습니다.")
         return 1
+    finally:
+        # 실패한 실행도 어디에서 시간이 걸렸는지 확인할 수 있도록 항상 보고서를 기록
+        if metrics:
+            try:
+                report = metrics.write_report(args.metrics_out)
+            except OSError as e:
+                print(f"오류: 실행 지표 보고서를 저장할 수 없습니다: {args.metrics_out} ({e.strerror or e})")
+            else:
+                print(f"실행 지표가 저장되었습니다: {args.metrics_out} "
+                      f"({report['pages']}페이지, 분당 {report['pages_per_minute']}페이지, 예상 비용 ${report['cost_estimate_usd']})")
 
 if __name__ == "__main__":
     sys.exit(main())
@@ -0,0 +1,207 @@
+"""
+일괄 번역 모듈
+
+디렉터리, glob 패턴, 매니페스트 파일로 지정한 여러 PDF를 하나의 GeminiClient와
+PDFProcessor로 번역합니다. 모든 문서의 페이지 번역 요청은 PageScheduler를 통해
+같은 스레드 풀을 공유하며, 파일별 결과와 소요 시간은 요약 JSON 파일에 기록됩니다.
+"""
+
+import os
+import glob
+import json
+import time
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Set
+from .scheduler import PageScheduler
+
+SUMMARY_FILE_NAME = "batch_summary.json"
+
+def collect_pdf_files(inputs: Iterable[str], manifest_path: Optional[str] = None,
+                      deadlines: Optional[Dict[str, float]] = None) -> List[str]:
+    """
+    입력 인자와 매니페스트 파일에서 번역할 PDF 파일 목록을 만듭니다.
+
+    디렉터리는 하위 디렉터리까지 .pdf 파일을 찾고, glob 패턴은 펼치며, 그 외의 인자는
+    파일 경로로 그대로 사용합니다. 매니페스트 파일은 한 줄에 하나의 입력을 적으며
+    빈 줄과 '#'으로 시작하는 줄은 무시합니다. 입력 뒤에 탭으로 구분하여 ISO 8601 형식의
+    마감 시각을 적을 수 있으며, 형식이 잘못되면 줄 번호를 담은 ValueError가 발생합니다.
+    같은 파일은 한 번만 포함됩니다.
+
+    Args:
+        inputs: 파일 경로, 디렉터리, glob 패턴 목록
+        manifest_path: 매니페스트 파일 경로
+        deadlines: 제공되면 매니페스트에 적힌 마감 시각을 파일의 절대 경로를 키로 기록합니다.
+
+    Returns:
+        PDF 파일 경로 목록 (입력 순서 유지)
+    """
+    entries = [(entry, None) for entry in inputs]
+    if manifest_path:
+        with open(manifest_path, 'r', encoding='utf-8') as file:
+            for line_number, line in enumerate(file, 1):
+                line = line.strip()
+                if not line or line.startswith("#"):
+                    continue
+                entry, _, deadline = (part.strip() for part in line.partition("\t"))
+                try:
+                    timestamp = datetime.fromisoformat(deadline).timestamp() if deadline else None
+                except ValueError:
+                    raise ValueError(f"매니페스트 {manifest_path}의 {line_number}번째 줄의 마감 시각이 "
+                                     f"ISO 8601 형식이 아닙니다: {deadline}") from None
+                entries.append((entry, timestamp))
+
+    pdf_files = []
+    seen: Set[str] = set()
+
+    def add(path: str, deadline: Optional[float]):
+        key = os.path.abspath(path)
+        if key not in seen:
+            seen.add(key)
+            pdf_files.append(path)
+            if deadlines is not None and deadline is not None:
+                deadlines[key] = deadline
+
+    for entry, deadline in entries:
+        if os.path.isdir(entry):
+            for root, dirs, files in os.walk(entry):
+                dirs.sort()
+                for name in sorted(files):
+                    if name.lower().endswith(".pdf"):
+                        add(os.path.join(root, name), deadline)
+        elif glob.has_magic(entry):
+            matches = sorted(glob.glob(entry, recursive=True))
+            if not matches:
+                print(f"경고: 패턴과 일치하는 파일이 없습니다: {entry}")
+            for path in matches:
+                if os.path.isfile(path):
+                    add(path, deadline)
+        else:
+            # 존재하지 않는 파일도 포함하여 요약에 실패로 기록되게 함
+            add(entry, deadline)
+
+    return pdf_files
+
+def is_batch_input(inputs: List[str], manifest_path: Optional[str] = None) -> bool:
+    """
+    입력이 일괄 번역 대상인지 판단합니다.
+
+    Args:
+        inputs: 명령행에서 받은 입력 목록
+        manifest_path: 매니페스트 파일 경로
+
+    Returns:
+        입력이 여러 개이거나 디렉터리, glob 패턴, 매니페스트가 사용되었으면 True
+    """
+    return bool(manifest_path) or len(inputs) > 1 or any(
+        os.path.isdir(entry) or glob.has_magic(entry) for entry in inputs
+    )
+
+class BatchTranslator:
+    """
+    여러 PDF 파일을 일괄 번역하는 클래스
+    """
+
+    def __init__(self, pdf_processor: Any, output_dir: str = ".", target_language: str = "한국어",
+                 text_only: bool = False, hybrid: bool = False, resume: bool = False,
+                 policy: str = "shortest"):
+        """
+        BatchTranslator 초기화
+
+        Args:
+            pdf_processor: 모든 문서에 공유할 PDFProcessor
+            output_dir: 번역 결과를 저장할 디렉터리
+            target_language: 번역할 대상 언어
+            text_only: 텍스트 전용 모드 사용 여부
+            hybrid: 하이브리드 모드 사용 여부
+            resume: 체크포인트에 기록된 페이지를 건너뛰고 이어서 번역할지 여부
+            policy: 문서 간 페이지 스케줄링 정책 ("shortest", "deadline", "fifo")
+        """
+        self.pdf_processor = pdf_processor
+        self.output_dir = output_dir
+        self.target_language = target_language
+        self.text_only = text_only
+        self.hybrid = hybrid
+        self.resume = resume
+        self.policy = policy
+
+    def output_path_for(self, pdf_path: str, used: Set[str]) -> str:
+        """
+        입력 파일에 대응하는 출력 파일 경로를 만듭니다.
+
+        서로 다른 디렉터리에 같은 이름의 파일이 있으면 번호를 붙여 겹치지 않게 합니다.
+
+        Args:
+            pdf_path: 입력 PDF 파일 경로
+            used: 이미 사용한 출력 경로 집합 (이 함수가 갱신합니다)
+
+        Returns:
+            출력 파일 경로
+        """
+        file_name = os.path.splitext(os.path.basename(pdf_path))[0]
+        # 텍스트 전용 모드만 텍스트 파일로 쓰고 나머지는 PDF로 저장 (DocumentJob._write_output)
+        extension = ".txt" if self.text_only else ".pdf"
+        output_path = os.path.join(self.output_dir, f"{file_name}_translated{extension}")
+        index = 2
+        while output_path in used:
+            output_path = os.path.join(self.output_dir, f"{file_name}_translated_{index}{extension}")
+            index += 1
+        used.add(output_path)
+        return output_path
+
+    def run(self, pdf_files: List[str], summary_path: Optional[str] = None,
+            deadlines: Optional[Dict[str, float]] = None) -> Dict[str, Any]:
+        """
+        파일 목록을 번역하고 요약을 기록합니다.
+
+        모든 문서의 페이지는 PageScheduler가 하나의 우선순위 큐로 모아 공유 스레드 풀에서
+        번역합니다. 한 파일이 실패해도 나머지 파일은 계속 번역합니다.
+
+        Args:
+            pdf_files: 번역할 PDF 파일 경로 목록
+            summary_path: 요약 JSON 파일 경로. 제공되지 않으면 output_dir/batch_summary.json
+            deadlines: 파일의 절대 경로를 키로 하는 마감 시각 (time.time() 기준 초)
+
+        Returns:
+            요약 딕셔너리
+        """
+        os.makedirs(self.output_dir, exist_ok=True)
+        summary_path = summary_path or os.path.join(self.output_dir, SUMMARY_FILE_NAME)
+        deadlines = deadlines or {}
+
+        scheduler = PageScheduler(
+            self.pdf_processor, self.target_language, text_only=self.text_only,
+            hybrid=self.hybrid, resume=self.resume, policy=self.policy
+        )
+        used: Set[str] = set()
+        for pdf_path in pdf_files:
+            scheduler.add(pdf_path, self.output_path_for(pdf_path, used), deadline=deadlines.get(os.path.abspath(pdf_path)))
+
+        print(f"{len(pdf_files)}개 파일, 워커 {self.pdf_processor.max_workers}개, 스케줄링 정책: {self.policy}")
+        batch_start = time.monotonic()
+        jobs = scheduler.run()
+
+        results = []
+        for job in jobs:
+            result = {
+                "pdf": job.pdf_path,
+                "output": job.output_path,
+                "pages": job.page_count,
+                "status": job.status,
+                "seconds": round(job.seconds, 3),
+            }
+            if job.error is not None:
+                result["error"] = job.error
+            results.append(result)
+
+        summary = {
+            "total": len(results),
+            "succeeded": sum(1 for result in results if result["status"] == "ok"),
+            "failed": sum(1 for result in results if result["status"] == "failed"),
+            "seconds": round(time.monotonic() - batch_start, 3),
+            "files": results,
+        }
+        with open(summary_path, 'w', encoding='utf-8') as file:
+            json.dump(summary, file, ensure_ascii=False, indent=2)
+
+        print(f"일괄 번역 완료: 성공 {summary['succeeded']}개, 실패 {summary['failed']}개. 요약: {summary_path}")
+        return summary
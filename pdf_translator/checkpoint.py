@@ -0,0 +1,158 @@
+"""
+번역 체크포인트 모듈
+
+페이지별 번역 결과를 출력 파일 옆의 추가 전용(JSON Lines) 파일에 기록하여
+번역이 중간에 실패해도 이미 완료된 페이지를 다시 번역하지 않고 이어서 진행할 수 있게 합니다.
+"""
+
+import os
+import json
+import threading
+from typing import Dict, Optional
+
+CHECKPOINT_SUFFIX = ".checkpoint.jsonl"
+
+class TranslationCheckpoint:
+    """
+    페이지별 번역 결과를 기록하는 체크포인트 파일 클래스
+
+    첫 줄에는 원본 PDF, 번역 모드, 대상 언어를 담은 헤더를 기록하고,
+    이후 각 줄에는 완료된 페이지 하나의 결과를 기록합니다.
+    """
+
+    def __init__(self, path: str, pdf_path: str, mode: str, target_language: str):
+        """
+        TranslationCheckpoint 초기화
+
+        Args:
+            path: 체크포인트 파일 경로
+            pdf_path: 번역 중인 PDF 파일 경로
+            mode: 번역 모드 (예: "multimodal", "text")
+            target_language: 번역할 대상 언어
+        """
+        self.path = path
+        self.header = {
+            "pdf": os.path.abspath(pdf_path),
+            "mode": mode,
+            "target_language": target_language,
+        }
+        self._lock = threading.Lock()
+        self._file = None
+        # load가 읽은 마지막 올바른 줄의 끝 위치 (바이트)
+        self._valid_size = 0
+
+    @staticmethod
+    def path_for(output_path: str) -> str:
+        """
+        출력 파일에 대응하는 체크포인트 파일 경로를 반환합니다.
+
+        Args:
+            output_path: 번역 결과 출력 파일 경로
+
+        Returns:
+            체크포인트 파일 경로
+        """
+        return output_path + CHECKPOINT_SUFFIX
+
+    def load(self) -> Dict[int, Dict[str, str]]:
+        """
+        체크포인트 파일에서 완료된 페이지를 읽습니다.
+
+        헤더가 현재 작업과 다르면 다른 작업의 체크포인트로 보고 무시합니다.
+        마지막 줄이 기록 도중 중단되어 손상된 경우 해당 줄은 건너뛰고,
+        start(resume=True)가 이어서 기록하기 전에 잘라냅니다.
+
+        Returns:
+            페이지 번호를 키로 하는 기록 딕셔너리
+        """
+        self._valid_size = 0
+        if not os.path.exists(self.path):
+            return {}
+
+        completed = {}
+        # 마지막으로 읽은 올바른 줄의 끝 위치를 기억해 두고, 이어서 기록할 때 그 뒤를 잘라냄
+        with open(self.path, 'rb') as file:
+            lines = iter(file)
+            try:
+                header_line = next(lines)
+                header = json.loads(header_line)
+            except (StopIteration, json.JSONDecodeError, UnicodeDecodeError):
+                return {}
+
+            if header != self.header:
+                print(f"경고: 체크포인트가 현재 작업과 일치하지 않아 무시합니다: {self.path}")
+                return {}
+
+            offset = valid_size = len(header_line)
+            for line in lines:
+                offset += len(line)
+                try:
+                    record = json.loads(line)
+                except (json.JSONDecodeError, UnicodeDecodeError):
+                    continue
+                completed[record["page"]] = record
+                valid_size = offset
+
+        self._valid_size = valid_size
+        return completed
+
+    def start(self, resume: bool = False) -> Dict[int, Dict[str, str]]:
+        """
+        기록을 시작합니다.
+
+        Args:
+            resume: True이면 기존 체크포인트를 읽고 이어서 기록하고,
+                False이면 기존 체크포인트를 지우고 새로 시작합니다.
+
+        Returns:
+            이어서 기록할 때 이미 완료된 페이지 기록 (load 형식). 새로 시작하면 빈 딕셔너리
+        """
+        completed = self.load() if resume else {}
+        if completed:
+            # 기록 도중 중단되어 손상된 마지막 줄을 잘라내어 새 기록이 그 줄에 이어 붙지 않게 함
+            with open(self.path, 'r+b') as file:
+                file.truncate(self._valid_size)
+                file.seek(-1, os.SEEK_END)
+                if file.read(1) != b"\n":
+                    file.write(b"\n")
+            self._file = open(self.path, 'a', encoding='utf-8')
+            return completed
+
+        self._file = open(self.path, 'w', encoding='utf-8')
+        self._write_line(self.header)
+        return {}
+
+    def record(self, page_num: int, translated: str, source: Optional[str] = None):
+        """
+        완료된 페이지의 번역 결과를 기록합니다. 여러 스레드에서 호출할 수 있습니다.
+
+        Args:
+            page_num: 페이지 번호
+            translated: 번역된 텍스트
+            source: 원본 텍스트 (텍스트 모드에서만 사용)
+        """
+        record = {"page": page_num, "translated": translated}
+        if source is not None:
+            record["source"] = source
+        self._write_line(record)
+
+    def _write_line(self, data: Dict):
+        """JSON 한 줄을 기록하고 즉시 디스크로 내보냅니다."""
+        line = json.dumps(data, ensure_ascii=False) + "\n"
+        with self._lock:
+            self._file.write(line)
+            self._file.flush()
+            os.fsync(self._file.fileno())
+
+    def close(self):
+        """체크포인트 파일을 닫습니다."""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def remove(self):
+        """번역이 모두 끝난 뒤 체크포인트 파일을 삭제합니다."""
+        self.close()
+        if os.path.exists(self.path):
+            os.remove(self.path)
@@ -0,0 +1,122 @@
+"""
+텍스트 분할 모듈
+
+한 페이지의 텍스트가 모델의 최대 출력 토큰 수에 비해 너무 길면 번역 결과가 중간에 잘립니다.
+긴 텍스트를 문단, 문장, 단어 경계 순서로 나누어 각 조각이 토큰 예산을 넘지 않게 합니다.
+"""
+
+import re
+from typing import Dict, List, Optional, Tuple
+from .tokens import estimate_tokens
+
+# 조각을 다시 합칠 때 사용하는 구분자
+CHUNK_SEPARATOR = "\n\n"
+
+_PARAGRAPH_BREAK = re.compile(r"\n\s*\n")
+_SENTENCE_END = re.compile(r"(?<=[.!?。！？])\s+")
+
+def _split_words(sentence: str, max_tokens: int) -> List[str]:
+    """문장을 단어 경계에서 나눕니다. 공백 없이 긴 단어는 글자 수로 자릅니다."""
+    pieces = []
+    for word in sentence.split():
+        if estimate_tokens(word) <= max_tokens:
+            pieces.append(word)
+        else:
+            # 글자 하나는 최대 1토큰으로 추정되므로 max_tokens자씩 자르면 예산을 넘지 않음
+            pieces.extend(word[i:i + max_tokens] for i in range(0, len(word), max_tokens))
+    return pieces
+
+def _segments(text: str, max_tokens: int) -> List[Tuple[str, str]]:
+    """텍스트를 예산 이하의 (구분자, 조각) 목록으로 나눕니다. 구분자는 앞 조각과 이을 때 사용합니다."""
+    segments = []
+    for paragraph in _PARAGRAPH_BREAK.split(text.strip()):
+        separator = "\n\n"
+        if estimate_tokens(paragraph) <= max_tokens:
+            segments.append((separator, paragraph))
+            continue
+        for sentence in _SENTENCE_END.split(paragraph):
+            pieces = [sentence] if estimate_tokens(sentence) <= max_tokens else _split_words(sentence, max_tokens)
+            for piece in pieces:
+                segments.append((separator, piece))
+                separator = " "
+    return segments
+
+def split_text(text: str, max_tokens: int) -> List[str]:
+    """
+    텍스트를 추정 토큰 수가 max_tokens 이하인 조각들로 나눕니다.
+
+    가능한 한 문단 경계에서, 문단이 너무 길면 문장 경계에서, 문장도 너무 길면 단어 경계에서
+    나누고, 인접한 조각은 예산 안에서 다시 합쳐 요청 수를 줄입니다.
+
+    Args:
+        text: 나눌 텍스트
+        max_tokens: 조각 하나의 최대 추정 토큰 수
+
+    Returns:
+        원래 순서대로 정렬된 조각 목록. 예산 안에 들어가면 원본 텍스트 하나만 담은 리스트
+    """
+    if estimate_tokens(text) <= max_tokens:
+        return [text]
+
+    chunks = []
+    current, current_tokens = "", 0
+    for separator, segment in _segments(text, max_tokens):
+        tokens = estimate_tokens(segment)
+        if current and current_tokens + tokens <= max_tokens:
+            current += separator + segment
+            current_tokens += tokens
+            continue
+        if current:
+            chunks.append(current)
+        current, current_tokens = segment, tokens
+    if current:
+        chunks.append(current)
+    return chunks
+
+def join_chunks(translations: List[str]) -> str:
+    """
+    조각별 번역을 원래 순서대로 합칩니다.
+
+    Args:
+        translations: 조각 순서대로 정렬된 번역 목록
+
+    Returns:
+        합쳐진 번역 텍스트
+    """
+    return CHUNK_SEPARATOR.join(translation.strip() for translation in translations)
+
+class ChunkAssembler:
+    """
+    조각별 번역 결과를 페이지별로 모으는 클래스
+
+    조각은 어떤 순서로 도착해도 되며, 페이지의 마지막 조각이 도착하면 조각 순서대로 합친
+    번역을 돌려줍니다.
+    """
+
+    def __init__(self):
+        """ChunkAssembler 초기화"""
+        # 페이지 번호별 [조각 번역 목록, 남은 조각 수]
+        self._pages: Dict[int, list] = {}
+
+    def add(self, page_num: int, index: int, count: int, translated: str) -> Optional[str]:
+        """
+        조각 하나의 번역을 추가합니다.
+
+        Args:
+            page_num: 페이지 번호
+            index: 조각 번호 (0부터 시작)
+            count: 페이지의 전체 조각 수
+            translated: 조각의 번역
+
+        Returns:
+            페이지의 모든 조각이 모였으면 합친 번역, 아니면 None
+        """
+        if count == 1:
+            return translated
+        entry = self._pages.setdefault(page_num, [[None] * count, count])
+        entry[0][index] = translated
+        entry[1] -= 1
+        if entry[1] > 0:
+            return None
+        del self._pages[page_num]
+        return join_chunks(entry[0])
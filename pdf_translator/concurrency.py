@@ -0,0 +1,95 @@
+"""
+동시 실행 유틸리티 모듈
+
+페이지 단위 작업을 제한된 수의 워커로 동시에 실행하면서도
+입력 순서대로 결과를 돌려주는 함수를 제공합니다.
+"""
+
+import asyncio
+from collections import deque
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import AsyncIterator, Awaitable, Callable, Iterable, Iterator, Optional, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def bounded_map(func: Callable[[T], R], items: Iterable[T], max_workers: int = 1,
+                executor: Optional[Executor] = None) -> Iterator[R]:
+    """
+    func를 items의 각 항목에 동시에 적용하고 결과를 입력 순서대로 반환합니다.
+
+    items는 필요한 만큼만 소비되므로 동시에 메모리에 머무는 항목 수는
+    워커 수에 비례합니다 (최대 max_workers * 2개).
+
+    Args:
+        func: 각 항목에 적용할 함수
+        items: 처리할 항목 (제너레이터도 가능)
+        max_workers: 동시에 실행할 최대 작업 수. 1 이하이면 순차 실행합니다.
+        executor: 사용할 Executor. 제공되지 않으면 새로 생성합니다.
+
+    Returns:
+        입력 순서대로 정렬된 결과 이터레이터
+    """
+    if max_workers <= 1 and executor is None:
+        for item in items:
+            yield func(item)
+        return
+
+    window = max(1, max_workers) * 2
+    own_executor = executor is None
+    if own_executor:
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+
+    pending = deque()
+    try:
+        for item in items:
+            if len(pending) >= window:
+                yield pending.popleft().result()
+            pending.append(executor.submit(func, item))
+
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        # 중단되거나 예외가 발생한 경우 아직 시작되지 않은 작업은 취소
+        for future in pending:
+            future.cancel()
+        if own_executor:
+            executor.shutdown(wait=True)
+
+
+async def abounded_map(func: Callable[[T], Awaitable[R]], items: Iterable[T],
+                       max_workers: int = 1) -> AsyncIterator[R]:
+    """
+    bounded_map의 asyncio 버전입니다.
+
+    코루틴 함수 func를 최대 max_workers개까지 동시에 실행하고 결과를 입력 순서대로
+    반환합니다. items가 블로킹 제너레이터(예: 페이지 렌더러)여도 이벤트 루프를
+    막지 않도록 다음 항목은 스레드에서 가져옵니다.
+
+    Args:
+        func: 각 항목에 적용할 코루틴 함수
+        items: 처리할 항목 (제너레이터도 가능)
+        max_workers: 동시에 실행할 최대 작업 수
+
+    Returns:
+        입력 순서대로 정렬된 결과 비동기 이터레이터
+    """
+    window = max(1, max_workers)
+    iterator = iter(items)
+    done = object()
+    pending = deque()
+    try:
+        while True:
+            item = await asyncio.to_thread(next, iterator, done)
+            if item is done:
+                break
+            if len(pending) >= window:
+                yield await pending.popleft()
+            pending.append(asyncio.ensure_future(func(item)))
+
+        while pending:
+            yield await pending.popleft()
+    finally:
+        for task in pending:
+            task.cancel()
@@ -0,0 +1,288 @@
+"""
+폰트 관리 모듈
+
+PDF 출력에 사용할 한국어 폰트를 찾아 reportlab에 등록합니다.
+TrueType 폰트 파싱은 Noto Sans CJK처럼 큰 폰트에서 수백 밀리초 이상 걸리므로, 파싱한 폰트
+메트릭을 폰트 경로와 수정 시각을 키로 디스크에 캐시하여 다음 프로세스부터는 파싱을 생략합니다.
+운영체제 감지와 폰트 등록은 프로세스에서 한 번만 수행합니다.
+"""
+
+import os
+import pickle
+import hashlib
+import tempfile
+import threading
+from typing import Any, Dict, Optional
+from dotenv import load_dotenv
+from .translation_cache import DEFAULT_CACHE_DIR
+
+# OS별 한국어 폰트 경로와 이름 정의
+FONT_CONFIG: Dict[str, Dict[str, str]] = {
+    "windows": {
+        "path": "C:/Windows/Fonts/malgun.ttf",
+        "name": "MalgunGothic"
+    },
+    "macos": {
+        "path": "/Library/Fonts/AppleGothic.ttf",
+        "name": "AppleGothic"
+    },
+    "linux": {
+        "path": "/usr/share/fonts/truetype/nanum/NanumGothic.ttf",
+        "name": "NanumGothic"
+    },
+    "default": {
+        "path": "",
+        "name": "Helvetica"  # Helvetica는 ReportLab 기본 폰트, 등록 불필요
+    }
+}
+
+DEFAULT_FONT_CACHE_DIR = os.path.join(DEFAULT_CACHE_DIR, "fonts")
+
+# 캐시 형식 버전. 저장하는 메트릭 형식을 바꾸면 값을 올립니다.
+FONT_CACHE_VERSION = "1"
+
+# 캐시에 저장하지 않는 폰트 속성: 폰트 파일 원본(파일에서 다시 읽음)과 단위 변환 함수(다시 만듦)
+_UNCACHED_ATTRIBUTES = ("_ttf_data", "_pdfScale")
+
+def detect_os() -> str:
+    """
+    폰트 설정에 사용할 운영체제를 결정합니다.
+
+    환경 변수(.env 포함) CURRENT_OS가 있으면 그 값을, 없으면 자동으로 감지한 값을 사용합니다.
+
+    Returns:
+        "windows", "macos", "linux", "default" 중 하나
+    """
+    # 환경 변수 로드
+    load_dotenv()
+
+    # 환경 변수에서 OS 정보 가져오기
+    current_os = os.getenv("CURRENT_OS", "").lower()
+    if current_os:
+        return current_os
+
+    # 자동 OS 감지
+    if os.name == 'nt':
+        current_os = "windows"
+    elif os.name == 'posix':
+        # macOS와 Linux 구분
+        if os.uname().sysname == 'Darwin':
+            current_os = "macos"
+        else:
+            current_os = "linux"
+    else:
+        current_os = "default"
+
+    print(f"OS 자동 감지: {current_os}")
+    return current_os
+
+def _pdf_scale(units_per_em: int):
+    """폰트 단위를 PDF 글자 단위(1000 단위)로 바꾸는 함수를 만듭니다."""
+    if units_per_em == 1000:
+        return lambda x: x
+    multiplier = 1000 / units_per_em
+    return lambda x: x * multiplier
+
+class FontManager:
+    """
+    파싱한 TrueType 폰트 메트릭을 디스크에 캐시하는 폰트 관리 클래스
+
+    캐시 항목은 cache_dir/<키>.pickle 파일로 저장되며, 키는 폰트 파일의 절대 경로, 수정 시각,
+    크기와 reportlab 버전의 해시입니다. 폰트 파일이 바뀌면 키가 달라져 다시 파싱합니다.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = DEFAULT_FONT_CACHE_DIR):
+        """
+        FontManager 초기화
+
+        Args:
+            cache_dir: 폰트 메트릭 캐시 디렉터리. None이면 캐시를 사용하지 않습니다.
+        """
+        self.cache_dir = cache_dir
+
+    def cache_key(self, font_path: str) -> str:
+        """
+        폰트 파일의 캐시 키를 생성합니다.
+
+        Args:
+            font_path: 폰트 파일 경로
+
+        Returns:
+            SHA-256 16진수 문자열
+        """
+        import reportlab
+
+        stat = os.stat(font_path)
+        parts = (os.path.abspath(font_path), str(stat.st_mtime_ns), str(stat.st_size),
+                 reportlab.Version, FONT_CACHE_VERSION)
+        return hashlib.sha256("\0".join(parts).encode('utf-8')).hexdigest()
+
+    def _path_for(self, key: str) -> str:
+        """키에 해당하는 캐시 파일 경로를 반환합니다."""
+        return os.path.join(self.cache_dir, f"{key}.pickle")
+
+    def _load_metrics(self, key: str) -> Optional[Dict[str, Any]]:
+        """캐시된 폰트 메트릭을 읽습니다. 없거나 읽을 수 없으면 None"""
+        try:
+            with open(self._path_for(key), 'rb') as file:
+                return pickle.load(file)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            print(f"경고: 폰트 캐시를 읽을 수 없어 폰트를 다시 파싱합니다: {e}")
+            return None
+
+    def _save_metrics(self, key: str, metrics: Dict[str, Any]):
+        """폰트 메트릭을 캐시에 저장합니다. 저장에 실패해도 폰트 사용에는 영향이 없습니다."""
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            # 다른 프로세스가 읽는 중에도 불완전한 파일이 보이지 않도록 원자적으로 교체
+            fd, temp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            try:
+                with os.fdopen(fd, 'wb') as file:
+                    pickle.dump(metrics, file, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(temp_path, self._path_for(key))
+            except BaseException:
+                if os.path.exists(temp_path):
+                    os.remove(temp_path)
+                raise
+        except OSError as e:
+            print(f"경고: 폰트 캐시를 저장할 수 없습니다: {e}")
+
+    @staticmethod
+    def _font_from_metrics(font_name: str, font_path: str, metrics: Dict[str, Any]) -> Any:
+        """
+        캐시된 메트릭으로 파싱 없이 TTFont 객체를 만듭니다.
+
+        TTFont.__init__와 같은 속성을 설정하되, 폰트 파일은 파싱하지 않고 서브셋 생성에
+        필요한 원본 바이트만 읽습니다.
+        """
+        from fnmatch import fnmatch
+        from weakref import WeakKeyDictionary
+        from reportlab import rl_config
+        from reportlab.pdfbase import ttfonts
+
+        face = ttfonts.TTFontFace.__new__(ttfonts.TTFontFace)
+        face.__dict__.update(metrics)
+        with open(font_path, 'rb') as file:
+            face._ttf_data = file.read()
+        face._pdfScale = _pdf_scale(face.unitsPerEm)
+
+        font = ttfonts.TTFont.__new__(ttfonts.TTFont)
+        font.fontName = font_name
+        font.face = face
+        font.encoding = ttfonts.TTEncoding()
+        font.state = WeakKeyDictionary()
+        font._asciiReadable = rl_config.ttfAsciiReadable
+        unshaped = getattr(ttfonts, "unShapedFontGlob", ())
+        font.shapable = not any(fnmatch(font_name, pattern) for pattern in unshaped)
+        return font
+
+    def load_font(self, font_name: str, font_path: str) -> Any:
+        """
+        TrueType 폰트를 불러옵니다. 캐시에 메트릭이 있으면 파싱을 생략합니다.
+
+        Args:
+            font_name: reportlab에 등록할 폰트 이름
+            font_path: 폰트 파일 경로
+
+        Returns:
+            reportlab TTFont 객체
+        """
+        from reportlab.pdfbase.ttfonts import TTFont
+
+        if self.cache_dir is None:
+            return TTFont(font_name, font_path)
+
+        key = self.cache_key(font_path)
+        metrics = self._load_metrics(key)
+        if metrics is not None:
+            try:
+                return self._font_from_metrics(font_name, font_path, metrics)
+            except Exception as e:
+                print(f"경고: 캐시된 폰트 메트릭을 사용할 수 없어 폰트를 다시 파싱합니다: {e}")
+
+        font = TTFont(font_name, font_path)
+        self._save_metrics(key, {
+            name: value for name, value in font.face.__dict__.items() if name not in _UNCACHED_ATTRIBUTES
+        })
+        return font
+
+    def register(self, font_name: str, font_path: str) -> bool:
+        """
+        폰트를 reportlab에 등록합니다. 이미 등록된 이름이면 다시 불러오지 않습니다.
+
+        Args:
+            font_name: 등록할 폰트 이름
+            font_path: 폰트 파일 경로
+
+        Returns:
+            등록 성공 여부
+        """
+        from reportlab.pdfbase import pdfmetrics
+
+        if font_name in pdfmetrics.getRegisteredFontNames():
+            return True
+        try:
+            pdfmetrics.registerFont(self.load_font(font_name, font_path))
+            print(f"폰트 등록 성공: {font_name} ({font_path})")
+            return True
+        except Exception as e:
+            print(f"폰트 등록 실패: {e}")
+            return False
+
+    def register_korean_font(self, current_os: Optional[str] = None) -> Optional[str]:
+        """
+        운영체제에 맞는 한국어 폰트를 등록합니다.
+
+        Args:
+            current_os: 운영체제. 제공되지 않으면 detect_os로 결정합니다.
+
+        Returns:
+            등록한 폰트 이름. 기본 폰트(Helvetica)를 사용해야 하면 None
+        """
+        current_os = current_os or detect_os()
+
+        # OS에 맞는 폰트 설정 가져오기
+        font_config = FONT_CONFIG.get(current_os, FONT_CONFIG["default"])
+        font_path = font_config["path"]
+        font_name = font_config["name"]
+
+        # 기본 폰트인 경우 등록 필요 없음
+        if current_os == "default" or font_name == "Helvetica":
+            print("기본 폰트(Helvetica)를 사용합니다. 한국어 표시가 제한될 수 있습니다.")
+            return None
+
+        # 폰트 파일 존재 여부 확인
+        if not os.path.exists(font_path):
+            print(f"경고: 폰트 파일을 찾을 수 없습니다: {font_path}")
+            print("기본 폰트(Helvetica)를 사용합니다. 한국어 표시가 제한될 수 있습니다.")
+            return None
+
+        if not self.register(font_name, font_path):
+            print("경고: 한국어 폰트를 등록할 수 없습니다. 기본 폰트(Helvetica)를 사용합니다.")
+            return None
+        return font_name
+
+# 프로세스에서 한 번만 한국어 폰트를 등록하기 위한 상태
+_korean_font_lock = threading.Lock()
+_korean_font_checked = False
+_korean_font: Optional[str] = None
+
+def ensure_korean_font(font_manager: Optional[FontManager] = None) -> Optional[str]:
+    """
+    한국어 폰트를 아직 등록하지 않았으면 등록합니다. 운영체제 감지와 폰트 등록은
+    프로세스에서 한 번만 수행하고 이후에는 결과를 재사용합니다.
+
+    Args:
+        font_manager: 사용할 FontManager. 제공되지 않으면 기본 캐시 디렉터리를 사용합니다.
+
+    Returns:
+        등록한 폰트 이름. 기본 폰트(Helvetica)를 사용해야 하면 None
+    """
+    global _korean_font_checked, _korean_font
+    with _korean_font_lock:
+        if not _korean_font_checked:
+            _korean_font = (font_manager or FontManager()).register_korean_font()
+            _korean_font_checked = True
+        return _korean_font
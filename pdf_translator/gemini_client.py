@@ -6,24 +6,56 @@ Gemini API 클라이언트 모듈
 """
 
 import os
-import base64
-from typing import Optional, Dict, Any, Union, BinaryIO
-import google.generativeai as genai
+import re
+import time
+import asyncio
+import threading
+from typing import Optional, Dict, Any, Iterator, List, Union, BinaryIO
 from dotenv import load_dotenv
 from .gemini_models import GeminiModel
+from .translation_cache import TranslationCache
+from .retry import RetryPolicy, EmptyResponseError
+from .rate_limiter import RateLimiter
+from .tokens import estimate_tokens, IMAGE_TOKENS
+from .metrics import Metrics, timed
+
+# 프롬프트 버전. 프롬프트를 변경하면 이전 캐시 항목이 재사용되지 않도록 값을 올립니다.
+PROMPT_VERSION = "1"
+
+# 여러 페이지를 한 요청으로 묶을 때 각 페이지 앞에 넣는 구분선과, 응답에서 구분선을 찾는 패턴
+PAGE_DELIMITER = "[[[PAGE {index}]]]"
+PAGE_DELIMITER_PATTERN = re.compile(r"^[ \t]*\[\[\[PAGE (\d+)\]\]\][ \t]*$", re.MULTILINE)
+
+class BatchSplitError(ValueError):
+    """묶음 번역 응답을 페이지별 번역으로 나눌 수 없을 때 발생하는 예외"""
 
 class GeminiClient:
     """
     Gemini API를 사용하기 위한 클라이언트 클래스
     """
     
-    def __init__(self, api_key: Optional[str] = None, model_name: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, model_name: Optional[str] = None, cache: Optional[TranslationCache] = None,
+                 retry_policy: Optional[RetryPolicy] = None, rate_limit: bool = True,
+                 requests_per_minute: Optional[int] = None, tokens_per_minute: Optional[int] = None,
+                 stream: bool = False, metrics: Optional[Metrics] = None, base_url: Optional[str] = None):
         """
         GeminiClient 초기화
         
         Args:
             api_key: Gemini API 키. 제공되지 않으면 환경 변수에서 로드합니다.
             model_name: 사용할 Gemini 모델 이름. 제공되지 않으면 기본 모델을 사용합니다.
+            cache: 번역 결과 캐시. 제공되지 않으면 캐시를 사용하지 않습니다.
+            retry_policy: API 호출 재시도 정책. 제공되지 않으면 기본 정책을 사용합니다.
+            rate_limit: 모델별 요청 할당량에 맞춰 요청 속도를 제한할지 여부 (기본값: True)
+            requests_per_minute: 분당 요청 수 제한. 제공되지 않으면 모델별 기본값을 사용합니다.
+            tokens_per_minute: 분당 토큰 수 제한. 제공되지 않으면 모델별 기본값을 사용합니다.
+            stream: 응답을 스트리밍으로 받을지 여부 (기본값: False). 긴 응답도 생성되는 대로
+                받으므로 연결이 오래 유휴 상태로 남지 않고, PDFProcessor는 텍스트 번역문을
+                translate_text_stream으로 받아 도착하는 대로 출력 파일에 기록합니다.
+            metrics: 요청 지연 시간, 전송 바이트 수, 토큰 사용량을 기록할 Metrics
+            base_url: API 서버 주소 (예: http://127.0.0.1:8080). 제공되지 않으면 환경 변수
+                GEMINI_BASE_URL을 사용하고, 둘 다 없으면 Gemini API에 연결합니다.
+                지정하면 REST 전송 방식을 사용합니다.
         """
         # 환경 변수에서 API 키 로드
         load_dotenv()
@@ -33,81 +65,426 @@ class GeminiClient:
         if not self.api_key:
             raise ValueError("Gemini API 키가 필요합니다. 환경 변수 GEMINI_API_KEY를 설정하거나 API 키를 직접 전달하세요.")
         
-        # Gemini API 설정
-        genai.configure(api_key=self.api_key)
+        # google.generativeai는 불러오는 데 시간이 오래 걸리므로 클라이언트를 만들 때 불러옴
+        import google.generativeai as genai
+        
+        # Gemini API 설정 (로컬 가짜 서버 등 다른 서버 주소가 지정되면 REST로 연결)
+        self.base_url = base_url or os.getenv("GEMINI_BASE_URL") or None
+        if self.base_url:
+            genai.configure(api_key=self.api_key, transport="rest", client_options={"api_endpoint": self.base_url})
+        else:
+            genai.configure(api_key=self.api_key)
         
         # 모델 설정
         self.text_model_id = model_name if model_name else GeminiModel.GEMINI_1_5_FLASH.value
         self.vision_model_id = GeminiModel.GEMINI_1_5_FLASH.value
         self.text_model = genai.GenerativeModel(self.text_model_id)
         self.vision_model = genai.GenerativeModel(self.vision_model_id)
+        
+        self.cache = cache
+        self.retry_policy = retry_policy or RetryPolicy()
+        
+        # 모델 ID별 속도 제한기 (모든 워커 스레드와 코루틴이 공유)
+        self.rate_limit = rate_limit
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self._rate_limiters: Dict[str, RateLimiter] = {}
+        self._rate_limiters_lock = threading.Lock()
+        
+        self.stream = stream
+        self.metrics = metrics
     
-    def translate_text_only(self, text: str, target_language: str = "한국어") -> str:
+    def _build_text_prompt(self, text: str, target_language: str) -> str:
         """
-        텍스트를 대상 언어로 번역합니다.
+        텍스트 번역 요청에 사용할 프롬프트를 생성합니다.
         
         Args:
             text: 번역할 텍스트
-            target_language: 번역할 대상 언어 (기본값: 한국어)
+            target_language: 번역할 대상 언어
             
         Returns:
-            번역된 텍스트
+            프롬프트 문자열
         """
-        prompt = f"""다음 텍스트를 {target_language}로 번역해주세요. 
+        return f"""다음 텍스트를 {target_language}로 번역해주세요. 
         원본 텍스트의 의미와 맥락을 정확하게 유지하면서 자연스러운 {target_language}로 번역하세요.
         
         원본 텍스트:
         {text}
         """
+    
+    def _build_batch_prompt(self, texts: List[str], target_language: str) -> str:
+        """
+        여러 페이지의 텍스트를 한 번에 번역하는 프롬프트를 생성합니다.
         
-        response = self.text_model.generate_content(prompt)
+        Args:
+            texts: 페이지별 텍스트 목록
+            target_language: 번역할 대상 언어
+            
+        Returns:
+            각 페이지 앞에 구분선이 들어간 프롬프트 문자열
+        """
+        pages = "\n\n".join(
+            f"{PAGE_DELIMITER.format(index=index)}\n{text}" for index, text in enumerate(texts, 1)
+        )
+        return f"""다음은 PDF 문서의 여러 페이지에서 추출한 텍스트입니다. 각 페이지를 {target_language}로 번역해주세요.
+        원본 텍스트의 의미와 맥락을 정확하게 유지하면서 자연스러운 {target_language}로 번역하세요.
+        각 페이지는 {PAGE_DELIMITER.format(index="n")} 형태의 구분선으로 시작합니다.
+        번역 결과에도 모든 구분선을 한 줄에 그대로, 같은 순서로 넣고 구분선 다음에 해당 페이지의 번역만 작성하세요.
+        구분선을 번역하거나 생략하거나 페이지를 합치지 마세요.
         
-        # 응답 확인 및 반환
-        if hasattr(response, 'text'):
-            return response.text
-        else:
-            raise ValueError("API 응답에서 텍스트를 찾을 수 없습니다.")
+{pages}
+"""
     
-    def translate(self, content: Union[str, bytes, BinaryIO], target_language: str = "한국어", text_only: bool = False) -> str:
+    @staticmethod
+    def _split_batch_response(response: str, count: int) -> List[str]:
         """
-        텍스트 또는 이미지를 대상 언어로 번역합니다.
+        묶음 번역 응답을 구분선 기준으로 페이지별 번역으로 나눕니다.
         
         Args:
-            content: 번역할 텍스트 또는 이미지 데이터
-            target_language: 번역할 대상 언어 (기본값: 한국어)
-            text_only: 텍스트만 처리할지 여부 (기본값: False)
+            response: 모델 응답 텍스트
+            count: 요청한 페이지 수
             
         Returns:
-            번역된 텍스트
+            페이지 순서대로 정렬된 번역 목록
         """
-        if text_only or isinstance(content, str):
-            return self.translate_text_only(content if isinstance(content, str) else content.decode('utf-8'), target_language)
+        parts = PAGE_DELIMITER_PATTERN.split(response)
+        # split 결과: [구분선 앞 텍스트, 번호1, 본문1, 번호2, 본문2, ...]
+        indices = [int(index) for index in parts[1::2]]
+        bodies = [body.strip() for body in parts[2::2]]
+        if indices != list(range(1, count + 1)):
+            raise BatchSplitError(f"구분선 {count}개를 기대했지만 {indices}를 받았습니다.")
+        if parts[0].strip() or not all(bodies):
+            raise BatchSplitError("구분선 밖에 텍스트가 있거나 비어 있는 페이지가 있습니다.")
+        return bodies
+    
+    def _build_image_request(self, image_data: bytes, target_language: str, mime_type: str = "image/png") -> List[Any]:
+        """
+        이미지 번역 요청에 사용할 멀티모달 콘텐츠를 생성합니다.
         
-        # 이미지 데이터 처리
+        Args:
+            image_data: 이미지 데이터
+            target_language: 번역할 대상 언어
+            mime_type: 이미지 MIME 타입 (기본값: image/png)
+            
+        Returns:
+            프롬프트와 이미지 파트로 구성된 리스트
+        """
         prompt = f"""다음 이미지에 있는 모든 텍스트를 {target_language}로 번역해주세요.
         원본 텍스트의 의미와 맥락을 정확하게 유지하면서 자연스러운 {target_language}로 번역하세요.
         번역된 텍스트만 제공해주세요. 원본 텍스트는 포함하지 마세요.
         """
         
-        # 이미지 데이터 준비
+        return [
+            prompt,
+            {"mime_type": mime_type, "data": image_data}
+        ]
+    
+    @staticmethod
+    def _read_image_data(content: Union[bytes, BinaryIO]) -> bytes:
+        """
+        이미지 콘텐츠를 바이트로 읽습니다.
+        
+        Args:
+            content: 이미지 데이터 또는 파일 객체
+            
+        Returns:
+            이미지 바이트
+        """
         if isinstance(content, bytes):
-            image_data = content
+            return content
         elif hasattr(content, 'read'):
-            image_data = content.read()
+            return content.read()
         else:
             raise ValueError("지원되지 않는 콘텐츠 형식입니다.")
+    
+    def get_rate_limiter(self, model_id: str) -> Optional[RateLimiter]:
+        """
+        모델 ID에 해당하는 속도 제한기를 반환합니다. 같은 모델을 쓰는 모든 요청이 공유합니다.
         
-        # 멀티모달 요청 생성
-        response = self.vision_model.generate_content([
-            prompt,
-            {"mime_type": "image/png", "data": image_data}
-        ])
+        Args:
+            model_id: 모델 ID
+            
+        Returns:
+            RateLimiter. 속도 제한을 사용하지 않으면 None
+        """
+        if not self.rate_limit:
+            return None
+        
+        with self._rate_limiters_lock:
+            limiter = self._rate_limiters.get(model_id)
+            if limiter is None:
+                default_rpm, default_tpm = GeminiModel.get_rate_limits(model_id)
+                limiter = RateLimiter(
+                    self.requests_per_minute or default_rpm,
+                    self.tokens_per_minute or default_tpm
+                )
+                self._rate_limiters[model_id] = limiter
+            return limiter
+    
+    @staticmethod
+    def _estimate_request_tokens(contents: Any) -> int:
+        """요청 콘텐츠의 입력 토큰 수를 추정합니다."""
+        if isinstance(contents, str):
+            return estimate_tokens(contents)
+        return sum(
+            estimate_tokens(part) if isinstance(part, str) else IMAGE_TOKENS
+            for part in contents
+        )
+    
+    def _cache_key(self, content: Union[str, bytes], target_language: str, model_id: str) -> Optional[str]:
+        """캐시가 설정된 경우 캐시 키를 반환합니다."""
+        if self.cache is None:
+            return None
+        return TranslationCache.make_key(content, target_language, model_id, PROMPT_VERSION)
+    
+    def _cache_get(self, key: Optional[str]) -> Optional[str]:
+        """캐시에서 번역 결과를 찾습니다."""
+        if key is None:
+            return None
+        value = self.cache.get(key)
+        if value is not None and self.metrics:
+            self.metrics.count("cache_hits")
+        return value
+    
+    def _cache_set(self, key: Optional[str], value: str):
+        """번역 결과를 캐시에 저장합니다."""
+        if key is not None:
+            self.cache.set(key, value)
+    
+    @staticmethod
+    def _request_bytes(contents: Any) -> int:
+        """요청 콘텐츠의 크기(바이트)를 계산합니다."""
+        parts = [contents] if isinstance(contents, str) else contents
+        return sum(
+            len(part.encode('utf-8')) if isinstance(part, str) else len(part.get("data", b""))
+            for part in parts
+        )
+    
+    def _record_request(self, model_id: str, contents: Any, response: Any, seconds: float):
+        """완료된 요청의 지연 시간, 전송 크기, 응답의 토큰 사용량을 지표에 기록합니다."""
+        if not self.metrics:
+            return
+        usage = getattr(response, "usage_metadata", None)
+        input_tokens = getattr(usage, "prompt_token_count", None)
+        output_tokens = getattr(usage, "candidates_token_count", None)
+        self.metrics.record_request(
+            model_id, seconds, self._request_bytes(contents),
+            input_tokens if isinstance(input_tokens, int) else None,
+            output_tokens if isinstance(output_tokens, int) else None
+        )
+    
+    @staticmethod
+    def _extract_text(response: Any) -> str:
+        """
+        API 응답에서 번역된 텍스트를 꺼냅니다.
         
-        # 응답 확인 및 반환
-        if hasattr(response, 'text'):
+        Args:
+            response: generate_content 응답 객체
+            
+        Returns:
+            응답 텍스트
+        """
+        # 후보가 없거나 차단된 응답은 text 접근 시 ValueError가 발생합니다
+        try:
             return response.text
-        else:
-            raise ValueError("API 응답에서 텍스트를 찾을 수 없습니다.")
+        except (AttributeError, ValueError):
+            raise EmptyResponseError("API 응답에서 텍스트를 찾을 수 없습니다.")
+    
+    @staticmethod
+    def _chunk_text(chunk: Any) -> str:
+        """스트리밍 응답 조각의 텍스트를 꺼냅니다. 텍스트가 없는 조각(종료 알림 등)은 빈 문자열입니다."""
+        try:
+            return chunk.text
+        except (AttributeError, ValueError):
+            return ""
+    
+    @classmethod
+    def _join_stream(cls, response: Any) -> str:
+        """스트리밍 응답의 모든 조각을 합칩니다."""
+        text = "".join(cls._chunk_text(chunk) for chunk in response)
+        if not text:
+            raise EmptyResponseError("스트리밍 응답에서 텍스트를 찾을 수 없습니다.")
+        return text
+    
+    def _run_request(self, model: Any, model_id: str, source: Union[str, bytes], contents: Any, target_language: str) -> str:
+        """
+        캐시를 확인한 뒤 모델에 요청을 보내고 번역 결과를 반환합니다.
+        
+        Args:
+            model: 요청을 보낼 GenerativeModel
+            model_id: 모델 ID (캐시 키에 사용)
+            source: 번역할 원본 콘텐츠 (캐시 키에 사용)
+            contents: generate_content에 전달할 요청 콘텐츠
+            target_language: 번역할 대상 언어
+            
+        Returns:
+            번역된 텍스트
+        """
+        cache_key = self._cache_key(source, target_language, model_id)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+        
+        translated = self._generate(model, model_id, contents)
+        self._cache_set(cache_key, translated)
+        return translated
+    
+    def _generate(self, model: Any, model_id: str, contents: Any) -> str:
+        """
+        속도 제한과 재시도 정책을 적용하여 모델에 요청을 보냅니다.
+        
+        Args:
+            model: 요청을 보낼 GenerativeModel
+            model_id: 모델 ID (속도 제한기 선택에 사용)
+            contents: generate_content에 전달할 요청 콘텐츠
+            
+        Returns:
+            응답 텍스트
+        """
+        limiter = self.get_rate_limiter(model_id)
+        tokens = self._estimate_request_tokens(contents)
+        
+        def attempt() -> str:
+            # 재시도도 할당량을 사용하므로 시도할 때마다 속도 제한기를 통과
+            if limiter:
+                with timed(self.metrics, "rate_limit_wait"):
+                    limiter.acquire(tokens)
+            start = time.perf_counter()
+            try:
+                if self.stream:
+                    response = model.generate_content(contents, stream=True)
+                    text = self._join_stream(response)
+                else:
+                    response = model.generate_content(contents)
+                    text = self._extract_text(response)
+            except Exception:
+                if self.metrics:
+                    self.metrics.count("failed_requests")
+                raise
+            self._record_request(model_id, contents, response, time.perf_counter() - start)
+            return text
+        
+        return self.retry_policy.call(attempt)
+    
+    def translate_text_only(self, text: str, target_language: str = "한국어") -> str:
+        """
+        텍스트를 대상 언어로 번역합니다.
+        
+        Args:
+            text: 번역할 텍스트
+            target_language: 번역할 대상 언어 (기본값: 한국어)
+            
+        Returns:
+            번역된 텍스트
+        """
+        prompt = self._build_text_prompt(text, target_language)
+        return self._run_request(self.text_model, self.text_model_id, text, prompt, target_language)
+    
+    def translate_text_stream(self, text: str, target_language: str = "한국어") -> Iterator[str]:
+        """
+        텍스트를 번역하면서 생성되는 번역문을 조각 단위로 반환합니다.
+        
+        첫 조각이 도착하기 전의 일시적인 오류는 재시도 정책에 따라 다시 시도하며,
+        스트림이 모두 끝나면 전체 번역문을 캐시에 저장합니다.
+        
+        Args:
+            text: 번역할 텍스트
+            target_language: 번역할 대상 언어 (기본값: 한국어)
+            
+        Returns:
+            번역문 조각의 이터레이터
+        """
+        cache_key = self._cache_key(text, target_language, self.text_model_id)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            yield cached
+            return
+        
+        prompt = self._build_text_prompt(text, target_language)
+        limiter = self.get_rate_limiter(self.text_model_id)
+        tokens = self._estimate_request_tokens(prompt)
+        
+        def attempt() -> Iterator[Any]:
+            if limiter:
+                with timed(self.metrics, "rate_limit_wait"):
+                    limiter.acquire(tokens)
+            return self.text_model.generate_content(prompt, stream=True)
+        
+        start = time.perf_counter()
+        response = self.retry_policy.call(attempt)
+        pieces = []
+        for chunk in response:
+            piece = self._chunk_text(chunk)
+            if piece:
+                pieces.append(piece)
+                yield piece
+        
+        if not pieces:
+            raise EmptyResponseError("스트리밍 응답에서 텍스트를 찾을 수 없습니다.")
+        self._record_request(self.text_model_id, prompt, response, time.perf_counter() - start)
+        self._cache_set(cache_key, "".join(pieces))
+    
+    def _cached_batch_results(self, texts: List[str], target_language: str) -> List[Optional[str]]:
+        """묶음 번역할 각 페이지의 캐시된 번역을 찾습니다. 없는 페이지는 None입니다."""
+        return [self._cache_get(self._cache_key(text, target_language, self.text_model_id)) for text in texts]
+    
+    def translate_text_batch(self, texts: List[str], target_language: str = "한국어") -> List[str]:
+        """
+        여러 페이지의 텍스트를 한 번의 요청으로 번역합니다.
+        
+        캐시에 없는 페이지만 구분선으로 묶어 요청하고, 응답을 페이지별로 나누어 각각 캐시합니다.
+        응답을 페이지별로 나눌 수 없으면 해당 페이지들을 하나씩 다시 번역합니다.
+        
+        Args:
+            texts: 페이지별 텍스트 목록
+            target_language: 번역할 대상 언어 (기본값: 한국어)
+            
+        Returns:
+            texts와 같은 순서의 번역된 텍스트 목록
+        """
+        results = self._cached_batch_results(texts, target_language)
+        missing = [i for i, result in enumerate(results) if result is None]
+        
+        if len(missing) == 1:
+            results[missing[0]] = self.translate_text_only(texts[missing[0]], target_language)
+        elif missing:
+            prompt = self._build_batch_prompt([texts[i] for i in missing], target_language)
+            try:
+                translated = self._split_batch_response(
+                    self._generate(self.text_model, self.text_model_id, prompt), len(missing)
+                )
+            except BatchSplitError as e:
+                print(f"경고: 묶음 번역 응답을 페이지별로 나눌 수 없어 페이지마다 다시 번역합니다: {e}")
+                translated = [self.translate_text_only(texts[i], target_language) for i in missing]
+            else:
+                for i, text in zip(missing, translated):
+                    self._cache_set(self._cache_key(texts[i], target_language, self.text_model_id), text)
+            for i, text in zip(missing, translated):
+                results[i] = text
+        
+        return results
+    
+    def translate(self, content: Union[str, bytes, BinaryIO], target_language: str = "한국어", text_only: bool = False,
+                  mime_type: str = "image/png") -> str:
+        """
+        텍스트 또는 이미지를 대상 언어로 번역합니다.
+        
+        Args:
+            content: 번역할 텍스트 또는 이미지 데이터
+            target_language: 번역할 대상 언어 (기본값: 한국어)
+            text_only: 텍스트만 처리할지 여부 (기본값: False)
+            mime_type: 이미지 데이터의 MIME 타입 (기본값: image/png)
+            
+        Returns:
+            번역된 텍스트
+        """
+        if text_only or isinstance(content, str):
+            return self.translate_text_only(content if isinstance(content, str) else content.decode('utf-8'), target_language)
+        
+        # 멀티모달 요청 생성
+        image_data = self._read_image_data(content)
+        request = self._build_image_request(image_data, target_language, mime_type)
+        return self._run_request(self.vision_model, self.vision_model_id, image_data, request, target_language)
     
     def get_model_info(self) -> Dict[str, Any]:
         """
@@ -116,6 +493,8 @@ class GeminiClient:
         Returns:
             모델 정보를 포함하는 딕셔너리
         """
+        import google.generativeai as genai
+        
         models = genai.list_models()
         return {model.name: model.supported_generation_methods for model in models}
     
@@ -126,4 +505,128 @@ class GeminiClient:
         Returns:
             모델 이름: 모델 ID 딕셔너리
         """
-        return {model.name: model.value for model in GeminiModel} 
\ No newline at end of file
+        return {model.name: model.value for model in GeminiModel} 
+
+
+class AsyncGeminiClient(GeminiClient):
+    """
+    asyncio 이벤트 루프에서 사용하기 위한 비동기 Gemini API 클라이언트 클래스
+    
+    요청마다 스레드를 점유하지 않고 generate_content_async로 여러 번역 요청을
+    하나의 이벤트 루프에서 동시에 처리합니다.
+    """
+    
+    async def _arun_request(self, model: Any, model_id: str, source: Union[str, bytes], contents: Any, target_language: str) -> str:
+        """
+        _run_request의 비동기 버전입니다.
+        """
+        cache_key = self._cache_key(source, target_language, model_id)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+        
+        translated = await self._agenerate(model, model_id, contents)
+        self._cache_set(cache_key, translated)
+        return translated
+    
+    async def _agenerate(self, model: Any, model_id: str, contents: Any) -> str:
+        """
+        _generate의 비동기 버전입니다.
+        """
+        if self.base_url:
+            # REST 전송 방식은 비동기 요청을 지원하지 않으므로 동기 요청을 스레드에서 실행
+            return await asyncio.to_thread(self._generate, model, model_id, contents)
+        
+        limiter = self.get_rate_limiter(model_id)
+        tokens = self._estimate_request_tokens(contents)
+        
+        async def attempt() -> str:
+            if limiter:
+                with timed(self.metrics, "rate_limit_wait"):
+                    await limiter.aacquire(tokens)
+            start = time.perf_counter()
+            try:
+                if self.stream:
+                    response = await model.generate_content_async(contents, stream=True)
+                    text = "".join([self._chunk_text(chunk) async for chunk in response])
+                    if not text:
+                        raise EmptyResponseError("스트리밍 응답에서 텍스트를 찾을 수 없습니다.")
+                else:
+                    response = await model.generate_content_async(contents)
+                    text = self._extract_text(response)
+            except Exception:
+                if self.metrics:
+                    self.metrics.count("failed_requests")
+                raise
+            self._record_request(model_id, contents, response, time.perf_counter() - start)
+            return text
+        
+        return await self.retry_policy.acall(attempt)
+    
+    async def translate_text_only(self, text: str, target_language: str = "한국어") -> str:
+        """
+        텍스트를 대상 언어로 비동기 번역합니다.
+        
+        Args:
+            text: 번역할 텍스트
+            target_language: 번역할 대상 언어 (기본값: 한국어)
+            
+        Returns:
+            번역된 텍스트
+        """
+        prompt = self._build_text_prompt(text, target_language)
+        return await self._arun_request(self.text_model, self.text_model_id, text, prompt, target_language)
+    
+    async def translate_text_batch(self, texts: List[str], target_language: str = "한국어") -> List[str]:
+        """
+        여러 페이지의 텍스트를 한 번의 요청으로 비동기 번역합니다. translate_text_batch의 비동기 버전입니다.
+        
+        Args:
+            texts: 페이지별 텍스트 목록
+            target_language: 번역할 대상 언어 (기본값: 한국어)
+            
+        Returns:
+            texts와 같은 순서의 번역된 텍스트 목록
+        """
+        results = self._cached_batch_results(texts, target_language)
+        missing = [i for i, result in enumerate(results) if result is None]
+        
+        if len(missing) == 1:
+            results[missing[0]] = await self.translate_text_only(texts[missing[0]], target_language)
+        elif missing:
+            prompt = self._build_batch_prompt([texts[i] for i in missing], target_language)
+            try:
+                translated = self._split_batch_response(
+                    await self._agenerate(self.text_model, self.text_model_id, prompt), len(missing)
+                )
+            except BatchSplitError as e:
+                print(f"경고: 묶음 번역 응답을 페이지별로 나눌 수 없어 페이지마다 다시 번역합니다: {e}")
+                translated = [await self.translate_text_only(texts[i], target_language) for i in missing]
+            else:
+                for i, text in zip(missing, translated):
+                    self._cache_set(self._cache_key(texts[i], target_language, self.text_model_id), text)
+            for i, text in zip(missing, translated):
+                results[i] = text
+        
+        return results
+    
+    async def translate(self, content: Union[str, bytes, BinaryIO], target_language: str = "한국어", text_only: bool = False,
+                        mime_type: str = "image/png") -> str:
+        """
+        텍스트 또는 이미지를 대상 언어로 비동기 번역합니다.
+        
+        Args:
+            content: 번역할 텍스트 또는 이미지 데이터
+            target_language: 번역할 대상 언어 (기본값: 한국어)
+            text_only: 텍스트만 처리할지 여부 (기본값: False)
+            mime_type: 이미지 데이터의 MIME 타입 (기본값: image/png)
+            
+        Returns:
+            번역된 텍스트
+        """
+        if text_only or isinstance(content, str):
+            return await self.translate_text_only(content if isinstance(content, str) else content.decode('utf-8'), target_language)
+        
+        image_data = self._read_image_data(content)
+        request = self._build_image_request(image_data, target_language, mime_type)
+        return await self._arun_request(self.vision_model, self.vision_model_id, image_data, request, target_language)
@@ -4,7 +4,8 @@ Gemini 모델 목록
 이 모듈은 Google Gemini API에서 사용 가능한 모델 목록을 Enum 형태로 제공합니다.
 """
 
-from enum import Enum, auto
+from enum import Enum
+from typing import Dict, Tuple
 
 class GeminiModel(Enum):
     """
@@ -74,4 +75,99 @@ class GeminiModel(Enum):
             return GeminiModel[name].value
         except KeyError:
             # 일치하는 이름이 없으면 기본 모델 반환
-            return GeminiModel.get_default_model() 
\ No newline at end of file
+            return GeminiModel.get_default_model() 
+    
+    @staticmethod
+    def get_output_token_limit(model_id):
+        """모델 ID에 해당하는 한 응답의 최대 출력 토큰 수를 반환합니다."""
+        for model, limit in MODEL_OUTPUT_TOKEN_LIMITS.items():
+            if model.value == model_id:
+                return limit
+        return DEFAULT_OUTPUT_TOKEN_LIMIT
+    
+    @staticmethod
+    def get_chunk_token_budget(model_id):
+        """
+        번역 요청 하나에 넣을 원문의 최대 추정 토큰 수를 반환합니다.
+        
+        번역문은 언어에 따라 원문보다 토큰이 많아질 수 있으므로 최대 출력 토큰 수의 일부만 사용합니다.
+        """
+        return GeminiModel.get_output_token_limit(model_id) // TRANSLATION_EXPANSION_FACTOR
+    
+    @staticmethod
+    def get_pricing(model_id):
+        """모델 ID에 해당하는 (입력 100만 토큰당 가격, 출력 100만 토큰당 가격)을 USD로 반환합니다."""
+        for model, pricing in MODEL_PRICING.items():
+            if model.value == model_id:
+                return pricing
+        return DEFAULT_PRICING
+    
+    @staticmethod
+    def get_rate_limits(model_id):
+        """모델 ID에 해당하는 (분당 요청 수, 분당 토큰 수) 할당량을 반환합니다."""
+        for model, limits in MODEL_RATE_LIMITS.items():
+            if model.value == model_id:
+                return limits
+        return DEFAULT_RATE_LIMITS
+
+# 모델별 기본 요청 할당량 (분당 요청 수, 분당 입력 토큰 수)
+# Gemini API 유료 1등급 기준이며, 계정 할당량에 맞게 CLI 옵션으로 조정할 수 있습니다.
+DEFAULT_RATE_LIMITS: Tuple[int, int] = (1000, 1_000_000)
+
+MODEL_RATE_LIMITS: Dict[GeminiModel, Tuple[int, int]] = {
+    GeminiModel.GEMINI_1_5_FLASH: (2000, 4_000_000),
+    GeminiModel.GEMINI_1_5_FLASH_LATEST: (2000, 4_000_000),
+    GeminiModel.GEMINI_1_5_FLASH_001: (2000, 4_000_000),
+    GeminiModel.GEMINI_1_5_FLASH_002: (2000, 4_000_000),
+    GeminiModel.GEMINI_1_5_FLASH_8B: (4000, 4_000_000),
+    GeminiModel.GEMINI_1_5_FLASH_8B_001: (4000, 4_000_000),
+    GeminiModel.GEMINI_1_5_FLASH_8B_LATEST: (4000, 4_000_000),
+    GeminiModel.GEMINI_1_5_PRO: (1000, 4_000_000),
+    GeminiModel.GEMINI_1_5_PRO_LATEST: (1000, 4_000_000),
+    GeminiModel.GEMINI_1_5_PRO_001: (1000, 4_000_000),
+    GeminiModel.GEMINI_1_5_PRO_002: (1000, 4_000_000),
+    GeminiModel.GEMINI_2_0_FLASH: (2000, 4_000_000),
+    GeminiModel.GEMINI_2_0_FLASH_001: (2000, 4_000_000),
+    GeminiModel.GEMINI_2_0_FLASH_LITE: (4000, 4_000_000),
+    GeminiModel.GEMINI_2_0_FLASH_LITE_001: (4000, 4_000_000),
+    GeminiModel.GEMINI_2_5_PRO_PREVIEW_03_25: (150, 2_000_000),
+    GeminiModel.GEMINI_2_5_PRO_EXP_03_25: (5, 250_000),
+    GeminiModel.GEMINI_2_5_FLASH_PREVIEW_04_17: (1000, 1_000_000),
+    GeminiModel.GEMMA_3_1B_IT: (30, 15_000),
+    GeminiModel.GEMMA_3_4B_IT: (30, 15_000),
+    GeminiModel.GEMMA_3_12B_IT: (30, 15_000),
+    GeminiModel.GEMMA_3_27B_IT: (30, 15_000),
+}
+
+# 모델별 한 응답의 최대 출력 토큰 수
+DEFAULT_OUTPUT_TOKEN_LIMIT = 8192
+
+MODEL_OUTPUT_TOKEN_LIMITS: Dict[GeminiModel, int] = {
+    GeminiModel.GEMINI_1_0_PRO_VISION_LATEST: 4096,
+    GeminiModel.GEMINI_PRO_VISION: 4096,
+    GeminiModel.GEMINI_2_5_PRO_PREVIEW_03_25: 65536,
+    GeminiModel.GEMINI_2_5_PRO_EXP_03_25: 65536,
+    GeminiModel.GEMINI_2_5_FLASH_PREVIEW_04_17: 65536,
+}
+
+# 번역문 토큰 수가 원문보다 늘어나는 최대 비율 (원문 예산 = 최대 출력 토큰 수 / 비율)
+TRANSLATION_EXPANSION_FACTOR = 2
+
+# 모델별 토큰 가격 (입력 100만 토큰당 USD, 출력 100만 토큰당 USD)
+# 비용 추정에만 사용하며, 실제 청구 금액은 Google AI Studio 요금표를 확인하세요.
+DEFAULT_PRICING: Tuple[float, float] = (0.075, 0.30)
+
+MODEL_PRICING: Dict[GeminiModel, Tuple[float, float]] = {
+    GeminiModel.GEMINI_1_5_FLASH_8B: (0.0375, 0.15),
+    GeminiModel.GEMINI_1_5_FLASH_8B_001: (0.0375, 0.15),
+    GeminiModel.GEMINI_1_5_FLASH_8B_LATEST: (0.0375, 0.15),
+    GeminiModel.GEMINI_1_5_PRO: (1.25, 5.00),
+    GeminiModel.GEMINI_1_5_PRO_LATEST: (1.25, 5.00),
+    GeminiModel.GEMINI_1_5_PRO_001: (1.25, 5.00),
+    GeminiModel.GEMINI_1_5_PRO_002: (1.25, 5.00),
+    GeminiModel.GEMINI_2_0_FLASH: (0.10, 0.40),
+    GeminiModel.GEMINI_2_0_FLASH_001: (0.10, 0.40),
+    GeminiModel.GEMINI_2_5_PRO_PREVIEW_03_25: (1.25, 10.00),
+    GeminiModel.GEMINI_2_5_PRO_EXP_03_25: (0.0, 0.0),
+    GeminiModel.GEMINI_2_5_FLASH_PREVIEW_04_17: (0.15, 0.60),
+}
@@ -0,0 +1,171 @@
+"""
+실행 지표 모듈
+
+렌더링, 인코딩, API 요청, PDF 생성 등 단계별 소요 시간과 전송 바이트 수,
+응답의 토큰 사용량을 모아 실행이 끝난 뒤 JSON 보고서로 기록합니다.
+PDFProcessor와 GeminiClient는 metrics가 제공된 경우에만 지표를 기록합니다.
+"""
+
+import json
+import time
+import threading
+from contextlib import contextmanager, nullcontext
+from typing import Any, ContextManager, Dict, List, Optional
+from .gemini_models import GeminiModel
+
+def percentile(values: List[float], pct: float) -> float:
+    """
+    값 목록의 백분위수를 선형 보간으로 계산합니다.
+
+    Args:
+        values: 값 목록
+        pct: 백분위 (0~100)
+
+    Returns:
+        백분위수. 값이 없으면 0.0
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    position = (len(ordered) - 1) * pct / 100
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+def summarize(values: List[float]) -> Dict[str, float]:
+    """소요 시간 목록의 요약 통계를 반환합니다."""
+    return {
+        "count": len(values),
+        "total_seconds": round(sum(values), 6),
+        "p50_seconds": round(percentile(values, 50), 6),
+        "p95_seconds": round(percentile(values, 95), 6),
+        "max_seconds": round(max(values, default=0.0), 6),
+    }
+
+class Metrics:
+    """
+    단계별 소요 시간과 요청 지표를 모으는 클래스
+
+    여러 워커 스레드에서 동시에 기록할 수 있습니다.
+    """
+
+    def __init__(self):
+        """Metrics 초기화. 생성 시점부터 전체 실행 시간을 잽니다."""
+        self._lock = threading.Lock()
+        self._start = time.monotonic()
+        self._stages: Dict[str, List[float]] = {}
+        self._counters: Dict[str, int] = {}
+        self._request_latencies: List[float] = []
+        # 모델 ID별 [입력 토큰 수, 출력 토큰 수]
+        self._tokens: Dict[str, List[int]] = {}
+
+    def record_stage(self, stage: str, seconds: float):
+        """
+        단계 하나의 소요 시간을 기록합니다.
+
+        Args:
+            stage: 단계 이름 (예: "render", "encode", "pdf_build")
+            seconds: 소요 시간 (초)
+        """
+        with self._lock:
+            self._stages.setdefault(stage, []).append(seconds)
+
+    @contextmanager
+    def stage(self, stage: str):
+        """with 블록의 실행 시간을 단계 소요 시간으로 기록합니다."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record_stage(stage, time.perf_counter() - start)
+
+    def count(self, name: str, amount: int = 1):
+        """
+        카운터를 증가시킵니다.
+
+        Args:
+            name: 카운터 이름 (예: "pages", "cache_hits")
+            amount: 증가량
+        """
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + amount
+
+    def record_request(self, model_id: str, seconds: float, bytes_sent: int,
+                       input_tokens: Optional[int] = None, output_tokens: Optional[int] = None):
+        """
+        완료된 API 요청 하나를 기록합니다.
+
+        Args:
+            model_id: 요청한 모델 ID
+            seconds: 요청을 보내고 응답을 모두 받을 때까지 걸린 시간 (초)
+            bytes_sent: 요청 본문의 크기 (바이트)
+            input_tokens: 응답 사용량 메타데이터의 입력 토큰 수
+            output_tokens: 응답 사용량 메타데이터의 출력 토큰 수
+        """
+        with self._lock:
+            self._request_latencies.append(seconds)
+            self._counters["requests"] = self._counters.get("requests", 0) + 1
+            self._counters["bytes_sent"] = self._counters.get("bytes_sent", 0) + bytes_sent
+            tokens = self._tokens.setdefault(model_id, [0, 0])
+            tokens[0] += input_tokens or 0
+            tokens[1] += output_tokens or 0
+
+    def report(self) -> Dict[str, Any]:
+        """
+        지금까지 기록한 지표의 보고서를 만듭니다.
+
+        Returns:
+            보고서 딕셔너리
+        """
+        with self._lock:
+            wall_seconds = time.monotonic() - self._start
+            pages = self._counters.get("pages", 0)
+            cost = 0.0
+            for model_id, (input_tokens, output_tokens) in self._tokens.items():
+                input_price, output_price = GeminiModel.get_pricing(model_id)
+                cost += (input_tokens * input_price + output_tokens * output_price) / 1_000_000
+
+            return {
+                "wall_seconds": round(wall_seconds, 3),
+                "pages": pages,
+                "pages_per_minute": round(pages / wall_seconds * 60, 2) if wall_seconds > 0 else 0.0,
+                "stages": {stage: summarize(values) for stage, values in sorted(self._stages.items())},
+                "requests": {
+                    "count": self._counters.get("requests", 0),
+                    "failed": self._counters.get("failed_requests", 0),
+                    "cache_hits": self._counters.get("cache_hits", 0),
+                    "bytes_sent": self._counters.get("bytes_sent", 0),
+                    "latency": summarize(self._request_latencies),
+                },
+                "tokens": {
+                    model_id: {"input": input_tokens, "output": output_tokens}
+                    for model_id, (input_tokens, output_tokens) in self._tokens.items()
+                },
+                "cost_estimate_usd": round(cost, 6),
+                "counters": dict(sorted(self._counters.items())),
+            }
+
+    def write_report(self, path: str) -> Dict[str, Any]:
+        """
+        보고서를 JSON 파일로 저장합니다.
+
+        Args:
+            path: 저장할 파일 경로
+
+        Returns:
+            저장한 보고서 딕셔너리
+        """
+        report = self.report()
+        with open(path, 'w', encoding='utf-8') as file:
+            json.dump(report, file, ensure_ascii=False, indent=2)
+        return report
+
+def timed(metrics: Optional[Metrics], stage: str) -> ContextManager:
+    """
+    metrics가 있으면 단계 소요 시간을 기록하고, 없으면 아무것도 하지 않는 컨텍스트 관리자를 반환합니다.
+
+    Args:
+        metrics: Metrics 또는 None
+        stage: 단계 이름
+    """
+    return metrics.stage(stage) if metrics else nullcontext()
@@ -0,0 +1,152 @@
+"""
+텍스트 출력 모듈
+
+번역이 끝난 페이지를 문서 순서대로 텍스트 출력 파일에 바로 추가합니다.
+모든 페이지가 끝날 때까지 기다리지 않으므로 첫 페이지의 결과를 곧바로 확인할 수 있고,
+이미 기록한 페이지의 번역문은 메모리에 남겨 두지 않습니다.
+"""
+
+import threading
+from typing import Dict, Iterable, List, Tuple
+
+# 페이지 번역문 뒤에 붙는 구분선
+PAGE_FOOTER = "\n\n" + "-" * 80 + "\n\n"
+
+def format_page_header(page_num: int, source: str) -> str:
+    """
+    페이지 하나의 번역문 앞에 오는 제목과 원본을 출력 형식으로 만듭니다.
+
+    Args:
+        page_num: 페이지 번호
+        source: 원본 텍스트
+
+    Returns:
+        번역문 앞에 기록할 문자열
+    """
+    return (
+        f"=== 페이지 {page_num} ===\n\n"
+        "원본:\n"
+        f"{source}\n\n"
+        "번역:\n"
+    )
+
+def format_text_page(page_num: int, source: str, translated: str) -> str:
+    """
+    페이지 하나의 원본과 번역문을 출력 형식으로 만듭니다.
+
+    Args:
+        page_num: 페이지 번호
+        source: 원본 텍스트
+        translated: 번역된 텍스트
+
+    Returns:
+        출력 파일에 기록할 문자열
+    """
+    return format_page_header(page_num, source) + translated + PAGE_FOOTER
+
+class OrderedTextWriter:
+    """
+    완료된 페이지를 문서 순서대로 텍스트 파일에 추가하는 클래스
+
+    페이지가 순서와 다르게 완료되면 앞 페이지가 기록될 때까지 해당 페이지만 잠시 보관합니다.
+    add_stream으로 받는 페이지는 다음에 기록할 차례가 되면 번역문 조각이 도착하는 대로 기록합니다.
+    여러 워커 스레드에서 동시에 호출할 수 있습니다.
+    """
+
+    def __init__(self, output_path: str, page_order: Iterable[int]):
+        """
+        OrderedTextWriter 초기화
+
+        Args:
+            output_path: 출력 파일 경로
+            page_order: 기록할 페이지 번호를 문서 순서대로 나열한 목록
+        """
+        self.output_path = output_path
+        self._order = list(page_order)
+        self._next = 0
+        self._pending: Dict[int, Tuple[str, str]] = {}
+        self._lock = threading.Lock()
+        self._file = open(output_path, 'w', encoding='utf-8')
+
+    def __enter__(self) -> "OrderedTextWriter":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    @property
+    def complete(self) -> bool:
+        """모든 페이지를 기록했으면 True"""
+        return self._next >= len(self._order)
+
+    def add(self, page_num: int, source: str, translated: str):
+        """
+        완료된 페이지를 추가하고 순서가 된 페이지들을 파일에 기록합니다.
+
+        Args:
+            page_num: 페이지 번호
+            source: 원본 텍스트
+            translated: 번역된 텍스트
+        """
+        with self._lock:
+            self._pending[page_num] = (source, translated)
+            self._write_ready()
+
+    def add_stream(self, page_num: int, source: str, pieces: Iterable[str]) -> str:
+        """
+        번역문 조각을 받으면서 페이지를 추가합니다.
+
+        페이지가 다음에 기록할 차례이면 조각이 도착하는 대로 파일에 기록하므로, 긴 페이지도
+        응답이 끝나기 전에 결과를 확인할 수 있습니다. 차례가 아니면 add처럼 모아서 보관합니다.
+
+        Args:
+            page_num: 페이지 번호
+            source: 원본 텍스트
+            pieces: 번역문 조각의 이터레이터 (예: GeminiClient.translate_text_stream)
+
+        Returns:
+            조각을 모두 합친 번역문
+        """
+        received: List[str] = []
+        streaming = False
+        for piece in pieces:
+            received.append(piece)
+            if not streaming:
+                # 앞 페이지가 모두 기록되어야 차례가 오고, 차례가 된 뒤에는 이 페이지가 끝날 때까지
+                # 다른 페이지를 기록하지 않으므로 잠금 없이 조각을 기록해도 됨
+                with self._lock:
+                    streaming = not self.complete and self._order[self._next] == page_num
+                if not streaming:
+                    continue
+                self._file.write(format_page_header(page_num, source) + "".join(received))
+            else:
+                self._file.write(piece)
+            self._file.flush()
+
+        translated = "".join(received)
+        with self._lock:
+            if streaming:
+                self._file.write(PAGE_FOOTER)
+                self._next += 1
+                self._write_ready()
+                self._file.flush()
+            else:
+                self._pending[page_num] = (source, translated)
+                self._write_ready()
+        return translated
+
+    def _write_ready(self):
+        """보관 중인 페이지 중 차례가 된 페이지들을 기록합니다. 잠금을 가진 상태에서 호출합니다."""
+        written = False
+        while not self.complete and self._order[self._next] in self._pending:
+            next_page = self._order[self._next]
+            self._file.write(format_text_page(next_page, *self._pending.pop(next_page)))
+            self._next += 1
+            written = True
+        if written:
+            self._file.flush()
+
+    def close(self):
+        """출력 파일을 닫습니다."""
+        if not self._file.closed:
+            self._file.close()
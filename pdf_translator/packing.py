@@ -0,0 +1,42 @@
+"""
+페이지 묶음 모듈
+
+텍스트 전용 모드에서 짧은 페이지를 한 페이지씩 요청하면 요청마다 드는 고정 비용과
+속도 제한 대기가 페이지 수만큼 쌓입니다. 연속한 짧은 페이지들을 토큰 예산 안에서
+하나의 요청으로 묶어 요청 수를 줄입니다.
+"""
+
+from typing import List, Tuple
+from .tokens import estimate_tokens
+
+# 한 요청에 묶을 최대 페이지 수 (구분선이 많아질수록 응답을 나누기 어려워짐)
+MAX_PACKED_PAGES = 20
+
+def pack_pages(pages: List[Tuple[int, str]], token_budget: int,
+               max_pages: int = MAX_PACKED_PAGES) -> List[List[Tuple[int, str]]]:
+    """
+    연속한 페이지를 토큰 예산 안에서 묶습니다.
+
+    페이지 순서는 유지되며, 혼자서 예산을 넘는 페이지는 단독 묶음이 됩니다.
+
+    Args:
+        pages: (페이지 번호, 텍스트) 튜플의 리스트
+        token_budget: 한 묶음의 최대 추정 입력 토큰 수
+        max_pages: 한 묶음의 최대 페이지 수
+
+    Returns:
+        페이지 묶음의 리스트
+    """
+    groups = []
+    current: List[Tuple[int, str]] = []
+    current_tokens = 0
+    for page_num, text in pages:
+        tokens = estimate_tokens(text)
+        if current and (current_tokens + tokens > token_budget or len(current) >= max_pages):
+            groups.append(current)
+            current, current_tokens = [], 0
+        current.append((page_num, text))
+        current_tokens += tokens
+    if current:
+        groups.append(current)
+    return groups
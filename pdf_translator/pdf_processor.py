@@ -5,118 +5,285 @@ PDF 파일을 읽고 텍스트를 추출하는 기능을 제공합니다.
 """
 
 import os
-import io
-from typing import List, Tuple, Optional, BinaryIO, Dict
-import PyPDF2
+import math
+import time
+import asyncio
+import multiprocessing
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Any, List, Tuple, Optional, Dict, Iterator, Set, Union
 import fitz  # PyMuPDF
 from tqdm import tqdm
-from dotenv import load_dotenv
-from reportlab.lib.pagesizes import letter
-from reportlab.pdfgen import canvas
-from reportlab.pdfbase import pdfmetrics
-from reportlab.pdfbase.ttfonts import TTFont
-from reportlab.platypus import SimpleDocTemplate, Paragraph
-from reportlab.lib.styles import getSampleStyleSheet
 from .gemini_client import GeminiClient
+from .concurrency import bounded_map, abounded_map
+from .checkpoint import TranslationCheckpoint
+from .text_extractors import DEFAULT_TEXT_BACKEND, get_text_extractor
+from .packing import pack_pages
+from .chunking import ChunkAssembler, split_text, join_chunks
+from .output_writer import OrderedTextWriter
+from .metrics import Metrics, timed
+from .pdf_writer import write_translated_pdf
+from .gemini_models import GeminiModel
 
-# OS별 한국어 폰트 경로와 이름 정의
-FONT_CONFIG: Dict[str, Dict[str, str]] = {
-    "windows": {
-        "path": "C:/Windows/Fonts/malgun.ttf",
-        "name": "MalgunGothic"
-    },
-    "macos": {
-        "path": "/Library/Fonts/AppleGothic.ttf",
-        "name": "AppleGothic"
-    },
-    "linux": {
-        "path": "/usr/share/fonts/truetype/nanum/NanumGothic.ttf",
-        "name": "NanumGothic"
-    },
-    "default": {
-        "path": "",
-        "name": "Helvetica"  # Helvetica는 ReportLab 기본 폰트, 등록 불필요
-    }
+# 페이지 렌더링 해상도 설정
+DEFAULT_DPI = 300
+ADAPTIVE_DPI = "auto"
+ADAPTIVE_MIN_DPI = 100
+ADAPTIVE_MAX_DPI = 300
+# 가장 작은 글자가 렌더링 후 가져야 하는 최소 높이(픽셀). 이보다 작으면 모델이 읽기 어렵습니다.
+MIN_GLYPH_PIXELS = 20
+# 텍스트 레이어의 글자 수가 이보다 적으면 스캔 페이지나 그림 위주 페이지로 봅니다.
+MIN_TEXT_LAYER_CHARS = 20
+
+# 페이지 이미지 인코딩 형식과 MIME 타입
+IMAGE_MIME_TYPES: Dict[str, str] = {
+    "png": "image/png",
+    "jpeg": "image/jpeg",
+    "webp": "image/webp",
 }
+DEFAULT_IMAGE_QUALITY = 85
 
-def _register_korean_font() -> bool:
+def encode_pixmap(pix: Any, image_format: str = "png", quality: int = DEFAULT_IMAGE_QUALITY) -> bytes:
     """
-    운영체제에 따라 적절한 한국어 폰트를 등록합니다.
+    렌더링된 페이지 이미지를 지정한 형식으로 인코딩합니다.
     
+    Args:
+        pix: fitz Pixmap 객체
+        image_format: 이미지 형식 ("png", "jpeg", "webp")
+        quality: JPEG/WebP 품질 (1~100). PNG에서는 무시됩니다.
+        
     Returns:
-        등록 성공 여부
+        인코딩된 이미지 데이터
     """
-    # 환경 변수 로드
-    load_dotenv()
-    
-    # 환경 변수에서 OS 정보 가져오기
-    current_os = os.getenv("CURRENT_OS", "").lower()
-    
-    # OS 환경변수가 비어있으면 자동 감지 시도
-    if not current_os:
-        # 자동 OS 감지
-        if os.name == 'nt':
-            current_os = "windows"
-        elif os.name == 'posix':
-            # macOS와 Linux 구분
-            if os.uname().sysname == 'Darwin':
-                current_os = "macos"
-            else:
-                current_os = "linux"
-        else:
-            current_os = "default"
-        
-        print(f"OS 자동 감지: {current_os}")
-    
-    # OS에 맞는 폰트 설정 가져오기
-    font_config = FONT_CONFIG.get(current_os, FONT_CONFIG["default"])
-    font_path = font_config["path"]
-    font_name = font_config["name"]
-    
-    # 기본 폰트인 경우 등록 필요 없음
-    if current_os == "default" or font_name == "Helvetica":
-        print("기본 폰트(Helvetica)를 사용합니다. 한국어 표시가 제한될 수 있습니다.")
-        return False
-    
-    # 폰트 파일 존재 여부 확인
-    if not os.path.exists(font_path):
-        print(f"경고: 폰트 파일을 찾을 수 없습니다: {font_path}")
-        print("기본 폰트(Helvetica)를 사용합니다. 한국어 표시가 제한될 수 있습니다.")
-        return False
-    
-    try:
-        # 폰트 등록
-        pdfmetrics.registerFont(TTFont(font_name, font_path))
-        print(f"폰트 등록 성공: {font_name} ({font_path})")
-        return True
-    except Exception as e:
-        print(f"폰트 등록 실패: {e}")
-        print("경고: 한국어 폰트를 등록할 수 없습니다. 기본 폰트(Helvetica)를 사용합니다.")
-        return False
+    if image_format == "png":
+        return pix.tobytes("png")
+    if image_format == "jpeg":
+        return pix.tobytes("jpeg", jpg_quality=quality)
+    if image_format == "webp":
+        # PyMuPDF는 WebP 인코딩을 직접 지원하지 않으므로 Pillow를 사용
+        try:
+            import PIL  # noqa: F401
+        except ImportError:
+            raise ImportError("WebP 인코딩에는 Pillow가 필요합니다. 'pip install pillow'로 설치하세요.")
+        return pix.pil_tobytes(format="WEBP", quality=quality)
+    raise ValueError(f"지원되지 않는 이미지 형식입니다: {image_format}")
+
+def select_page_dpi(page: Any, min_dpi: int = ADAPTIVE_MIN_DPI, max_dpi: int = ADAPTIVE_MAX_DPI) -> int:
+    """
+    페이지의 텍스트 레이어를 보고 렌더링 해상도를 선택합니다.
+    
+    가장 작은 글자 크기가 MIN_GLYPH_PIXELS 이상으로 렌더링되는 가장 낮은 해상도를 고릅니다.
+    본문 글자가 큰 텍스트 위주 페이지는 낮은 해상도로 충분하고, 작은 각주가 있는 페이지는
+    해상도를 높입니다. 텍스트 레이어가 거의 없는 스캔/그림 페이지는 내용을 알 수 없으므로
+    최대 해상도를 사용합니다.
+    
+    Args:
+        page: fitz 페이지 객체
+        min_dpi: 최소 해상도
+        max_dpi: 최대 해상도
+        
+    Returns:
+        렌더링 해상도 (dpi)
+    """
+    font_sizes = []
+    char_count = 0
+    for block in page.get_text("dict").get("blocks", []):
+        for line in block.get("lines", []):
+            for span in line.get("spans", []):
+                text = span.get("text", "").strip()
+                if text and span.get("size", 0) > 0:
+                    font_sizes.append(span["size"])
+                    char_count += len(text)
+    
+    if char_count < MIN_TEXT_LAYER_CHARS:
+        return max_dpi
+    
+    dpi = MIN_GLYPH_PIXELS * 72 / min(font_sizes)
+    # 해상도를 25dpi 단위로 올림하여 비슷한 페이지가 같은 크기로 렌더링되도록 함
+    dpi = int(math.ceil(dpi / 25) * 25)
+    return max(min_dpi, min(max_dpi, dpi))
 
-# 글로벌 폰트 등록 시도
-font_registered = _register_korean_font()
+# 다중 프로세스 렌더링에서 워커 하나가 한 번에 렌더링하는 페이지 수
+RENDER_CHUNK_PAGES = 4
+
+def render_page_image(page: Any, dpi: Union[int, str] = DEFAULT_DPI, image_format: str = "png",
+                      quality: int = DEFAULT_IMAGE_QUALITY, timings: Optional[Dict[str, float]] = None) -> bytes:
+    """
+    페이지 하나를 이미지로 렌더링하고 인코딩합니다.
+    
+    Args:
+        page: fitz 페이지 객체
+        dpi: 렌더링 해상도. "auto"이면 select_page_dpi로 선택합니다.
+        image_format: 이미지 형식 ("png", "jpeg", "webp")
+        quality: JPEG/WebP 품질
+        timings: 제공되면 "render", "encode" 단계의 소요 시간(초)을 기록합니다.
+        
+    Returns:
+        인코딩된 이미지 데이터
+    """
+    start = time.perf_counter()
+    if dpi == ADAPTIVE_DPI:
+        dpi = select_page_dpi(page)
+    pix = page.get_pixmap(matrix=fitz.Matrix(dpi/72, dpi/72))
+    rendered = time.perf_counter()
+    data = encode_pixmap(pix, image_format, quality)
+    if timings is not None:
+        timings["render"] = rendered - start
+        timings["encode"] = time.perf_counter() - rendered
+    return data
+
+# 렌더링 워커 프로세스가 연 PDF 문서. 워커마다 한 번만 열어 모든 작업에서 재사용합니다.
+_worker_document = None
+
+def _init_render_worker(pdf_path: str):
+    """
+    렌더링 워커 프로세스의 초기화 함수입니다.
+    
+    작업마다 PDF를 다시 열면 큰 문서나 복구가 필요한 문서의 상호 참조 테이블을 매번 다시
+    읽어야 하므로, 워커가 시작할 때 한 번만 엽니다.
+    
+    Args:
+        pdf_path: PDF 파일 경로
+    """
+    global _worker_document
+    _worker_document = fitz.open(pdf_path)
+
+def _render_page_range(page_numbers: List[int], dpi: Union[int, str], image_format: str,
+                       quality: int) -> List[Tuple[int, bytes, Dict[str, float]]]:
+    """
+    렌더링 워커 프로세스에서 실행되는 함수입니다.
+    
+    _init_render_worker가 연 문서에서 지정된 페이지들을 렌더링합니다.
+    
+    Args:
+        page_numbers: 렌더링할 페이지 번호 목록 (1부터 시작)
+        dpi: 렌더링 해상도
+        image_format: 이미지 형식
+        quality: JPEG/WebP 품질
+        
+    Returns:
+        (페이지 번호, 이미지 데이터, 단계별 소요 시간) 튜플의 리스트
+    """
+    results = []
+    for page_num in page_numbers:
+        timings: Dict[str, float] = {}
+        data = render_page_image(_worker_document[page_num - 1], dpi, image_format, quality, timings)
+        results.append((page_num, data, timings))
+    return results
+
+# 그림이 페이지 면적에서 이 비율 이상을 차지하면 텍스트만으로는 내용을 전달할 수 없다고 봅니다.
+MAX_IMAGE_COVERAGE = 0.3
+
+def classify_page(page: Any, text: Optional[str] = None) -> str:
+    """
+    하이브리드 모드에서 페이지를 텍스트로 보낼지 이미지로 보낼지 결정합니다.
+    
+    텍스트 레이어가 충분하고 그림이 차지하는 면적이 작으면 "text"를,
+    스캔 페이지처럼 텍스트 레이어가 없거나 그림 위주인 페이지는 "image"를 반환합니다.
+    
+    Args:
+        page: fitz 페이지 객체
+        text: 이미 추출한 페이지 텍스트. 제공되지 않으면 페이지에서 추출합니다.
+        
+    Returns:
+        "text" 또는 "image"
+    """
+    if text is None:
+        text = page.get_text("text")
+    if len(text.strip()) < MIN_TEXT_LAYER_CHARS:
+        return "image"
+    
+    page_area = abs(page.rect)
+    if page_area <= 0:
+        return "text"
+    
+    image_area = 0.0
+    for info in page.get_image_info():
+        image_area += abs(fitz.Rect(info["bbox"]) & page.rect)
+    
+    return "image" if image_area / page_area >= MAX_IMAGE_COVERAGE else "text"
 
 class PDFProcessor:
     """
     PDF 파일 처리를 위한 클래스
+    
+    open_checkpoint, iter_page_contents, translate_content, count_page, save_translated_pdf,
+    write_text_output은 페이지 단위 작업을 직접 구성하는 PageScheduler 같은 호출자를 위한 메서드입니다.
     """
     
-    def __init__(self, gemini_client: GeminiClient = None):
+    def __init__(self, gemini_client: GeminiClient = None, max_workers: int = 1, checkpoint: bool = False,
+                 dpi: Union[int, str] = DEFAULT_DPI, image_format: str = "png", image_quality: int = DEFAULT_IMAGE_QUALITY,
+                 text_backend: str = DEFAULT_TEXT_BACKEND, render_workers: int = 1, executor: Optional[Executor] = None,
+                 pack_tokens: int = 0, chunk_tokens: Optional[int] = None, metrics: Optional[Metrics] = None,
+                 pdf_workers: int = 1):
         """
         PDFProcessor 초기화
         
         Args:
             gemini_client: Gemini API 클라이언트. 제공되지 않으면 새로 생성합니다.
+            max_workers: 동시에 전송할 최대 페이지 번역 요청 수 (기본값: 1, 순차 실행)
+            checkpoint: 출력 파일 옆에 페이지별 체크포인트를 기록할지 여부 (기본값: False)
+            dpi: 페이지 렌더링 해상도. "auto"이면 페이지마다 글자 크기에 맞춰 선택합니다. (기본값: 300)
+            image_format: 모델에 보낼 페이지 이미지 형식 ("png", "jpeg", "webp") (기본값: png)
+            image_quality: JPEG/WebP 인코딩 품질 (1~100) (기본값: 85)
+            text_backend: 텍스트 추출 백엔드 ("pymupdf", "pypdf2") (기본값: pymupdf)
+            render_workers: 페이지 이미지 렌더링에 사용할 프로세스 수 (기본값: 1, 현재 프로세스에서 렌더링)
+            executor: 페이지 번역에 사용할 스레드 풀. 여러 문서가 같은 풀을 공유할 때 지정합니다.
+                제공되지 않으면 번역할 때마다 max_workers개의 스레드로 새로 생성합니다.
+            pack_tokens: 텍스트 전용 모드에서 연속한 짧은 페이지를 한 요청으로 묶을 때의 토큰 예산
+                (기본값: 0, 묶지 않음)
+            chunk_tokens: 긴 페이지 텍스트를 나눌 때 조각 하나의 최대 추정 토큰 수.
+                제공되지 않으면 텍스트 모델의 최대 출력 토큰 수에 맞춰 정합니다.
+            metrics: 단계별 소요 시간과 완료된 페이지 수를 기록할 Metrics
+            pdf_workers: 번역 PDF 빌드에 사용할 프로세스 수 (기본값: 1, 현재 프로세스에서 빌드)
         """
+        if dpi != ADAPTIVE_DPI and (not isinstance(dpi, int) or dpi <= 0):
+            raise ValueError(f"dpi는 양의 정수 또는 '{ADAPTIVE_DPI}'여야 합니다: {dpi}")
+        if image_format not in IMAGE_MIME_TYPES:
+            raise ValueError(f"지원되지 않는 이미지 형식입니다: {image_format}")
+        if not 1 <= image_quality <= 100:
+            raise ValueError(f"image_quality는 1에서 100 사이여야 합니다: {image_quality}")
+        
         self.gemini_client = gemini_client or GeminiClient()
+        self.max_workers = max(1, max_workers)
+        self.checkpoint = checkpoint
+        self.dpi = dpi
+        self.image_format = image_format
+        self.image_quality = image_quality
+        self.image_mime_type = IMAGE_MIME_TYPES[image_format]
+        self.text_backend = text_backend
+        self._extract_page_texts = get_text_extractor(text_backend)
+        self.render_workers = max(1, render_workers)
+        self.pdf_workers = max(1, pdf_workers)
+        self.executor = executor
+        self.pack_tokens = max(0, pack_tokens)
+        self.chunk_tokens = chunk_tokens
+        self.metrics = metrics
     
-    def extract_text_from_pdf(self, pdf_path: str) -> List[Tuple[int, str]]:
+    def open_document(self, pdf_path: str) -> Any:
+        """
+        PDF 파일을 fitz 문서로 엽니다.
+        
+        열린 문서를 iter_page_images, iter_hybrid_pages, extract_text_from_pdf에 전달하면
+        텍스트 추출과 렌더링이 파일을 한 번만 파싱한 문서를 공유합니다.
+        
+        Args:
+            pdf_path: PDF 파일 경로
+            
+        Returns:
+            fitz 문서 객체. 사용 후 close()를 호출해야 합니다.
+        """
+        if not os.path.exists(pdf_path):
+            raise FileNotFoundError(f"PDF 파일을 찾을 수 없습니다: {pdf_path}")
+        return fitz.open(pdf_path)
+    
+    def extract_text_from_pdf(self, pdf_path: str, pdf_document: Optional[Any] = None) -> List[Tuple[int, str]]:
         """
         PDF 파일에서 텍스트를 추출합니다.
         
         Args:
             pdf_path: PDF 파일 경로
+            pdf_document: 이미 열려 있는 fitz 문서 (pymupdf 백엔드에서만 사용)
             
         Returns:
             (페이지 번호, 텍스트) 튜플의 리스트
@@ -124,47 +291,190 @@ class PDFProcessor:
         if not os.path.exists(pdf_path):
             raise FileNotFoundError(f"PDF 파일을 찾을 수 없습니다: {pdf_path}")
         
-        extracted_text = []
+        with timed(self.metrics, "extract"):
+            return [
+                (page_num, text)
+                for page_num, text in self._extract_page_texts(pdf_path, pdf_document)
+                if text and text.strip()
+            ]
+    
+    def get_page_count(self, pdf_path: str) -> int:
+        """
+        PDF 파일의 페이지 수를 반환합니다.
+        
+        Args:
+            pdf_path: PDF 파일 경로
+            
+        Returns:
+            페이지 수
+        """
+        with self.open_document(pdf_path) as pdf_document:
+            return pdf_document.page_count
+    
+    def iter_page_images(self, source: Union[str, Any], skip_pages: Optional[Set[int]] = None) -> Iterator[Tuple[int, bytes]]:
+        """
+        PDF 파일의 각 페이지를 필요할 때마다 이미지로 렌더링합니다.
+        
+        모든 페이지를 미리 렌더링하지 않으므로 소비하는 쪽이 페이지를 처리하는 동안
+        다음 페이지가 렌더링되고, 메모리에는 처리 중인 페이지만 유지됩니다.
+        render_workers가 2 이상이면 여러 프로세스가 페이지 범위를 나누어 렌더링하며,
+        결과는 항상 페이지 순서대로 반환됩니다.
         
-        with open(pdf_path, 'rb') as file:
-            pdf_reader = PyPDF2.PdfReader(file)
-            num_pages = len(pdf_reader.pages)
+        Args:
+            source: PDF 파일 경로 또는 open_document로 연 fitz 문서
+            skip_pages: 렌더링하지 않을 페이지 번호 집합 (예: 이미 번역된 페이지)
             
-            for page_num in range(num_pages):
-                page = pdf_reader.pages[page_num]
-                text = page.extract_text()
-                
-                if text:
-                    extracted_text.append((page_num + 1, text))
+        Returns:
+            (페이지 번호, 이미지 데이터) 튜플의 이터레이터
+        """
+        if self.render_workers > 1:
+            if isinstance(source, str):
+                with self.open_document(source) as pdf_document:
+                    page_count = pdf_document.page_count
+                pdf_path = source
+            else:
+                page_count, pdf_path = source.page_count, source.name
+            page_numbers = [n for n in range(1, page_count + 1) if n not in (skip_pages or set())]
+            return self._render_pages_parallel(pdf_path, page_numbers)
+        
+        pdf_document = self.open_document(source) if isinstance(source, str) else None
+        return self._render_pages(pdf_document or source, skip_pages or set(), close=pdf_document is not None)
+    
+    def _render_pages_parallel(self, pdf_path: str, page_numbers: List[int]) -> Iterator[Tuple[int, bytes]]:
+        """
+        페이지를 RENDER_CHUNK_PAGES개씩 나누어 프로세스 풀에서 렌더링하고 순서대로 반환합니다.
+        
+        동시에 제출하는 범위는 render_workers의 2배로 제한하여, 소비하는 쪽이 느려도
+        렌더링된 이미지가 메모리에 무한히 쌓이지 않게 합니다.
+        """
+        chunks = [page_numbers[i:i + RENDER_CHUNK_PAGES] for i in range(0, len(page_numbers), RENDER_CHUNK_PAGES)]
+        window = self.render_workers * 2
+        
+        # 번역 스레드가 실행 중인 프로세스를 fork하지 않도록 spawn 방식 사용
+        # 워커마다 문서를 한 번만 열고 이후 작업에서 재사용
+        executor = ProcessPoolExecutor(max_workers=self.render_workers, mp_context=multiprocessing.get_context("spawn"),
+                                       initializer=_init_render_worker, initargs=(pdf_path,))
+        pending = deque()
+        try:
+            for chunk in chunks:
+                if len(pending) >= window:
+                    yield from self._collect_rendered(pending.popleft())
+                pending.append(executor.submit(
+                    _render_page_range, chunk, self.dpi, self.image_format, self.image_quality
+                ))
+            while pending:
+                yield from self._collect_rendered(pending.popleft())
+        finally:
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=True)
+    
+    def _collect_rendered(self, future: Any) -> Iterator[Tuple[int, bytes]]:
+        """렌더링 워커의 결과를 기다려 단계별 소요 시간을 기록하고 (페이지 번호, 이미지 데이터)를 반환합니다."""
+        for page_num, data, timings in future.result():
+            self._record_timings(timings)
+            yield page_num, data
+    
+    def _record_timings(self, timings: Optional[Dict[str, float]]):
+        """단계별 소요 시간을 지표에 기록합니다."""
+        if self.metrics and timings:
+            for stage, seconds in timings.items():
+                self.metrics.record_stage(stage, seconds)
+    
+    def _render_pages(self, pdf_document: Any, skip_pages: Set[int], close: bool) -> Iterator[Tuple[int, bytes]]:
+        """iter_page_images가 반환하는 렌더링 제너레이터입니다."""
+        try:
+            for page_num, page in enumerate(pdf_document):
+                if page_num + 1 in skip_pages:
+                    continue
+                yield page_num + 1, self._render_page(page)
+        finally:
+            if close:
+                pdf_document.close()
+    
+    def _render_page(self, page: Any) -> bytes:
+        """페이지 하나를 설정된 해상도와 형식의 이미지로 렌더링합니다."""
+        timings = {} if self.metrics else None
+        data = render_page_image(page, self.dpi, self.image_format, self.image_quality, timings)
+        self._record_timings(timings)
+        return data
+    
+    def iter_hybrid_pages(self, source: Union[str, Any], skip_pages: Optional[Set[int]] = None) -> Iterator[Tuple[int, str, Union[str, bytes]]]:
+        """
+        하이브리드 모드로 각 페이지의 번역 요청 콘텐츠를 생성합니다.
         
-        return extracted_text
+        텍스트 레이어가 있는 페이지는 추출한 텍스트를, 스캔 페이지나 그림 위주 페이지는
+        렌더링한 이미지를 반환합니다. iter_page_images처럼 필요할 때마다 생성합니다.
+        
+        Args:
+            source: PDF 파일 경로 또는 open_document로 연 fitz 문서
+            skip_pages: 건너뛸 페이지 번호 집합 (예: 이미 번역된 페이지)
+            
+        Returns:
+            (페이지 번호, 종류("text" 또는 "image"), 텍스트 또는 이미지 데이터) 튜플의 이터레이터
+        """
+        pdf_document = self.open_document(source) if isinstance(source, str) else None
+        return self._hybrid_pages(pdf_document or source, skip_pages or set(), close=pdf_document is not None)
+    
+    def _hybrid_pages(self, pdf_document: Any, skip_pages: Set[int], close: bool) -> Iterator[Tuple[int, str, Union[str, bytes]]]:
+        """iter_hybrid_pages가 반환하는 제너레이터입니다."""
+        # 텍스트 추출과 렌더링이 같은 문서를 사용 (pymupdf 백엔드)
+        page_texts = self._extract_page_texts(pdf_document.name, pdf_document)
+        try:
+            for (page_num, page), (_, text) in zip(enumerate(pdf_document), page_texts):
+                if page_num + 1 in skip_pages:
+                    continue
+                if classify_page(page, text) == "text":
+                    yield page_num + 1, "text", text
+                else:
+                    yield page_num + 1, "image", self._render_page(page)
+        finally:
+            page_texts.close()
+            if close:
+                pdf_document.close()
     
     def extract_page_images(self, pdf_path: str) -> List[Tuple[int, bytes]]:
         """
         PDF 파일에서 각 페이지를 이미지로 추출합니다.
         
+        모든 페이지를 메모리에 올리므로 큰 문서에는 iter_page_images를 사용하세요.
+        
         Args:
             pdf_path: PDF 파일 경로
             
         Returns:
             (페이지 번호, 이미지 데이터) 튜플의 리스트
         """
-        if not os.path.exists(pdf_path):
-            raise FileNotFoundError(f"PDF 파일을 찾을 수 없습니다: {pdf_path}")
-        
-        extracted_images = []
+        return list(self.iter_page_images(pdf_path))
+    
+    def open_checkpoint(self, pdf_path: str, output_path: Optional[str], mode: str, target_language: str, resume: bool) -> Tuple[Optional[TranslationCheckpoint], Dict[int, Dict[str, str]]]:
+        """
+        체크포인트를 열고 이어서 진행할 경우 이미 완료된 페이지를 읽습니다.
         
-        pdf_document = fitz.open(pdf_path)
-        for page_num, page in enumerate(pdf_document):
-            # 페이지를 이미지로 렌더링 (해상도 300dpi)
-            pix = page.get_pixmap(matrix=fitz.Matrix(300/72, 300/72))
-            img_data = pix.tobytes("png")
-            extracted_images.append((page_num + 1, img_data))
+        Args:
+            pdf_path: PDF 파일 경로
+            output_path: 번역 결과 출력 파일 경로
+            mode: 번역 모드
+            target_language: 번역할 대상 언어
+            resume: 이전 체크포인트에서 이어서 진행할지 여부
+            
+        Returns:
+            (체크포인트 또는 None, 완료된 페이지 기록) 튜플
+        """
+        if not (self.checkpoint or resume) or not output_path:
+            return None, {}
         
-        pdf_document.close()
-        return extracted_images
+        checkpoint = TranslationCheckpoint(
+            TranslationCheckpoint.path_for(output_path), pdf_path, mode, target_language
+        )
+        # 체크포인트는 start에서 한 번만 읽음
+        completed = checkpoint.start(resume=resume)
+        if completed:
+            print(f"체크포인트에서 이어서 번역합니다: {len(completed)}페이지 완료됨 ({checkpoint.path})")
+        return checkpoint, completed
     
-    def translate_text_only(self, pdf_path: str, output_path: str = None, target_language: str = "한국어") -> List[Tuple[int, str, str]]:
+    def translate_text_only(self, pdf_path: str, output_path: str = None, target_language: str = "한국어", resume: bool = False,
+                            collect: bool = True) -> Optional[List[Tuple[int, str, str]]]:
         """
         PDF 파일의 텍스트만 추출하여 번역합니다.
         
@@ -172,142 +482,408 @@ class PDFProcessor:
             pdf_path: PDF 파일 경로
             output_path: 번역 결과를 저장할 파일 경로. 제공되지 않으면 결과만 반환합니다.
             target_language: 번역할 대상 언어 (기본값: 한국어)
+            resume: 체크포인트에 기록된 페이지는 건너뛰고 나머지만 번역할지 여부 (기본값: False)
+            collect: 번역 결과를 모아서 반환할지 여부 (기본값: True). output_path가 있고 False이면
+                기록한 페이지의 번역문을 메모리에 남기지 않고 None을 반환합니다.
             
         Returns:
-            (페이지 번호, 원본 텍스트, 번역된 텍스트) 튜플의 리스트
+            (페이지 번호, 원본 텍스트, 번역된 텍스트) 튜플의 리스트. 결과를 모으지 않으면 None
         """
+        collect = collect or not output_path
         extracted_text = self.extract_text_from_pdf(pdf_path)
-        translated_results = []
+        checkpoint, completed = self.open_checkpoint(pdf_path, output_path, "text", target_language, resume)
+        remaining = [(page_num, text) for page_num, text in extracted_text if page_num not in completed]
+        
+        requests, chunk_counts = self._plan_text_requests(remaining)
+        sources = dict(remaining)
         
-        print(f"PDF 텍스트 번역 중... ({len(extracted_text)}페이지)")
+        print(f"PDF 텍스트 번역 중... ({len(remaining)}페이지, 요청 {len(requests)}개, 워커 {self.max_workers}개)")
         
-        for page_num, text in tqdm(extracted_text, desc="번역 중"):
-            translated_text = self.gemini_client.translate_text_only(text, target_language)
-            translated_results.append((page_num, text, translated_text))
+        # 스트리밍을 사용하면 조각으로 나누지 않은 페이지의 번역문을 받는 대로 출력 파일에 기록
+        stream = bool(output_path) and getattr(self.gemini_client, "stream", False)
+        streamed: Set[int] = set()
+        
+        def translate_request(request: List[Tuple[int, str]]) -> List[Tuple[int, str]]:
+            with timed(self.metrics, "translate"):
+                if len(request) == 1:
+                    page_num, text = request[0]
+                    if stream and chunk_counts[page_num] == 1:
+                        translated = writer.add_stream(
+                            page_num, sources[page_num], self.gemini_client.translate_text_stream(text, target_language)
+                        )
+                        streamed.add(page_num)
+                        return [(page_num, translated)]
+                    return [(page_num, self.gemini_client.translate_text_only(text, target_language))]
+                translations = self.gemini_client.translate_text_batch([text for _, text in request], target_language)
+                return [(page_num, translated) for (page_num, _), translated in zip(request, translations)]
+        
+        # 출력 파일에는 완료된 페이지를 순서대로 바로 추가
+        writer = None
+        if output_path:
+            writer = OrderedTextWriter(output_path, [page_num for page_num, _ in extracted_text])
+            for page_num, record in sorted(completed.items()):
+                writer.add(page_num, record.get("source", ""), record["translated"])
+            if not collect:
+                completed = {}
+        
+        # 요청 결과는 순서대로 도착하므로 한 페이지의 조각들은 연속해서 모임
+        new_results = []
+        pieces: Dict[int, List[str]] = {}
+        try:
+            with tqdm(total=len(remaining), desc="번역 중") as progress:
+                for request_results in bounded_map(translate_request, requests, self.max_workers, self.executor):
+                    for page_num, translated in request_results:
+                        pieces.setdefault(page_num, []).append(translated)
+                        if len(pieces[page_num]) < chunk_counts[page_num]:
+                            continue
+                        page_pieces = pieces.pop(page_num)
+                        translated = page_pieces[0] if len(page_pieces) == 1 else join_chunks(page_pieces)
+                        if checkpoint:
+                            checkpoint.record(page_num, translated, source=sources[page_num])
+                        # 결과를 모으지 않으면 기록한 페이지의 원본과 번역문을 바로 버림
+                        source = sources[page_num] if collect else sources.pop(page_num)
+                        if writer and page_num not in streamed:
+                            writer.add(page_num, source, translated)
+                        if collect:
+                            new_results.append((page_num, source, translated))
+                        self.count_page()
+                        progress.update(1)
+        finally:
+            if writer:
+                writer.close()
+            if checkpoint:
+                checkpoint.close()
         
-        # 결과를 파일로 저장
         if output_path:
-            with open(output_path, 'w', encoding='utf-8') as file:
-                for page_num, source, translated in translated_results:
-                    file.write(f"=== 페이지 {page_num} ===\n\n")
-                    file.write("원본:\n")
-                    file.write(f"{source}\n\n")
-                    file.write("번역:\n")
-                    file.write(f"{translated}\n\n")
-                    file.write("-" * 80 + "\n\n")
-            
             print(f"번역 결과가 저장되었습니다: {output_path}")
+            if checkpoint:
+                checkpoint.remove()
         
-        return translated_results
+        if not collect:
+            return None
+        
+        return sorted(new_results + [
+            (page_num, record.get("source", ""), record["translated"])
+            for page_num, record in completed.items()
+        ])
+    
+    def get_chunk_token_budget(self) -> int:
+        """
+        텍스트 번역 요청 하나에 넣을 원문의 최대 추정 토큰 수를 반환합니다.
+        
+        Returns:
+            chunk_tokens가 지정되면 그 값, 아니면 텍스트 모델의 최대 출력 토큰 수에 맞춘 값
+        """
+        if self.chunk_tokens:
+            return self.chunk_tokens
+        return GeminiModel.get_chunk_token_budget(getattr(self.gemini_client, "text_model_id", None))
+    
+    def _plan_text_requests(self, pages: List[Tuple[int, str]]) -> Tuple[List[List[Tuple[int, str]]], Dict[int, int]]:
+        """
+        텍스트 페이지를 번역 요청 단위로 나눕니다.
+        
+        모델 출력 한도를 넘을 만큼 긴 페이지는 문단·문장 경계에서 여러 조각으로 나누어 각각 요청하고,
+        pack_tokens가 설정되면 연속한 짧은 페이지를 한 요청으로 묶습니다.
+        
+        Args:
+            pages: (페이지 번호, 텍스트) 튜플의 리스트
+            
+        Returns:
+            (요청 목록, 페이지별 조각 수) 튜플. 각 요청은 (페이지 번호, 텍스트) 튜플의 리스트입니다.
+        """
+        chunk_budget = self.get_chunk_token_budget()
+        pack_budget = min(self.pack_tokens, chunk_budget)
+        requests: List[List[Tuple[int, str]]] = []
+        chunk_counts: Dict[int, int] = {}
+        short_pages: List[Tuple[int, str]] = []
+        
+        def flush_short_pages():
+            requests.extend(pack_pages(short_pages, pack_budget) if pack_budget else [[page] for page in short_pages])
+            short_pages.clear()
+        
+        for page_num, text in pages:
+            chunks = split_text(text, chunk_budget)
+            chunk_counts[page_num] = len(chunks)
+            if len(chunks) == 1:
+                short_pages.append((page_num, text))
+            else:
+                flush_short_pages()
+                requests.extend([(page_num, chunk)] for chunk in chunks)
+        flush_short_pages()
+        
+        return requests, chunk_counts
+    
+    def write_text_output(self, translated_results: List[Tuple[int, str, str]], output_path: str):
+        """
+        텍스트 번역 결과를 파일로 저장합니다.
+        
+        Args:
+            translated_results: (페이지 번호, 원본 텍스트, 번역된 텍스트) 튜플의 리스트
+            output_path: 저장할 파일 경로
+        """
+        with OrderedTextWriter(output_path, [page_num for page_num, _, _ in translated_results]) as writer:
+            for page_num, source, translated in translated_results:
+                writer.add(page_num, source, translated)
+        
+        print(f"번역 결과가 저장되었습니다: {output_path}")
     
-    def translate(self, pdf_path: str, output_path: Optional[str] = None, target_language: str = "한국어", text_only: bool = False) -> List[Tuple[int, str]]:
+    def translate(self, pdf_path: str, output_path: Optional[str] = None, target_language: str = "한국어", text_only: bool = False, resume: bool = False,
+                  hybrid: bool = False) -> List[Tuple[int, str]]:
         """
         PDF 파일을 번역합니다. 
         text_only가 False이면 멀티모달 방식으로 페이지 이미지를 전송하여 번역합니다.
         text_only가 True이면 텍스트만 추출하여 번역합니다.
+        hybrid가 True이면 텍스트 레이어가 있는 페이지는 텍스트로, 나머지 페이지는 이미지로 번역합니다.
         
         Args:
             pdf_path: PDF 파일 경로
             output_path: 번역 결과를 저장할 PDF 파일 경로. 제공되지 않으면 결과만 반환합니다.
             target_language: 번역할 대상 언어 (기본값: 한국어)
             text_only: 텍스트만 추출하여 번역할지 여부 (기본값: False)
+            resume: 체크포인트에 기록된 페이지는 건너뛰고 나머지만 번역할지 여부 (기본값: False)
+            hybrid: 페이지마다 텍스트/이미지 중 적절한 방식을 선택할지 여부 (기본값: False)
             
         Returns:
             (페이지 번호, 번역된 텍스트) 튜플의 리스트
         """
         if text_only:
-            results = self.translate_text_only(pdf_path, output_path, target_language)
+            results = self.translate_text_only(pdf_path, output_path, target_language, resume=resume)
             return [(page_num, translated) for page_num, _, translated in results]
         
-        # 멀티모달 번역 수행
-        extracted_images = self.extract_page_images(pdf_path)
-        translated_results = []
+        # 멀티모달/하이브리드 번역 수행 (렌더링과 번역 요청을 겹쳐서 진행)
+        mode = "hybrid" if hybrid else "multimodal"
+        pdf_document = self.open_document(pdf_path)
+        checkpoint, completed = self.open_checkpoint(pdf_path, output_path, mode, target_language, resume)
+        page_count = pdf_document.page_count - len(completed)
+        requests = self.iter_page_requests(self.iter_page_contents(pdf_document, hybrid, set(completed)))
+        
+        print(f"PDF {'하이브리드' if hybrid else '멀티모달'} 번역 중... ({page_count}페이지, 워커 {self.max_workers}개)")
+        
+        def translate_request(request: Tuple[int, str, Union[str, bytes], int, int]) -> Tuple[int, int, int, str]:
+            page_num, kind, content, index, count = request
+            return page_num, index, count, self.translate_content(kind, content, target_language)
         
-        print(f"PDF 멀티모달 번역 중... ({len(extracted_images)}페이지)")
+        # 긴 페이지의 조각도 별도 요청으로 같은 풀에서 동시에 번역하고, 마지막 조각이 끝나면 합침
+        assembler = ChunkAssembler()
+        new_results = []
+        try:
+            with tqdm(total=page_count, desc="번역 중") as progress:
+                for page_num, index, count, chunk in bounded_map(translate_request, requests, self.max_workers, self.executor):
+                    translated = assembler.add(page_num, index, count, chunk)
+                    if translated is None:
+                        continue
+                    if checkpoint:
+                        checkpoint.record(page_num, translated)
+                    self.count_page()
+                    new_results.append((page_num, translated))
+                    progress.update(1)
+        finally:
+            pdf_document.close()
+            if checkpoint:
+                checkpoint.close()
         
-        for page_num, img_data in tqdm(extracted_images, desc="번역 중"):
-            translated_text = self.gemini_client.translate(img_data, target_language)
-            translated_results.append((page_num, translated_text))
+        translated_results = sorted(new_results + [
+            (page_num, record["translated"]) for page_num, record in completed.items()
+        ])
         
         # 번역 결과를 PDF로 저장
         if output_path:
-            self._create_translated_pdf(translated_results, output_path)
+            self.save_translated_pdf(translated_results, output_path)
             print(f"번역된 PDF가 저장되었습니다: {output_path}")
+            if checkpoint:
+                checkpoint.remove()
         
         return translated_results
     
-    def _create_translated_pdf(self, translated_results: List[Tuple[int, str]], output_path: str):
+    def iter_page_contents(self, source: Union[str, Any], hybrid: bool, skip_pages: Set[int]) -> Iterator[Tuple[int, str, Union[str, bytes]]]:
         """
-        번역 결과를 PDF 파일로 생성합니다. (한국어 폰트 및 Paragraph 사용으로 개선)
+        번역 요청 콘텐츠를 (페이지 번호, 종류, 콘텐츠) 형태로 생성합니다.
         
         Args:
-            translated_results: (페이지 번호, 번역된 텍스트) 튜플의 리스트
-            output_path: 저장할 PDF 파일 경로
+            source: PDF 파일 경로 또는 fitz 문서
+            hybrid: 하이브리드 모드 여부. False이면 모든 페이지를 이미지로 렌더링합니다.
+            skip_pages: 건너뛸 페이지 번호 집합
+        """
+        if hybrid:
+            return self.iter_hybrid_pages(source, skip_pages=skip_pages)
+        return (
+            (page_num, "image", img_data)
+            for page_num, img_data in self.iter_page_images(source, skip_pages=skip_pages)
+        )
+    
+    def iter_page_requests(self, pages: Iterator[Tuple[int, str, Union[str, bytes]]]) -> Iterator[Tuple[int, str, Union[str, bytes], int, int]]:
+        """
+        페이지 콘텐츠를 번역 요청 단위로 나눕니다.
+        
+        모델 출력 한도를 넘을 만큼 긴 텍스트 페이지는 _plan_text_requests처럼 여러 조각으로 나누어
+        각 조각을 별도 요청으로 생성하므로, 조각들이 같은 워커 풀에서 동시에 번역됩니다.
+        조각별 번역은 ChunkAssembler로 다시 합칩니다.
+        
+        Args:
+            pages: (페이지 번호, 종류, 콘텐츠) 튜플의 이터레이터
+            
+        Returns:
+            (페이지 번호, 종류, 콘텐츠, 조각 번호, 조각 수) 튜플의 이터레이터
+        """
+        chunk_budget = self.get_chunk_token_budget()
+        try:
+            for page_num, kind, content in pages:
+                if kind != "text":
+                    yield page_num, kind, content, 0, 1
+                    continue
+                chunks = split_text(content, chunk_budget)
+                for index, chunk in enumerate(chunks):
+                    yield page_num, kind, chunk, index, len(chunks)
+        finally:
+            # 중간에 닫혀도 렌더링 이터레이터가 바로 정리되도록 함께 닫음
+            if hasattr(pages, "close"):
+                pages.close()
+    
+    def count_page(self):
+        """번역이 완료된 페이지 수를 지표에 기록합니다."""
+        if self.metrics:
+            self.metrics.count("pages")
+    
+    def translate_content(self, kind: str, content: Union[str, bytes], target_language: str) -> str:
+        """
+        종류에 맞는 클라이언트 메서드로 번역 요청 하나를 번역합니다.
+        긴 텍스트 페이지는 iter_page_requests로 미리 조각을 나누어 조각마다 호출합니다.
+        """
+        with timed(self.metrics, "translate"):
+            if kind == "text":
+                return self.gemini_client.translate_text_only(content, target_language)
+            return self.gemini_client.translate(content, target_language, mime_type=self.image_mime_type)
+    
+    async def _acall_client(self, method_name: str, *args, **kwargs) -> str:
         """
-        buffer = io.BytesIO()
-        doc = SimpleDocTemplate(buffer, pagesize=letter)
-        styles = getSampleStyleSheet()
+        Gemini 클라이언트 메서드를 비동기로 호출합니다.
         
-        # 글로벌 font_registered 변수 사용
-        global font_registered
+        AsyncGeminiClient처럼 코루틴 메서드를 제공하면 그대로 await하고,
+        동기 클라이언트이면 기본 스레드 풀에서 실행합니다.
+        """
+        method = getattr(self.gemini_client, method_name)
+        if asyncio.iscoroutinefunction(method):
+            return await method(*args, **kwargs)
+        return await asyncio.to_thread(method, *args, **kwargs)
+    
+    async def atranslate(self, pdf_path: str, output_path: Optional[str] = None, target_language: str = "한국어", text_only: bool = False,
+                         hybrid: bool = False) -> List[Tuple[int, str]]:
+        """
+        PDF 파일을 비동기로 번역합니다. translate의 asyncio 버전입니다.
+        
+        최대 max_workers개의 페이지 요청을 하나의 이벤트 루프에서 동시에 처리하므로
+        여러 문서를 asyncio.gather로 함께 번역할 수 있습니다.
+        
+        Args:
+            pdf_path: PDF 파일 경로
+            output_path: 번역 결과를 저장할 파일 경로. 제공되지 않으면 결과만 반환합니다.
+            target_language: 번역할 대상 언어 (기본값: 한국어)
+            text_only: 텍스트만 추출하여 번역할지 여부 (기본값: False)
+            hybrid: 페이지마다 텍스트/이미지 중 적절한 방식을 선택할지 여부 (기본값: False)
+            
+        Returns:
+            (페이지 번호, 번역된 텍스트) 튜플의 리스트
+        """
+        # 페이지 조각 요청도 포함하여 동시에 진행 중인 요청을 max_workers개로 제한
+        request_slots = asyncio.Semaphore(self.max_workers)
         
-        # 환경 변수 로드
-        load_dotenv()
-        current_os = os.getenv("CURRENT_OS", "").lower()
+        async def call_client(method_name: str, *args, **kwargs) -> Any:
+            async with request_slots:
+                return await self._acall_client(method_name, *args, **kwargs)
         
-        # OS 자동 감지
-        if not current_os:
-            if os.name == 'nt':
-                current_os = "windows"
-            elif os.name == 'posix':
-                if hasattr(os, 'uname') and os.uname().sysname == 'Darwin':
-                    current_os = "macos"
+        if text_only:
+            text_pages = await asyncio.to_thread(self.extract_text_from_pdf, pdf_path)
+            translated_results = await self._atranslate_text_requests(text_pages, target_language, call_client)
+        else:
+            async def translate_page(page: Tuple[int, str, Union[str, bytes]]) -> Tuple[int, str]:
+                page_num, kind, content = page
+                if kind == "text":
+                    # 긴 페이지는 조각으로 나누어 동시에 번역
+                    chunks = split_text(content, self.get_chunk_token_budget())
+                    translations = await asyncio.gather(*(
+                        call_client("translate_text_only", chunk, target_language) for chunk in chunks
+                    ))
+                    translated = translations[0] if len(chunks) == 1 else join_chunks(translations)
                 else:
-                    current_os = "linux"
-            else:
-                current_os = "default"
+                    translated = await call_client("translate", content, target_language, mime_type=self.image_mime_type)
+                self.count_page()
+                return page_num, translated
+            
+            pages = self.iter_page_contents(pdf_path, hybrid, set())
+            translated_results = [
+                result async for result in abounded_map(translate_page, pages, self.max_workers)
+            ]
         
-        # OS에 맞는 폰트 설정 가져오기
-        font_config = FONT_CONFIG.get(current_os, FONT_CONFIG["default"])
-        font_name = font_config["name"]
+        if output_path:
+            if text_only:
+                sources = dict(text_pages)
+                await asyncio.to_thread(
+                    self.write_text_output,
+                    [(page_num, sources[page_num], translated) for page_num, translated in translated_results],
+                    output_path
+                )
+            else:
+                await asyncio.to_thread(self.save_translated_pdf, translated_results, output_path)
+                print(f"번역된 PDF가 저장되었습니다: {output_path}")
         
-        # 적절한 스타일 설정
-        korean_style = styles['Normal']
-        if font_registered and font_name != "Helvetica":
-            korean_style.fontName = font_name
-        korean_style.fontSize = 10
-        korean_style.leading = 14  # 줄 간격 설정
+        return translated_results
+    
+    async def _atranslate_text_requests(self, text_pages: List[Tuple[int, str]], target_language: str,
+                                        call_client: Any) -> List[Tuple[int, str]]:
+        """
+        텍스트 페이지를 translate_text_only와 같은 요청 단위(_plan_text_requests)로 비동기 번역합니다.
         
-        story = []
+        pack_tokens가 설정되면 짧은 페이지를 translate_text_batch 요청 하나로 묶고,
+        긴 페이지의 조각은 각각 요청한 뒤 순서대로 합칩니다.
         
-        for page_num, text in sorted(translated_results):
-            # 페이지 번호 추가
-            page_header = Paragraph(f"=== 페이지 {page_num} ===", styles['Heading2'])
-            story.append(page_header)
-            
-            # 텍스트를 Paragraph 객체로 변환 (자동 줄바꿈 처리)
-            paragraph_text = text.replace('\n', '<br/>')
-            p = Paragraph(paragraph_text, korean_style)
-            story.append(p)
+        Args:
+            text_pages: (페이지 번호, 텍스트) 튜플의 리스트
+            target_language: 번역할 대상 언어
+            call_client: 동시 요청 수를 제한하여 클라이언트 메서드를 호출하는 코루틴 함수
             
-            # 페이지 구분을 위한 간격 추가
-            from reportlab.platypus import Spacer
-            story.append(Spacer(1, 20))
+        Returns:
+            (페이지 번호, 번역된 텍스트) 튜플의 리스트
+        """
+        requests, chunk_counts = self._plan_text_requests(text_pages)
         
-        # PDF 빌드
-        try:
-            doc.build(story)
-        except Exception as e:
-            print(f"PDF 빌드 중 오류 발생: {e}")
-            print(f"폰트 설정: {font_name} (등록 성공: {font_registered})")
-            # 오류 발생해도 buffer에 부분적으로 쓰여진 내용이 있을 수 있음
-            buffer.seek(0)
-            with open(output_path, 'wb') as f:
-                f.write(buffer.getvalue())
-            print(f"오류에도 불구하고 부분적인 PDF를 저장했습니다: {output_path}")
-            raise
-        
-        # 파일로 저장
-        buffer.seek(0)
-        with open(output_path, 'wb') as f:
-            f.write(buffer.getvalue()) 
\ No newline at end of file
+        async def translate_request(request: List[Tuple[int, str]]) -> List[Tuple[int, str]]:
+            if len(request) == 1:
+                page_num, text = request[0]
+                return [(page_num, await call_client("translate_text_only", text, target_language))]
+            translations = await call_client("translate_text_batch", [text for _, text in request], target_language)
+            return [(page_num, translated) for (page_num, _), translated in zip(request, translations)]
+        
+        # 요청 결과는 순서대로 도착하므로 한 페이지의 조각들은 연속해서 모임
+        translated_results = []
+        pieces: Dict[int, List[str]] = {}
+        async for request_results in abounded_map(translate_request, requests, self.max_workers):
+            for page_num, translated in request_results:
+                pieces.setdefault(page_num, []).append(translated)
+                if len(pieces[page_num]) < chunk_counts[page_num]:
+                    continue
+                page_pieces = pieces.pop(page_num)
+                translated_results.append((page_num, page_pieces[0] if len(page_pieces) == 1 else join_chunks(page_pieces)))
+                self.count_page()
+        return translated_results
+    
+    def save_translated_pdf(self, translated_results: List[Tuple[int, str]], output_path: str):
+        """
+        번역 결과를 PDF 파일로 저장하고 소요 시간을 "pdf_build" 단계로 기록합니다.
+        
+        Args:
+            translated_results: (페이지 번호, 번역된 텍스트) 튜플의 리스트
+            output_path: 저장할 PDF 파일 경로
+        """
+        with timed(self.metrics, "pdf_build"):
+            self._create_translated_pdf(translated_results, output_path)
+    
+    def _create_translated_pdf(self, translated_results: List[Tuple[int, str]], output_path: str):
+        """
+        번역 결과를 PDF 파일로 생성합니다. (한국어 폰트 및 줄 단위 Paragraph 사용)
+        pdf_workers가 2 이상이면 큰 문서는 여러 프로세스에서 나누어 빌드합니다.
+        
+        Args:
+            translated_results: (페이지 번호, 번역된 텍스트) 튜플의 리스트
+            output_path: 저장할 PDF 파일 경로
+        """
+        write_translated_pdf(translated_results, output_path, workers=self.pdf_workers)
@@ -0,0 +1,254 @@
+"""
+번역 PDF 작성 모듈
+
+번역 결과를 reportlab으로 PDF 파일에 기록합니다.
+reportlab은 문단 하나를 줄 단위로 배치하고, 문단이 출력 페이지 경계에 걸리면 남은 부분을
+다시 배치하므로 문단이 길수록 배치 비용이 급격히 늘어납니다. 번역문을 줄마다 작은 Paragraph로
+나누어 문서 크기에 비례하는 시간에 배치되도록 합니다.
+reportlab 빌드는 한 스레드에서만 실행되므로, 큰 문서는 페이지 범위를 나누어 여러 프로세스에서
+조각 PDF로 빌드한 뒤 PyMuPDF로 이어 붙일 수 있습니다.
+"""
+
+import io
+import os
+import re
+import contextlib
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Any, List, Optional, Tuple
+from .fonts import ensure_korean_font
+
+# 본문 글자 크기와 줄 간격
+BODY_FONT_SIZE = 10
+BODY_LEADING = 14  # 줄 간격 설정
+# 원본 페이지 사이의 간격
+PAGE_GAP = 20
+# 프로세스 하나가 맡는 최소 페이지 수. 이보다 작으면 프로세스 시작 비용이 빌드 시간보다 큽니다.
+PDF_SHARD_MIN_PAGES = 100
+
+@lru_cache(maxsize=None)
+def paragraph_styles(font_name: Optional[str] = None) -> Tuple[Any, Any]:
+    """
+    페이지 제목과 본문에 사용할 문단 스타일을 반환합니다. 폰트별로 한 번만 만들어 재사용합니다.
+
+    Args:
+        font_name: 본문 폰트 이름. None이면 reportlab 기본 폰트(Helvetica)를 사용합니다.
+
+    Returns:
+        (제목 스타일, 본문 스타일) 튜플
+    """
+    from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
+
+    styles = getSampleStyleSheet()
+    body_style = ParagraphStyle("TranslatedBody", parent=styles['Normal'],
+                                fontSize=BODY_FONT_SIZE, leading=BODY_LEADING)
+    if font_name:
+        body_style.fontName = font_name
+    return styles['Heading2'], body_style
+
+# 번역문 안의 reportlab 인라인 마크업 태그와, 닫는 태그가 없는 빈 요소
+_MARKUP_TAG_PATTERN = re.compile(r"<(/?)([A-Za-z][\w:]*)\b[^<>]*?(/?)>")
+_EMPTY_TAGS = {"br", "img"}
+
+def _markup_depth(line: str) -> int:
+    """줄 안에서 열린 인라인 태그 수에서 닫힌 태그 수를 뺀 값을 반환합니다."""
+    depth = 0
+    for closing, tag, self_closing in _MARKUP_TAG_PATTERN.findall(line):
+        if self_closing or tag.lower() in _EMPTY_TAGS:
+            continue
+        depth += -1 if closing else 1
+    return depth
+
+def text_flowables(text: str, style: Any) -> List[Any]:
+    """
+    번역문을 줄 단위 flowable 목록으로 변환합니다.
+
+    줄마다 Paragraph를 만들고 빈 줄은 한 줄 높이의 Spacer로 바꾸므로, 줄바꿈을 <br/>로 바꾼
+    하나의 Paragraph와 같은 모양으로 출력됩니다. <b>처럼 여러 줄에 걸친 인라인 마크업은
+    태그가 닫힐 때까지의 줄을 <br/>로 이어 하나의 Paragraph로 만듭니다.
+
+    Args:
+        text: 번역된 텍스트
+        style: 본문 문단 스타일
+
+    Returns:
+        flowable 목록
+    """
+    from reportlab.platypus import Paragraph, Spacer
+
+    flowables = []
+    block: List[str] = []
+    depth = 0
+    for line in text.split('\n'):
+        if not block and not line.strip():
+            flowables.append(Spacer(1, style.leading))
+            continue
+        block.append(line)
+        depth += _markup_depth(line)
+        if depth <= 0:
+            flowables.append(Paragraph('<br/>'.join(block), style))
+            block = []
+            depth = 0
+    if block:
+        flowables.append(Paragraph('<br/>'.join(block), style))
+    return flowables
+
+def build_story(translated_results: List[Tuple[int, str]], font_name: Optional[str] = None) -> List[Any]:
+    """
+    번역 결과로 reportlab 문서 내용(story)을 만듭니다.
+
+    Args:
+        translated_results: (페이지 번호, 번역된 텍스트) 튜플의 리스트
+        font_name: 본문 폰트 이름. None이면 Helvetica를 사용합니다.
+
+    Returns:
+        페이지 번호 순서로 정렬된 flowable 목록
+    """
+    from reportlab.platypus import Paragraph, Spacer
+
+    heading_style, body_style = paragraph_styles(font_name)
+    story = []
+    for page_num, text in sorted(translated_results):
+        # 페이지 번호 추가
+        story.append(Paragraph(f"=== 페이지 {page_num} ===", heading_style))
+        story.extend(text_flowables(text, body_style))
+        # 페이지 구분을 위한 간격 추가
+        story.append(Spacer(1, PAGE_GAP))
+    return story
+
+def _build_pdf(translated_results: List[Tuple[int, str]], path: str, font_name: Optional[str]):
+    """번역 결과로 PDF 파일 하나를 빌드합니다."""
+    from reportlab.lib.pagesizes import letter
+    from reportlab.platypus import SimpleDocTemplate
+
+    doc = SimpleDocTemplate(path, pagesize=letter)
+    doc.build(build_story(translated_results, font_name))
+
+def _build_shard(translated_results: List[Tuple[int, str]], path: str, font_name: Optional[str]) -> str:
+    """
+    PDF 작성 워커 프로세스에서 실행되는 함수입니다.
+
+    부모 프로세스가 사용한 폰트를 이 프로세스에도 등록한 뒤 페이지 범위 하나를 빌드합니다.
+
+    Args:
+        translated_results: 이 조각에 들어갈 (페이지 번호, 번역된 텍스트) 튜플의 리스트
+        path: 조각 PDF 파일 경로
+        font_name: 부모 프로세스에서 등록한 폰트 이름
+
+    Returns:
+        조각 PDF 파일 경로
+    """
+    if font_name:
+        # 폰트 감지 결과는 부모 프로세스에서 이미 출력했으므로 워커에서는 다시 출력하지 않음
+        with contextlib.redirect_stdout(io.StringIO()):
+            ensure_korean_font()
+    _build_pdf(translated_results, path, font_name)
+    return path
+
+def split_shards(translated_results: List[Tuple[int, str]], shard_count: int) -> List[List[Tuple[int, str]]]:
+    """
+    페이지 번호 순서로 정렬한 번역 결과를 글자 수가 비슷한 연속 범위로 나눕니다.
+
+    Args:
+        translated_results: (페이지 번호, 번역된 텍스트) 튜플의 리스트
+        shard_count: 나눌 조각 수
+
+    Returns:
+        비어 있지 않은 조각 목록
+    """
+    results = sorted(translated_results)
+    total = sum(len(text) + 1 for _, text in results)
+    shards: List[List[Tuple[int, str]]] = [[]]
+    size = 0
+    for page_num, text in results:
+        # 현재 조각이 몫을 채웠으면 다음 조각 시작
+        if shards[-1] and size >= total * len(shards) / shard_count and len(shards) < shard_count:
+            shards.append([])
+        shards[-1].append((page_num, text))
+        size += len(text) + 1
+    return shards
+
+def merge_pdfs(paths: List[str], output_path: str):
+    """
+    PDF 파일들을 순서대로 이어 붙여 하나의 파일로 저장합니다.
+
+    Args:
+        paths: 이어 붙일 PDF 파일 경로 목록
+        output_path: 저장할 PDF 파일 경로
+    """
+    import fitz  # PyMuPDF
+
+    with fitz.open() as merged:
+        for path in paths:
+            with fitz.open(path) as shard:
+                merged.insert_pdf(shard)
+        merged.save(output_path, deflate=True)
+
+def _build_pdf_parallel(translated_results: List[Tuple[int, str]], path: str, font_name: Optional[str],
+                        workers: int):
+    """
+    페이지 범위를 프로세스 풀에서 조각 PDF로 빌드한 뒤 하나로 합칩니다.
+
+    조각마다 새 출력 페이지에서 시작하므로 조각 경계에서만 페이지 나눔이 순차 빌드와 달라집니다.
+    """
+    shards = split_shards(translated_results, workers)
+    shard_paths = [f"{path}.{index}" for index in range(len(shards))]
+    # 번역 스레드가 실행 중인 프로세스를 fork하지 않도록 spawn 방식 사용
+    executor = ProcessPoolExecutor(max_workers=len(shards), mp_context=multiprocessing.get_context("spawn"))
+    try:
+        futures = [
+            executor.submit(_build_shard, shard, shard_path, font_name)
+            for shard, shard_path in zip(shards, shard_paths)
+        ]
+        merge_pdfs([future.result() for future in futures], path)
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+        for shard_path in shard_paths:
+            if os.path.exists(shard_path):
+                os.remove(shard_path)
+
+def write_translated_pdf(translated_results: List[Tuple[int, str]], output_path: str, workers: int = 1):
+    """
+    번역 결과를 PDF 파일로 저장합니다.
+
+    workers가 2 이상이고 페이지가 PDF_SHARD_MIN_PAGES의 2배 이상이면 페이지 범위를 나누어 여러
+    프로세스에서 빌드한 뒤 합칩니다. 프로세스 수는 CPU 코어 수를 넘지 않습니다.
+    빌드 중 오류가 발생하면 그때까지 기록된 내용을 출력 경로에 남기고 예외를 다시 발생시킵니다.
+
+    Args:
+        translated_results: (페이지 번호, 번역된 텍스트) 튜플의 리스트
+        output_path: 저장할 PDF 파일 경로
+        workers: PDF 빌드에 사용할 프로세스 수 (기본값: 1, 현재 프로세스에서 빌드)
+    """
+    font_name = ensure_korean_font()
+    # 출력 파일과 같은 디렉터리의 임시 파일에 직접 기록한 뒤 교체하여, 완성되지 않은 PDF가
+    # 출력 경로에 보이지 않게 하고 문서 전체를 메모리 버퍼에 한 번 더 복사하지 않음
+    # (mkstemp는 권한을 0600으로 만들므로 일반 파일처럼 umask를 따르도록 이름만 정함)
+    temp_path = f"{output_path}.{os.getpid()}.tmp"
+    shard_count = min(workers, os.cpu_count() or 1, len(translated_results) // PDF_SHARD_MIN_PAGES)
+
+    # PDF 빌드
+    try:
+        if shard_count > 1:
+            _build_pdf_parallel(translated_results, temp_path, font_name, shard_count)
+        else:
+            _build_pdf(translated_results, temp_path, font_name)
+    except Exception as e:
+        print(f"PDF 빌드 중 오류 발생: {e}")
+        print(f"폰트 설정: {font_name or 'Helvetica'}")
+        # 오류 발생해도 임시 파일에 부분적으로 쓰여진 내용이 있을 수 있음
+        if os.path.exists(temp_path):
+            os.replace(temp_path, output_path)
+        else:
+            open(output_path, 'wb').close()
+        print(f"오류에도 불구하고 부분적인 PDF를 저장했습니다: {output_path}")
+        raise
+    except BaseException:
+        # 중단된 경우 임시 파일을 남기지 않음
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+    # 완성된 PDF로 원자적으로 교체
+    os.replace(temp_path, output_path)
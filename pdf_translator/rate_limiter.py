@@ -0,0 +1,118 @@
+"""
+요청 속도 제한 모듈
+
+분당 요청 수와 분당 토큰 수 할당량을 토큰 버킷으로 관리합니다.
+여러 스레드나 코루틴이 하나의 RateLimiter를 공유하면 전체 처리량이
+할당량 상한에 맞춰지므로 요청이 몰렸다가 429 오류가 연달아 발생하는 상황을 막을 수 있습니다.
+"""
+
+import time
+import asyncio
+import threading
+from typing import Optional
+
+# 버킷 용량을 몇 초 분량의 할당량으로 둘지. 용량이 작아야 시작 직후에도 요청이 한꺼번에 몰리지 않고
+# 할당량 속도에 맞춰 고르게 나갑니다.
+DEFAULT_BURST_SECONDS = 2.0
+
+class TokenBucket:
+    """
+    일정한 속도로 채워지는 토큰 버킷 클래스
+
+    잔량이 부족해도 먼저 예약하고 음수가 된 만큼 기다리게 하므로,
+    먼저 요청한 호출자가 먼저 순서를 얻습니다.
+    """
+
+    def __init__(self, capacity: float, refill_per_second: float):
+        """
+        TokenBucket 초기화
+
+        Args:
+            capacity: 버킷 용량 (한 번에 허용되는 최대 사용량)
+            refill_per_second: 초당 채워지는 양
+        """
+        self.capacity = capacity
+        self.refill_per_second = refill_per_second
+        self.level = capacity
+        self.updated_at = time.monotonic()
+
+    def reserve(self, amount: float, now: float) -> float:
+        """
+        amount만큼 예약하고 사용 가능해질 때까지 기다려야 하는 시간을 반환합니다.
+
+        Args:
+            amount: 사용할 양. 용량보다 크면 부족한 만큼 채워질 때까지 기다립니다.
+            now: 현재 시각 (time.monotonic 기준)
+
+        Returns:
+            대기 시간 (초)
+        """
+        self.level = min(self.capacity, self.level + (now - self.updated_at) * self.refill_per_second)
+        self.updated_at = now
+        self.level -= amount
+        if self.level >= 0:
+            return 0.0
+        return -self.level / self.refill_per_second
+
+class RateLimiter:
+    """
+    분당 요청 수와 분당 토큰 수를 함께 제한하는 클래스
+
+    스레드와 코루틴에서 모두 사용할 수 있습니다.
+    """
+
+    def __init__(self, requests_per_minute: int, tokens_per_minute: Optional[int] = None,
+                 burst_seconds: float = DEFAULT_BURST_SECONDS):
+        """
+        RateLimiter 초기화
+
+        Args:
+            requests_per_minute: 분당 최대 요청 수
+            tokens_per_minute: 분당 최대 입력 토큰 수. 제공되지 않으면 토큰 수는 제한하지 않습니다.
+            burst_seconds: 쉬지 않고 바로 보낼 수 있는 양을 몇 초 분량의 할당량으로 할지 (기본값: 2초).
+                요청 수 버킷은 최소 1개를 허용합니다.
+        """
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.burst_seconds = burst_seconds
+        self._requests = self._make_bucket(requests_per_minute, burst_seconds)
+        self._tokens = self._make_bucket(tokens_per_minute, burst_seconds) if tokens_per_minute else None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _make_bucket(per_minute: int, burst_seconds: float) -> TokenBucket:
+        """분당 할당량을 burst_seconds 분량의 용량을 가진 버킷으로 만듭니다."""
+        refill_per_second = per_minute / 60.0
+        return TokenBucket(max(1.0, refill_per_second * burst_seconds), refill_per_second)
+
+    def _reserve(self, tokens: int) -> float:
+        """요청 하나와 tokens만큼의 토큰을 예약하고 대기 시간을 반환합니다."""
+        with self._lock:
+            now = time.monotonic()
+            wait = self._requests.reserve(1, now)
+            if self._tokens is not None:
+                # 분당 할당량보다 큰 요청도 1분 이상 기다리지 않도록 제한
+                wait = max(wait, self._tokens.reserve(min(tokens, self.tokens_per_minute), now))
+            return wait
+
+    def acquire(self, tokens: int = 0):
+        """
+        요청을 보낼 수 있을 때까지 현재 스레드를 대기시킵니다.
+
+        Args:
+            tokens: 요청의 예상 입력 토큰 수
+        """
+        wait = self._reserve(tokens)
+        if wait > 0:
+            time.sleep(wait)
+
+    async def aacquire(self, tokens: int = 0):
+        """
+        acquire의 비동기 버전입니다. 대기하는 동안 이벤트 루프를 막지 않습니다.
+
+        Args:
+            tokens: 요청의 예상 입력 토큰 수
+        """
+        wait = self._reserve(tokens)
+        if wait > 0:
+            await asyncio.sleep(wait)
@@ -0,0 +1,187 @@
+"""
+재시도 정책 모듈
+
+Gemini API 호출이 일시적인 오류(429, 503 등)나 빈 응답으로 실패했을 때
+지터가 적용된 지수 백오프로 다시 시도하는 정책을 제공합니다.
+텍스트 번역과 이미지 번역, 동기와 비동기 호출이 같은 정책을 공유합니다.
+"""
+
+import re
+import time
+import random
+import asyncio
+from typing import Awaitable, Callable, Optional, TypeVar
+
+R = TypeVar("R")
+
+# 재시도할 HTTP 상태 코드 (요청 시간 초과, 요청 한도 초과, 서버 오류)
+RETRYABLE_STATUS_CODES = {408, 429, 500, 502, 503, 504}
+
+# "Please retry in 12.5s" 형태의 안내 문구
+_RETRY_IN_PATTERN = re.compile(r"retry in ([0-9.]+)\s*s", re.IGNORECASE)
+
+def _transport_errors() -> tuple:
+    """
+    연결 끊김과 시간 초과를 나타내는 전송 계층 예외 타입을 반환합니다.
+
+    --base-url로 연결할 때 쓰는 REST 전송 방식은 requests 예외를 그대로 전달하는데,
+    이 예외들은 내장 ConnectionError/TimeoutError를 상속하지 않습니다.
+    requests는 처음 필요할 때 불러옵니다.
+    """
+    try:
+        import requests
+    except ImportError:
+        return (ConnectionError, TimeoutError)
+    return (ConnectionError, TimeoutError, requests.exceptions.ConnectionError, requests.exceptions.Timeout)
+
+class EmptyResponseError(ValueError):
+    """API 응답에 번역된 텍스트가 없을 때 발생하는 예외"""
+
+class RetryPolicy:
+    """
+    API 호출 재시도 정책 클래스
+    """
+
+    def __init__(self, max_attempts: int = 5, base_delay: float = 1.0, max_delay: float = 60.0, jitter: float = 0.5):
+        """
+        RetryPolicy 초기화
+
+        Args:
+            max_attempts: 첫 시도를 포함한 최대 시도 횟수
+            base_delay: 첫 재시도 전 대기 시간 (초)
+            max_delay: 재시도 간 최대 대기 시간 (초)
+            jitter: 대기 시간에 더할 무작위 비율 (0이면 지터 없음)
+        """
+        self.max_attempts = max(1, max_attempts)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.jitter = jitter
+
+    @staticmethod
+    def is_retryable(error: BaseException) -> bool:
+        """
+        다시 시도할 수 있는 오류인지 판단합니다.
+
+        인증 실패, 잘못된 요청, 존재하지 않는 모델 등은 다시 시도해도 같은 결과이므로
+        즉시 실패로 처리합니다.
+
+        Args:
+            error: 발생한 예외
+
+        Returns:
+            재시도 가능 여부
+        """
+        if isinstance(error, EmptyResponseError) or isinstance(error, _transport_errors()):
+            return True
+
+        # google.api_core 예외는 HTTP 상태 코드를 code 속성으로 제공합니다
+        code = getattr(error, "code", None)
+        if isinstance(code, int):
+            return code in RETRYABLE_STATUS_CODES
+        return False
+
+    @staticmethod
+    def get_retry_after(error: BaseException) -> Optional[float]:
+        """
+        오류에 포함된 재시도 대기 시간 안내를 읽습니다.
+
+        Retry-After 응답 헤더, RetryInfo 오류 상세, 오류 메시지의 "retry in Ns" 문구를
+        차례로 확인합니다.
+
+        Args:
+            error: 발생한 예외
+
+        Returns:
+            대기 시간 (초). 안내가 없으면 None
+        """
+        retry_after = getattr(error, "retry_after", None)
+        if isinstance(retry_after, (int, float)):
+            return float(retry_after)
+
+        response = getattr(error, "response", None)
+        headers = getattr(response, "headers", None)
+        if headers:
+            value = headers.get("Retry-After") or headers.get("retry-after")
+            try:
+                if value is not None:
+                    return float(value)
+            except (TypeError, ValueError):
+                pass
+
+        for detail in getattr(error, "details", None) or []:
+            retry_delay = getattr(detail, "retry_delay", None)
+            if retry_delay is not None:
+                return retry_delay.seconds + retry_delay.nanos / 1e9
+
+        match = _RETRY_IN_PATTERN.search(str(error))
+        if match:
+            return float(match.group(1))
+        return None
+
+    def get_delay(self, attempt: int, error: BaseException) -> float:
+        """
+        다음 재시도 전 대기 시간을 계산합니다.
+
+        Args:
+            attempt: 실패한 시도 번호 (1부터 시작)
+            error: 발생한 예외
+
+        Returns:
+            대기 시간 (초)
+        """
+        delay = self.base_delay * (2 ** (attempt - 1))
+        # 지터를 더한 뒤에 상한을 적용하여 max_delay를 넘지 않게 함
+        delay = min(self.max_delay, delay + delay * self.jitter * random.random())
+
+        # 서버가 알려준 대기 시간보다 일찍 재시도하지 않음
+        retry_after = self.get_retry_after(error)
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+        return delay
+
+    def _should_retry(self, attempt: int, error: BaseException) -> bool:
+        """재시도 여부를 결정하고 재시도할 경우 안내를 출력합니다."""
+        if attempt >= self.max_attempts or not self.is_retryable(error):
+            return False
+        print(f"API 호출 실패 ({attempt}/{self.max_attempts}): {error}. 재시도합니다...")
+        return True
+
+    def call(self, func: Callable[[], R]) -> R:
+        """
+        정책에 따라 func를 호출하고 일시적인 오류가 발생하면 다시 시도합니다.
+
+        Args:
+            func: 호출할 함수
+
+        Returns:
+            func의 반환값
+        """
+        attempt = 1
+        while True:
+            try:
+                return func()
+            except Exception as e:
+                if not self._should_retry(attempt, e):
+                    raise
+                time.sleep(self.get_delay(attempt, e))
+                attempt += 1
+
+    async def acall(self, func: Callable[[], Awaitable[R]]) -> R:
+        """
+        call의 비동기 버전입니다. 대기하는 동안 이벤트 루프를 막지 않습니다.
+
+        Args:
+            func: 호출할 코루틴 함수
+
+        Returns:
+            func의 반환값
+        """
+        attempt = 1
+        while True:
+            try:
+                return await func()
+            except Exception as e:
+                if not self._should_retry(attempt, e):
+                    raise
+                await asyncio.sleep(self.get_delay(attempt, e))
+                attempt += 1
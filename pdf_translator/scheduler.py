@@ -0,0 +1,374 @@
+"""
+문서 간 페이지 스케줄러 모듈
+
+여러 문서의 (문서, 페이지) 작업을 하나의 우선순위 큐로 모아 공유 스레드 풀에서 번역합니다.
+문서를 하나씩 끝까지 번역하면 문서의 마지막 페이지들을 기다리는 동안 워커가 놀게 되지만,
+스케줄러는 다음 문서의 페이지를 바로 채워 넣어 워커를 계속 바쁘게 유지합니다.
+우선순위는 짧은 문서 우선이나 마감 시각 우선으로 정할 수 있어, 작은 문서가 수백 페이지짜리
+문서 뒤에서 기다리지 않습니다.
+"""
+
+import heapq
+import math
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+from tqdm import tqdm
+from .chunking import ChunkAssembler
+from .output_writer import OrderedTextWriter
+
+# 스케줄링 정책: 짧은 문서 우선, 마감 시각 우선, 추가한 순서
+SCHEDULING_POLICIES = ("shortest", "deadline", "fifo")
+
+class DocumentJob:
+    """
+    스케줄러가 관리하는 문서 하나의 번역 작업
+
+    페이지 콘텐츠는 처음 필요할 때 문서를 열어 필요한 만큼만 생성하고,
+    모든 페이지의 번역이 끝나면 결과 파일을 기록합니다.
+    긴 텍스트 페이지는 조각마다 별도 작업으로 제출하고, 마지막 조각이 끝나면 합칩니다.
+    """
+
+    def __init__(self, pdf_processor: Any, pdf_path: str, output_path: str, target_language: str,
+                 text_only: bool = False, hybrid: bool = False, resume: bool = False,
+                 deadline: Optional[float] = None, index: int = 0):
+        """
+        DocumentJob 초기화
+
+        Args:
+            pdf_processor: 페이지 추출과 결과 저장에 사용할 PDFProcessor
+            pdf_path: PDF 파일 경로
+            output_path: 번역 결과 출력 파일 경로
+            target_language: 번역할 대상 언어
+            text_only: 텍스트 전용 모드 사용 여부
+            hybrid: 하이브리드 모드 사용 여부
+            resume: 체크포인트에서 이어서 번역할지 여부
+            deadline: 마감 시각 (time.time() 기준 초). deadline 정책에서 사용합니다.
+            index: 추가된 순서
+        """
+        self.pdf_processor = pdf_processor
+        self.pdf_path = pdf_path
+        self.output_path = output_path
+        self.target_language = target_language
+        self.text_only = text_only
+        self.hybrid = hybrid
+        self.resume = resume
+        self.deadline = deadline
+        self.index = index
+
+        self.page_count = 0
+        self.resumed_pages = 0
+        self.status = "pending"
+        self.error: Optional[str] = None
+        self.pending = 0
+        self.submitted = 0
+        self.extra_chunks = 0
+        self.exhausted = False
+        self.results: List[Tuple] = []
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+
+        self._items: Optional[Iterator[Tuple[int, str, Union[str, bytes], int, int]]] = None
+        self._sources: Dict[int, str] = {}
+        self._assembler = ChunkAssembler()
+        self._document = None
+        self._writer: Optional[OrderedTextWriter] = None
+        self._checkpoint = None
+        self._completed: Dict[int, Dict[str, str]] = {}
+
+    @property
+    def mode(self) -> str:
+        """체크포인트 헤더에 기록할 번역 모드"""
+        if self.text_only:
+            return "text"
+        return "hybrid" if self.hybrid else "multimodal"
+
+    def priority(self, policy: str) -> Tuple:
+        """정책에 따른 우선순위 키를 반환합니다. 작은 값이 먼저 처리됩니다."""
+        if policy == "shortest":
+            return (self.page_count, self.index)
+        if policy == "deadline":
+            deadline = self.deadline if self.deadline is not None else math.inf
+            return (deadline, self.page_count, self.index)
+        return (self.index,)
+
+    def _open(self):
+        """문서와 체크포인트를 열고 페이지 콘텐츠 이터레이터를 준비합니다."""
+        processor = self.pdf_processor
+        self.started_at = time.monotonic()
+        self._checkpoint, self._completed = processor.open_checkpoint(
+            self.pdf_path, self.output_path, self.mode, self.target_language, self.resume
+        )
+        skip_pages = set(self._completed)
+        self.resumed_pages = len(skip_pages)
+        if self.text_only:
+            # 텍스트 출력은 완료된 페이지를 순서대로 바로 기록하고 메모리에 모아 두지 않음
+            text_pages = processor.extract_text_from_pdf(self.pdf_path)
+            self._writer = OrderedTextWriter(self.output_path, [page_num for page_num, _ in text_pages])
+            for page_num, record in sorted(self._completed.items()):
+                self._writer.add(page_num, record.get("source", ""), record["translated"])
+            self._sources = dict(text_pages)
+            pages = ((page_num, "text", text) for page_num, text in text_pages if page_num not in skip_pages)
+        else:
+            self._document = processor.open_document(self.pdf_path)
+            pages = processor.iter_page_contents(self._document, self.hybrid, skip_pages)
+        self._items = processor.iter_page_requests(pages)
+        self.status = "running"
+
+    def next_item(self) -> Optional[Tuple[int, str, Union[str, bytes], int, int]]:
+        """
+        다음 번역 요청을 반환합니다. 문서를 여는 중이거나 렌더링 중 오류가 발생하면
+        작업을 실패로 표시합니다.
+
+        Returns:
+            (페이지 번호, 종류, 콘텐츠, 조각 번호, 조각 수) 튜플. 더 이상 없으면 None
+        """
+        if self.exhausted:
+            return None
+        try:
+            if self._items is None:
+                self._open()
+            item = next(self._items)
+            if item[3] == 0:
+                # 긴 페이지는 조각 수만큼 진행률 대상에 더함
+                self.extra_chunks += item[4] - 1
+            return item
+        except StopIteration:
+            self.exhausted = True
+        except Exception as e:
+            self.fail(e)
+        return None
+
+    def translate(self, item: Tuple[int, str, Union[str, bytes], int, int]) -> Tuple[int, int, int, str]:
+        """워커 스레드에서 번역 요청 하나를 번역합니다."""
+        page_num, kind, content, index, count = item
+        return page_num, index, count, self.pdf_processor.translate_content(kind, content, self.target_language)
+
+    def collect(self, future: Future):
+        """
+        완료된 번역 요청의 결과를 모으고, 페이지의 모든 조각이 끝나면 체크포인트와 결과에 기록합니다.
+        이미 실패한 작업의 결과는 버립니다.
+        """
+        self.pending -= 1
+        if self.status == "failed":
+            return
+        try:
+            page_num, index, count, chunk = future.result()
+            translated = self._assembler.add(page_num, index, count, chunk)
+            if translated is None:
+                return
+            if self._writer:
+                source = self._sources[page_num]
+                if self._checkpoint:
+                    self._checkpoint.record(page_num, translated, source=source)
+                self._writer.add(page_num, source, translated)
+            else:
+                if self._checkpoint:
+                    self._checkpoint.record(page_num, translated)
+                self.results.append((page_num, translated))
+        except Exception as e:
+            self.fail(e)
+            return
+        self.pdf_processor.count_page()
+
+    def fail(self, error: BaseException):
+        """작업을 실패로 표시합니다. 체크포인트는 이어서 번역할 수 있도록 남겨 둡니다."""
+        if self.status != "failed":
+            print(f"오류: {self.pdf_path} 번역 실패: {error}")
+        self.status = "failed"
+        self.error = str(error)
+        self.exhausted = True
+
+    @property
+    def scheduled_pages(self) -> int:
+        """
+        진행률에 포함할 번역 요청 수. 체크포인트로 건너뛴 페이지는 빼고 긴 페이지의 조각은 더하며,
+        모든 페이지를 꺼낸 뒤에는 실제로 제출한 요청 수를 사용하여 빈 페이지나 실패로 남은 페이지를
+        제외합니다.
+        """
+        if self.exhausted:
+            return self.submitted
+        return max(0, self.page_count - self.resumed_pages) + self.extra_chunks
+
+    @property
+    def done(self) -> bool:
+        """모든 페이지를 꺼냈고 진행 중인 번역이 없으면 True"""
+        return self.exhausted and self.pending == 0
+
+    def finish(self):
+        """번역 결과를 파일로 저장하고 문서와 체크포인트를 닫습니다."""
+        if self.finished_at is not None:
+            return
+        try:
+            if self.status != "failed":
+                self._write_output()
+                self.status = "ok"
+        except Exception as e:
+            self.fail(e)
+        finally:
+            self.close()
+            self.finished_at = time.monotonic()
+
+    def _write_output(self):
+        """체크포인트의 완료된 페이지와 새 결과를 합쳐 출력 파일을 기록합니다."""
+        processor = self.pdf_processor
+        if self.text_only:
+            self._writer.close()
+            print(f"번역 결과가 저장되었습니다: {self.output_path}")
+        else:
+            results = sorted(self.results + [
+                (page_num, record["translated"]) for page_num, record in self._completed.items()
+            ])
+            processor.save_translated_pdf(results, self.output_path)
+            print(f"번역된 PDF가 저장되었습니다: {self.output_path}")
+        if self._checkpoint:
+            self._checkpoint.remove()
+            self._checkpoint = None
+
+    def close(self):
+        """열린 문서와 체크포인트를 닫습니다."""
+        if self._items is not None and hasattr(self._items, "close"):
+            self._items.close()
+        if self._document is not None:
+            self._document.close()
+            self._document = None
+        if self._writer:
+            self._writer.close()
+        if self._checkpoint:
+            self._checkpoint.close()
+
+    @property
+    def seconds(self) -> float:
+        """처음 페이지를 꺼낸 시점부터 결과를 저장할 때까지 걸린 시간 (초)"""
+        if self.started_at is None or self.finished_at is None:
+            return 0.0
+        return self.finished_at - self.started_at
+
+class PageScheduler:
+    """
+    여러 문서의 페이지 번역을 하나의 우선순위 큐로 스케줄링하는 클래스
+    """
+
+    def __init__(self, pdf_processor: Any, target_language: str = "한국어", text_only: bool = False,
+                 hybrid: bool = False, resume: bool = False, policy: str = "shortest"):
+        """
+        PageScheduler 초기화
+
+        Args:
+            pdf_processor: 모든 문서에 공유할 PDFProcessor. max_workers만큼 동시에 번역합니다.
+            target_language: 번역할 대상 언어
+            text_only: 텍스트 전용 모드 사용 여부
+            hybrid: 하이브리드 모드 사용 여부
+            resume: 체크포인트에서 이어서 번역할지 여부
+            policy: 스케줄링 정책 ("shortest", "deadline", "fifo")
+        """
+        if policy not in SCHEDULING_POLICIES:
+            raise ValueError(f"지원되지 않는 스케줄링 정책입니다: {policy} (사용 가능: {', '.join(SCHEDULING_POLICIES)})")
+        self.pdf_processor = pdf_processor
+        self.target_language = target_language
+        self.text_only = text_only
+        self.hybrid = hybrid
+        self.resume = resume
+        self.policy = policy
+        self.jobs: List[DocumentJob] = []
+
+    def add(self, pdf_path: str, output_path: str, deadline: Optional[float] = None) -> DocumentJob:
+        """
+        번역할 문서를 추가합니다. 문서는 run이 호출되고 차례가 올 때 열립니다.
+
+        Args:
+            pdf_path: PDF 파일 경로
+            output_path: 번역 결과 출력 파일 경로
+            deadline: 마감 시각 (time.time() 기준 초)
+
+        Returns:
+            추가된 작업
+        """
+        job = DocumentJob(
+            self.pdf_processor, pdf_path, output_path, self.target_language,
+            text_only=self.text_only, hybrid=self.hybrid, resume=self.resume,
+            deadline=deadline, index=len(self.jobs)
+        )
+        try:
+            job.page_count = self.pdf_processor.get_page_count(pdf_path)
+        except Exception as e:
+            job.fail(e)
+        self.jobs.append(job)
+        return job
+
+    def _progress_total(self) -> int:
+        """모든 작업의 진행률 대상 페이지 수 합계"""
+        return sum(job.scheduled_pages for job in self.jobs)
+
+    def _refresh_progress_total(self, progress: Any):
+        """작업 상태가 바뀐 뒤 진행률 막대의 전체 값을 다시 계산합니다."""
+        total = self._progress_total()
+        if progress.total != total:
+            progress.total = total
+            progress.refresh()
+
+    def run(self) -> List[DocumentJob]:
+        """
+        추가된 모든 문서를 번역합니다.
+
+        동시에 진행 중인 페이지 번역은 max_workers의 2배로 제한하여, 렌더링된 페이지가
+        메모리에 쌓이지 않게 하고 열린 문서 수도 작게 유지합니다.
+
+        Returns:
+            추가한 순서대로 정렬된 작업 목록
+        """
+        processor = self.pdf_processor
+        window = processor.max_workers * 2
+        own_executor = processor.executor is None
+        executor = ThreadPoolExecutor(max_workers=processor.max_workers) if own_executor else processor.executor
+
+        queue = [(job.priority(self.policy), job.index) for job in self.jobs if not job.exhausted]
+        heapq.heapify(queue)
+        for job in self.jobs:
+            if job.exhausted:
+                job.finish()
+
+        in_flight: Dict[Future, DocumentJob] = {}
+        progress = tqdm(total=self._progress_total(), desc="번역 중")
+        try:
+            while queue or in_flight:
+                # 우선순위가 가장 높은 문서부터 창이 찰 때까지 페이지를 꺼내 제출
+                while queue and len(in_flight) < window:
+                    job = self.jobs[queue[0][1]]
+                    opening = job.status == "pending"
+                    item = job.next_item()
+                    if opening or item is None or item[3] == 0 and item[4] > 1:
+                        # 건너뛴 페이지와 번역하지 않을 페이지를 빼고 긴 페이지의 조각을 더함
+                        self._refresh_progress_total(progress)
+                    if item is None:
+                        heapq.heappop(queue)
+                        if job.done:
+                            job.finish()
+                        continue
+                    job.pending += 1
+                    job.submitted += 1
+                    in_flight[executor.submit(job.translate, item)] = job
+
+                if not in_flight:
+                    continue
+
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    job = in_flight.pop(future)
+                    failed = job.status == "failed"
+                    job.collect(future)
+                    progress.update(1)
+                    if not failed and job.status == "failed":
+                        self._refresh_progress_total(progress)
+                    if job.done:
+                        job.finish()
+        finally:
+            progress.close()
+            for future in in_flight:
+                future.cancel()
+            for job in self.jobs:
+                job.close()
+            if own_executor:
+                executor.shutdown(wait=True)
+
+        return self.jobs
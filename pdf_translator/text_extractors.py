@@ -0,0 +1,73 @@
+"""
+PDF 텍스트 추출 백엔드 모듈
+
+페이지별 텍스트 추출 방식을 선택할 수 있도록 백엔드 함수를 이름으로 등록합니다.
+기본 백엔드는 렌더링에도 사용하는 PyMuPDF(fitz)이며, C로 구현되어 PyPDF2보다 훨씬 빠르고
+이미 열려 있는 문서를 그대로 사용할 수 있습니다.
+"""
+
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+import fitz  # PyMuPDF
+
+DEFAULT_TEXT_BACKEND = "pymupdf"
+
+def extract_page_texts_pymupdf(pdf_path: str, pdf_document: Optional[Any] = None) -> Iterator[Tuple[int, str]]:
+    """
+    PyMuPDF로 모든 페이지의 텍스트를 추출합니다.
+
+    Args:
+        pdf_path: PDF 파일 경로
+        pdf_document: 이미 열려 있는 fitz 문서. 제공되면 파일을 다시 파싱하지 않습니다.
+
+    Returns:
+        (페이지 번호, 텍스트) 튜플의 이터레이터 (빈 페이지 포함)
+    """
+    own_document = pdf_document is None
+    if own_document:
+        pdf_document = fitz.open(pdf_path)
+    try:
+        for page_num, page in enumerate(pdf_document):
+            yield page_num + 1, page.get_text("text")
+    finally:
+        if own_document:
+            pdf_document.close()
+
+def extract_page_texts_pypdf2(pdf_path: str, pdf_document: Optional[Any] = None) -> Iterator[Tuple[int, str]]:
+    """
+    PyPDF2로 모든 페이지의 텍스트를 추출합니다.
+
+    Args:
+        pdf_path: PDF 파일 경로
+        pdf_document: 사용하지 않습니다. PyPDF2는 파일을 직접 파싱합니다.
+
+    Returns:
+        (페이지 번호, 텍스트) 튜플의 이터레이터 (빈 페이지 포함)
+    """
+    # PyPDF2는 이 백엔드를 선택한 경우에만 불러옴
+    import PyPDF2
+
+    with open(pdf_path, 'rb') as file:
+        pdf_reader = PyPDF2.PdfReader(file)
+        for page_num, page in enumerate(pdf_reader.pages):
+            yield page_num + 1, page.extract_text() or ""
+
+# 이름으로 선택할 수 있는 텍스트 추출 백엔드
+TEXT_EXTRACTORS: Dict[str, Callable[..., Iterator[Tuple[int, str]]]] = {
+    "pymupdf": extract_page_texts_pymupdf,
+    "pypdf2": extract_page_texts_pypdf2,
+}
+
+def get_text_extractor(name: str) -> Callable[..., Iterator[Tuple[int, str]]]:
+    """
+    이름에 해당하는 텍스트 추출 백엔드를 반환합니다.
+
+    Args:
+        name: 백엔드 이름 ("pymupdf", "pypdf2")
+
+    Returns:
+        추출 함수
+    """
+    try:
+        return TEXT_EXTRACTORS[name]
+    except KeyError:
+        raise ValueError(f"지원되지 않는 텍스트 추출 백엔드입니다: {name} (사용 가능: {', '.join(TEXT_EXTRACTORS)})")
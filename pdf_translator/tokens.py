@@ -0,0 +1,25 @@
+"""
+토큰 수 추정 모듈
+
+API를 호출하지 않고 요청의 대략적인 토큰 수를 계산합니다.
+요청 한도 관리나 요청 분할처럼 정확한 값이 필요하지 않은 곳에서 사용합니다.
+"""
+
+# Gemini가 이미지 한 장에 부과하는 입력 토큰 수
+IMAGE_TOKENS = 258
+
+def estimate_tokens(text: str) -> int:
+    """
+    텍스트의 토큰 수를 추정합니다.
+
+    영문 등 ASCII 문자는 약 4자당 1토큰, 한글·한자 등 그 외 문자는 1자당 약 1토큰으로 계산합니다.
+
+    Args:
+        text: 토큰 수를 추정할 텍스트
+
+    Returns:
+        추정 토큰 수 (최소 1)
+    """
+    ascii_chars = sum(1 for char in text if ord(char) < 128)
+    other_chars = len(text) - ascii_chars
+    return max(1, ascii_chars // 4 + other_chars)
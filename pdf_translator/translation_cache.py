@@ -0,0 +1,160 @@
+"""
+번역 캐시 모듈
+
+번역 결과를 디스크에 저장하여 같은 페이지를 다시 번역할 때 API 호출을 생략합니다.
+캐시 키는 원본 콘텐츠(페이지 이미지 또는 텍스트), 대상 언어, 모델 ID, 프롬프트 버전의
+해시이며, 전체 크기가 제한을 넘으면 가장 오래 사용되지 않은 항목부터 삭제합니다.
+"""
+
+import os
+import hashlib
+import tempfile
+import threading
+from typing import Optional, Union
+
+# 기본 캐시 디렉터리와 최대 크기
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "pdf_translator")
+DEFAULT_MAX_SIZE_BYTES = 1024 * 1024 * 1024  # 1GB
+
+class TranslationCache:
+    """
+    콘텐츠 주소 기반의 디스크 번역 캐시 클래스
+
+    각 항목은 cache_dir/<키 앞 2자리>/<키>.txt 파일로 저장되며, 파일의 수정 시각을
+    마지막 사용 시각으로 사용하여 LRU 방식으로 삭제합니다.
+    """
+
+    def __init__(self, cache_dir: str = DEFAULT_CACHE_DIR, max_size_bytes: int = DEFAULT_MAX_SIZE_BYTES):
+        """
+        TranslationCache 초기화
+
+        Args:
+            cache_dir: 캐시 파일을 저장할 디렉터리
+            max_size_bytes: 캐시의 최대 크기 (바이트)
+        """
+        self.cache_dir = cache_dir
+        self.max_size_bytes = max_size_bytes
+        self._lock = threading.Lock()
+        self._total_size: Optional[int] = None
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    @staticmethod
+    def make_key(content: Union[str, bytes], target_language: str, model_id: str, prompt_version: str) -> str:
+        """
+        캐시 키를 생성합니다.
+
+        Args:
+            content: 번역할 원본 콘텐츠 (텍스트 또는 이미지 데이터)
+            target_language: 번역할 대상 언어
+            model_id: 사용한 모델 ID
+            prompt_version: 프롬프트 버전
+
+        Returns:
+            SHA-256 16진수 문자열
+        """
+        digest = hashlib.sha256()
+        if isinstance(content, str):
+            content = content.encode('utf-8')
+        digest.update(hashlib.sha256(content).digest())
+        for part in (target_language, model_id, prompt_version):
+            digest.update(b"\0")
+            digest.update(part.encode('utf-8'))
+        return digest.hexdigest()
+
+    def _path_for(self, key: str) -> str:
+        """키에 해당하는 캐시 파일 경로를 반환합니다."""
+        return os.path.join(self.cache_dir, key[:2], f"{key}.txt")
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        캐시된 번역 결과를 반환합니다.
+
+        Args:
+            key: make_key로 생성한 캐시 키
+
+        Returns:
+            캐시된 번역 텍스트. 없으면 None
+        """
+        path = self._path_for(key)
+        try:
+            with open(path, 'r', encoding='utf-8') as file:
+                value = file.read()
+        except (FileNotFoundError, UnicodeDecodeError):
+            return None
+
+        # 마지막 사용 시각 갱신 (LRU)
+        try:
+            os.utime(path, None)
+        except OSError:
+            pass
+        return value
+
+    def set(self, key: str, value: str):
+        """
+        번역 결과를 캐시에 저장합니다.
+
+        Args:
+            key: make_key로 생성한 캐시 키
+            value: 번역된 텍스트
+        """
+        path = self._path_for(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        data = value.encode('utf-8')
+
+        # 다른 프로세스가 읽는 중에도 불완전한 파일이 보이지 않도록 원자적으로 교체
+        fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'wb') as file:
+                file.write(data)
+            with self._lock:
+                previous_size = os.path.getsize(path) if os.path.exists(path) else 0
+                os.replace(temp_path, path)
+                if self._total_size is not None:
+                    self._total_size += len(data) - previous_size
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+        self._evict_if_needed()
+
+    def clear(self):
+        """캐시의 모든 항목을 삭제합니다."""
+        with self._lock:
+            for path, _, _ in self._scan():
+                os.remove(path)
+            self._total_size = 0
+
+    def _scan(self):
+        """(경로, 크기, 수정 시각) 튜플의 리스트로 캐시 항목을 반환합니다."""
+        entries = []
+        for root, _, files in os.walk(self.cache_dir):
+            for name in files:
+                if not name.endswith(".txt"):
+                    continue
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                entries.append((path, stat.st_size, stat.st_mtime))
+        return entries
+
+    def _evict_if_needed(self):
+        """캐시 크기가 제한을 넘으면 오래된 항목부터 삭제합니다."""
+        with self._lock:
+            if self._total_size is not None and self._total_size <= self.max_size_bytes:
+                return
+
+            entries = self._scan()
+            total_size = sum(size for _, size, _ in entries)
+            if total_size > self.max_size_bytes:
+                for path, size, _ in sorted(entries, key=lambda entry: entry[2]):
+                    try:
+                        os.remove(path)
+                    except FileNotFoundError:
+                        pass
+                    total_size -= size
+                    if total_size <= self.max_size_bytes:
+                        break
+            self._total_size = total_size
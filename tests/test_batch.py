@@ -0,0 +1,126 @@
+"""
+일괄 번역 모듈 테스트
+"""
+
+import os
+import json
+import tempfile
+import unittest
+from unittest.mock import MagicMock
+from pdf_translator.batch import BatchTranslator, collect_pdf_files, is_batch_input
+
+class TestCollectPdfFiles(unittest.TestCase):
+    """
+    collect_pdf_files 함수를 테스트하는 테스트 케이스
+    """
+
+    def setUp(self):
+        """임시 디렉터리에 PDF 파일 구조 생성"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.root = self.temp_dir.name
+        for relative in ("a.pdf", "b.PDF", "notes.txt", os.path.join("sub", "c.pdf")):
+            path = os.path.join(self.root, relative)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            open(path, 'w').close()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_directory_and_glob(self):
+        """디렉터리는 하위까지 PDF만 찾고, 겹치는 파일은 한 번만 포함하는지 테스트"""
+        files = collect_pdf_files([self.root, os.path.join(self.root, "*.pdf")])
+        names = [os.path.relpath(path, self.root) for path in files]
+        self.assertEqual(names, ["a.pdf", "b.PDF", os.path.join("sub", "c.pdf")])
+
+    def test_manifest(self):
+        """매니페스트의 주석과 빈 줄을 무시하는지 테스트"""
+        manifest = os.path.join(self.root, "manifest.txt")
+        with open(manifest, 'w', encoding='utf-8') as file:
+            file.write(f"# nightly\n\n{os.path.join(self.root, 'a.pdf')}\n{os.path.join(self.root, 'missing.pdf')}\n")
+
+        files = collect_pdf_files([], manifest)
+        self.assertEqual(files, [os.path.join(self.root, "a.pdf"), os.path.join(self.root, "missing.pdf")])
+
+    def test_manifest_deadlines(self):
+        """매니페스트의 마감 시각을 읽는지 테스트"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            manifest = os.path.join(temp_dir, "manifest.txt")
+            with open(manifest, 'w', encoding='utf-8') as file:
+                file.write("urgent.pdf\t2026-01-01T09:00:00+00:00\nlater.pdf\n")
+
+            deadlines = {}
+            files = collect_pdf_files([], manifest, deadlines)
+
+        self.assertEqual(files, ["urgent.pdf", "later.pdf"])
+        self.assertEqual(deadlines, {os.path.abspath("urgent.pdf"): 1767258000.0})
+
+    def test_manifest_invalid_deadline(self):
+        """잘못된 마감 시각이 있는 매니페스트 줄을 알려 주는지 테스트"""
+        manifest = os.path.join(self.root, "manifest.txt")
+        with open(manifest, 'w', encoding='utf-8') as file:
+            file.write("# nightly\nok.pdf\nbad.pdf\tnot-a-date\n")
+
+        with self.assertRaisesRegex(ValueError, "3번째 줄.*not-a-date"):
+            collect_pdf_files([], manifest)
+
+    def test_is_batch_input(self):
+        """단일 파일만 일반 모드로 판단하는지 테스트"""
+        self.assertFalse(is_batch_input(["a.pdf"]))
+        self.assertTrue(is_batch_input(["a.pdf", "b.pdf"]))
+        self.assertTrue(is_batch_input(["docs/*.pdf"]))
+        self.assertTrue(is_batch_input([self.root]))
+        self.assertTrue(is_batch_input([], "manifest.txt"))
+
+class TestBatchTranslator(unittest.TestCase):
+    """
+    BatchTranslator 클래스를 테스트하는 테스트 케이스
+    """
+
+    def test_output_paths_do_not_collide(self):
+        """다른 디렉터리의 같은 이름 파일이 서로 다른 출력 경로를 갖는지 테스트"""
+        translator = BatchTranslator(MagicMock(), output_dir="out")
+        used = set()
+        self.assertEqual(translator.output_path_for("x/report.pdf", used), os.path.join("out", "report_translated.pdf"))
+        self.assertEqual(translator.output_path_for("y/report.pdf", used), os.path.join("out", "report_translated_2.pdf"))
+
+    def test_output_extension_follows_mode(self):
+        """멀티모달/하이브리드 결과는 .pdf, 텍스트 전용 결과만 .txt로 저장하는지 테스트"""
+        for text_only, hybrid, extension in ((False, False, ".pdf"), (False, True, ".pdf"), (True, False, ".txt")):
+            translator = BatchTranslator(MagicMock(), output_dir="out", text_only=text_only, hybrid=hybrid)
+            self.assertEqual(translator.output_path_for("report.pdf", set()), os.path.join("out", f"report_translated{extension}"))
+
+    def test_run_continues_after_failure_and_writes_summary(self):
+        """실패한 파일이 있어도 계속 진행하고 파일별 결과를 요약에 기록하는지 테스트"""
+        processor = MagicMock(executor=None, max_workers=2)
+        processor.get_page_count.return_value = 1
+        processor.open_checkpoint.return_value = (None, {})
+        processor.open_document.side_effect = lambda pdf_path: MagicMock(path=pdf_path)
+        processor.iter_page_contents.side_effect = lambda document, hybrid, skip: iter([(1, "image", document.path)])
+        processor.iter_page_requests.side_effect = lambda pages: ((*page, 0, 1) for page in pages)
+
+        def translate_content(kind, content, target_language):
+            if content == "bad.pdf":
+                raise RuntimeError("boom")
+            return f"translated {content}"
+
+        processor.translate_content.side_effect = translate_content
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            translator = BatchTranslator(processor, output_dir=temp_dir, target_language="English")
+            summary = translator.run(["good.pdf", "bad.pdf", "other.pdf"])
+
+            with open(os.path.join(temp_dir, "batch_summary.json"), encoding='utf-8') as file:
+                self.assertEqual(json.load(file), summary)
+
+            written = {call.args[1]: call.args[0] for call in processor.save_translated_pdf.call_args_list}
+            self.assertEqual(written, {
+                os.path.join(temp_dir, "good_translated.pdf"): [(1, "translated good.pdf")],
+                os.path.join(temp_dir, "other_translated.pdf"): [(1, "translated other.pdf")],
+            })
+
+        self.assertEqual((summary["total"], summary["succeeded"], summary["failed"]), (3, 2, 1))
+        self.assertEqual([result["status"] for result in summary["files"]], ["ok", "failed", "ok"])
+        self.assertEqual(summary["files"][1]["error"], "boom")
+
+if __name__ == "__main__":
+    unittest.main()
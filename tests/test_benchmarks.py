@@ -0,0 +1,69 @@
+"""
+오프라인 벤치마크 패키지 테스트
+"""
+
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+import fitz
+from benchmarks.synthetic import generate_pdf
+from benchmarks.fake_gemini import FakeAPIError, FakeGenerativeModel, install_fake_model
+from benchmarks.run import run_scenario
+from pdf_translator.gemini_client import GeminiClient
+from pdf_translator.retry import RetryPolicy
+
+class TestSyntheticPdf(unittest.TestCase):
+    """
+    합성 PDF 생성을 테스트하는 테스트 케이스
+    """
+
+    def test_generate_kinds(self):
+        """문서 종류에 따라 텍스트 레이어가 있는 페이지와 스캔 페이지를 만드는지 테스트"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            for kind, expected in (("text", [True] * 3), ("scanned", [False] * 3), ("mixed", [True, True, False])):
+                path = generate_pdf(os.path.join(temp_dir, f"{kind}.pdf"), 3, kind)
+                with fitz.open(path) as document:
+                    self.assertEqual([bool(page.get_text().strip()) for page in document], expected)
+
+class TestFakeGenerativeModel(unittest.TestCase):
+    """
+    가짜 Gemini 모델을 테스트하는 테스트 케이스
+    """
+
+    def _client(self, model: FakeGenerativeModel) -> GeminiClient:
+        with patch('google.generativeai.configure'):
+            with patch('google.generativeai.GenerativeModel'):
+                client = GeminiClient(api_key="test_api_key", rate_limit=False,
+                                      retry_policy=RetryPolicy(max_attempts=2, base_delay=0, jitter=0))
+        return install_fake_model(client, model)
+
+    def test_batch_response_splits(self):
+        """묶음 요청의 가짜 응답을 클라이언트가 페이지별로 나눌 수 있는지 테스트"""
+        client = self._client(FakeGenerativeModel())
+        self.assertEqual(client.translate_text_batch(["first", "second"]), ["[번역] first", "[번역] second"])
+
+    def test_errors_are_retried(self):
+        """가짜 모델의 429 오류를 재시도 가능한 오류로 처리하는지 테스트"""
+        model = FakeGenerativeModel(error_rate=1.0, error_code=429)
+        client = self._client(model)
+        with self.assertRaises(FakeAPIError):
+            client.translate_text_only("Hello")
+        self.assertEqual(model.calls, 2)
+
+class TestRunScenario(unittest.TestCase):
+    """
+    벤치마크 시나리오 실행을 테스트하는 테스트 케이스
+    """
+
+    def test_mixed_scenario(self):
+        """혼합 문서를 끝까지 번역하고 단계별 지표와 최대 RSS를 보고하는지 테스트"""
+        result = run_scenario("mixed", pages=3, workers=2, dpi=72)
+        self.assertNotIn("error", result)
+        self.assertEqual(result["metrics"]["pages"], 3)
+        self.assertEqual(result["model_calls"], 3)
+        self.assertTrue({"render", "translate", "pdf_build"} <= set(result["metrics"]["stages"]))
+        self.assertIsNotNone(result["peak_rss_mb"])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,95 @@
+"""
+번역 체크포인트 테스트 모듈
+"""
+
+import os
+import tempfile
+import unittest
+from pdf_translator.checkpoint import TranslationCheckpoint
+
+class TestTranslationCheckpoint(unittest.TestCase):
+    """
+    TranslationCheckpoint 클래스를 테스트하는 테스트 케이스
+    """
+    
+    def setUp(self):
+        """각 테스트 전에 임시 디렉터리 생성"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = TranslationCheckpoint.path_for(os.path.join(self.temp_dir.name, "out.pdf"))
+    
+    def tearDown(self):
+        """임시 디렉터리 삭제"""
+        self.temp_dir.cleanup()
+    
+    def _create(self, target_language="한국어"):
+        return TranslationCheckpoint(self.path, "test.pdf", "multimodal", target_language)
+    
+    def test_record_and_load(self):
+        """기록한 페이지를 다시 읽는 테스트"""
+        checkpoint = self._create()
+        checkpoint.start()
+        checkpoint.record(1, "페이지 1 번역")
+        checkpoint.record(3, "페이지 3 번역", source="Page 3")
+        checkpoint.close()
+        
+        completed = self._create().load()
+        self.assertEqual(set(completed), {1, 3})
+        self.assertEqual(completed[3]["source"], "Page 3")
+    
+    def test_truncated_last_line_is_ignored(self):
+        """기록 도중 중단된 마지막 줄을 건너뛰는 테스트"""
+        checkpoint = self._create()
+        checkpoint.start()
+        checkpoint.record(1, "페이지 1 번역")
+        checkpoint.close()
+        with open(self.path, 'a', encoding='utf-8') as file:
+            file.write('{"page": 2, "transl')
+        
+        self.assertEqual(set(self._create().load()), {1})
+    
+    def test_resume_after_truncated_last_line(self):
+        """중단된 마지막 줄을 잘라내고 이어서 기록하는 테스트"""
+        checkpoint = self._create()
+        checkpoint.start()
+        checkpoint.record(1, "a")
+        checkpoint.record(2, "b")
+        checkpoint.close()
+        with open(self.path, 'a', encoding='utf-8') as file:
+            file.write('{"page": 3, "transl')
+        
+        checkpoint = self._create()
+        self.assertEqual(sorted(checkpoint.start(resume=True)), [1, 2])
+        checkpoint.record(3, "c")
+        checkpoint.record(4, "d")
+        checkpoint.close()
+        
+        completed = self._create().load()
+        self.assertEqual(sorted(completed), [1, 2, 3, 4])
+        self.assertEqual(completed[3]["translated"], "c")
+    
+    def test_mismatched_header_is_ignored(self):
+        """다른 작업의 체크포인트는 무시하는 테스트"""
+        checkpoint = self._create()
+        checkpoint.start()
+        checkpoint.record(1, "페이지 1 번역")
+        checkpoint.close()
+        
+        self.assertEqual(self._create(target_language="일본어").load(), {})
+    
+    def test_start_without_resume_truncates(self):
+        """resume 없이 시작하면 기존 기록을 지우는 테스트"""
+        checkpoint = self._create()
+        checkpoint.start()
+        checkpoint.record(1, "페이지 1 번역")
+        checkpoint.close()
+        
+        checkpoint = self._create()
+        checkpoint.start(resume=False)
+        checkpoint.close()
+        self.assertEqual(self._create().load(), {})
+        
+        checkpoint.remove()
+        self.assertFalse(os.path.exists(self.path))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,59 @@
+"""
+텍스트 분할 모듈 테스트
+"""
+
+import unittest
+from pdf_translator.chunking import ChunkAssembler, split_text, join_chunks
+from pdf_translator.gemini_models import GeminiModel
+from pdf_translator.tokens import estimate_tokens
+
+class TestSplitText(unittest.TestCase):
+    """
+    split_text 함수를 테스트하는 테스트 케이스
+    """
+
+    def test_short_text_is_unchanged(self):
+        """예산 안의 텍스트는 그대로 반환하는지 테스트"""
+        self.assertEqual(split_text("  Short text.\n", 100), ["  Short text.\n"])
+
+    def test_splits_at_paragraph_boundaries(self):
+        """문단 경계에서 나누고 작은 문단은 다시 합치는지 테스트"""
+        paragraphs = ["a" * 80, "b" * 80, "c" * 200]
+        chunks = split_text("\n\n".join(paragraphs), 60)
+        self.assertEqual(chunks, ["a" * 80 + "\n\n" + "b" * 80, "c" * 200])
+
+    def test_splits_long_paragraph_at_sentences(self):
+        """문단이 예산을 넘으면 문장 경계에서 나누는지 테스트"""
+        paragraph = "이것은 첫 번째 문장입니다. 이것은 두 번째 문장입니다. 이것은 세 번째 문장입니다."
+        chunks = split_text(paragraph, 20)
+        self.assertEqual(chunks, ["이것은 첫 번째 문장입니다.", "이것은 두 번째 문장입니다.", "이것은 세 번째 문장입니다."])
+
+    def test_every_chunk_fits_budget(self):
+        """공백 없는 긴 텍스트도 예산을 넘지 않게 나누는지 테스트"""
+        text = "가" * 95 + " short words here. " + "x" * 30
+        chunks = split_text(text, 40)
+        self.assertTrue(all(estimate_tokens(chunk) <= 40 for chunk in chunks))
+        self.assertEqual("".join(chunks).replace(" ", ""), text.replace(" ", ""))
+
+    def test_join_chunks(self):
+        """조각별 번역을 문단 구분으로 합치는지 테스트"""
+        self.assertEqual(join_chunks(["첫째 \n", " 둘째"]), "첫째\n\n둘째")
+
+    def test_chunk_assembler_joins_out_of_order_chunks(self):
+        """조각이 어떤 순서로 도착해도 마지막 조각에서 순서대로 합치는지 테스트"""
+        assembler = ChunkAssembler()
+        self.assertEqual(assembler.add(1, 0, 1, "한 조각"), "한 조각")
+        self.assertIsNone(assembler.add(2, 2, 3, "셋째"))
+        self.assertIsNone(assembler.add(2, 0, 3, "첫째"))
+        self.assertEqual(assembler.add(2, 1, 3, "둘째"), "첫째\n\n둘째\n\n셋째")
+
+    def test_chunk_budget_follows_model_output_limit(self):
+        """모델의 최대 출력 토큰 수에 따라 조각 예산이 정해지는지 테스트"""
+        flash = GeminiModel.get_chunk_token_budget(GeminiModel.GEMINI_1_5_FLASH.value)
+        pro_2_5 = GeminiModel.get_chunk_token_budget(GeminiModel.GEMINI_2_5_PRO_PREVIEW_03_25.value)
+        self.assertEqual(flash, 4096)
+        self.assertGreater(pro_2_5, flash)
+        self.assertEqual(GeminiModel.get_chunk_token_budget("models/unknown"), flash)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,88 @@
+"""
+동시 실행 유틸리티 테스트 모듈
+"""
+
+import asyncio
+import threading
+import time
+import unittest
+from pdf_translator.concurrency import bounded_map, abounded_map
+
+class TestBoundedMap(unittest.TestCase):
+    """
+    bounded_map 함수를 테스트하는 테스트 케이스
+    """
+
+    def test_sequential_preserves_order(self):
+        """워커가 1개일 때 순차 실행 및 순서 유지 테스트"""
+        result = list(bounded_map(lambda x: x * 2, [1, 2, 3]))
+        self.assertEqual(result, [2, 4, 6])
+
+    def test_concurrent_preserves_order(self):
+        """늦게 끝나는 작업이 있어도 입력 순서대로 반환되는지 테스트"""
+        def slow_first(x):
+            time.sleep(0.05 if x == 0 else 0.0)
+            return x
+
+        result = list(bounded_map(slow_first, range(10), max_workers=4))
+        self.assertEqual(result, list(range(10)))
+
+    def test_concurrency_is_bounded(self):
+        """동시에 실행되는 작업 수가 max_workers를 넘지 않는지 테스트"""
+        lock = threading.Lock()
+        active = [0]
+        peak = [0]
+
+        def task(x):
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            time.sleep(0.01)
+            with lock:
+                active[0] -= 1
+            return x
+
+        list(bounded_map(task, range(20), max_workers=3))
+        self.assertLessEqual(peak[0], 3)
+        self.assertGreater(peak[0], 1)
+
+    def test_exception_propagates(self):
+        """작업 중 발생한 예외가 호출자에게 전달되는지 테스트"""
+        def fail_on_two(x):
+            if x == 2:
+                raise RuntimeError("boom")
+            return x
+
+        with self.assertRaises(RuntimeError):
+            list(bounded_map(fail_on_two, range(5), max_workers=2))
+
+class TestAsyncBoundedMap(unittest.TestCase):
+    """
+    abounded_map 함수를 테스트하는 테스트 케이스
+    """
+
+    def test_preserves_order_and_consumes_lazily(self):
+        """순서 유지 및 항목을 필요한 만큼만 소비하는지 테스트"""
+        produced = []
+
+        def items():
+            for i in range(6):
+                produced.append(i)
+                yield i
+
+        async def task(x):
+            await asyncio.sleep(0.01 * (6 - x))
+            return x * 10
+
+        async def run():
+            results = []
+            async for result in abounded_map(task, items(), max_workers=2):
+                # 동시 실행 창 밖의 항목은 아직 생성되지 않아야 함
+                self.assertLessEqual(len(produced) - len(results), 3)
+                results.append(result)
+            return results
+
+        self.assertEqual(asyncio.run(run()), [0, 10, 20, 30, 40, 50])
+
+if __name__ == "__main__":
+    unittest.main()
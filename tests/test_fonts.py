@@ -0,0 +1,71 @@
+"""
+폰트 관리 모듈 테스트
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+import fitz
+import reportlab
+from pdf_translator.fonts import FontManager
+
+# reportlab에 포함된 TrueType 폰트
+TEST_FONT_PATH = os.path.join(os.path.dirname(reportlab.__file__), "fonts", "Vera.ttf")
+
+class TestFontManager(unittest.TestCase):
+    """
+    FontManager 클래스를 테스트하는 테스트 케이스
+    """
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cache_dir = os.path.join(self.temp_dir.name, "fonts")
+        self.font_path = os.path.join(self.temp_dir.name, "Test.ttf")
+        shutil.copy(TEST_FONT_PATH, self.font_path)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_cached_metrics_skip_parsing(self):
+        """두 번째로 불러올 때 캐시된 메트릭을 사용하여 파싱하지 않는지 테스트"""
+        manager = FontManager(self.cache_dir)
+        parsed = manager.load_font("TestFont", self.font_path)
+        self.assertEqual(len(os.listdir(self.cache_dir)), 1)
+
+        with patch('reportlab.pdfbase.ttfonts.TTFontFile.extractInfo') as mock_extract:
+            cached = FontManager(self.cache_dir).load_font("TestFont", self.font_path)
+            mock_extract.assert_not_called()
+
+        self.assertEqual(cached.face.charWidths, parsed.face.charWidths)
+        self.assertEqual(cached.stringWidth("Hello", 10), parsed.stringWidth("Hello", 10))
+
+    def test_modified_font_is_parsed_again(self):
+        """폰트 파일의 수정 시각이 바뀌면 새 캐시 키를 사용하는지 테스트"""
+        manager = FontManager(self.cache_dir)
+        key = manager.cache_key(self.font_path)
+        stat = os.stat(self.font_path)
+        os.utime(self.font_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        self.assertNotEqual(manager.cache_key(self.font_path), key)
+
+    def test_cached_font_embeds_in_pdf(self):
+        """캐시에서 불러온 폰트로 PDF를 만들 수 있는지 테스트"""
+        from reportlab.pdfbase import pdfmetrics
+        from reportlab.pdfgen import canvas
+
+        FontManager(self.cache_dir).load_font("CachedTestFont", self.font_path)
+        self.assertTrue(FontManager(self.cache_dir).register("CachedTestFont", self.font_path))
+        self.assertIn("CachedTestFont", pdfmetrics.getRegisteredFontNames())
+
+        pdf_path = os.path.join(self.temp_dir.name, "out.pdf")
+        pdf = canvas.Canvas(pdf_path)
+        pdf.setFont("CachedTestFont", 12)
+        pdf.drawString(72, 720, "Cached font")
+        pdf.save()
+
+        with fitz.open(pdf_path) as document:
+            self.assertIn("Cached font", document[0].get_text())
+
+if __name__ == "__main__":
+    unittest.main()
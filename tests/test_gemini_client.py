@@ -3,9 +3,13 @@ Gemini 클라이언트 테스트 모듈
 """
 
 import os
+import asyncio
+import tempfile
 import unittest
-from unittest.mock import patch, MagicMock
-from pdf_translator.gemini_client import GeminiClient
+from unittest.mock import patch, MagicMock, AsyncMock
+from pdf_translator.gemini_client import GeminiClient, AsyncGeminiClient
+from pdf_translator.translation_cache import TranslationCache
+from pdf_translator.metrics import Metrics
 
 class TestGeminiClient(unittest.TestCase):
     """
@@ -163,6 +167,197 @@ class TestGeminiClient(unittest.TestCase):
                 self.assertIn("한국어", args[0][0])
                 self.assertEqual(args[0][1]["mime_type"], "image/png")
                 self.assertEqual(args[0][1]["data"], test_image_data)
+    
+    def test_translate_uses_cache(self):
+        """같은 콘텐츠를 다시 번역하면 캐시된 결과를 사용하는지 테스트"""
+        mock_response = MagicMock()
+        mock_response.text = "번역된 이미지 텍스트"
+        
+        mock_model = MagicMock()
+        mock_model.generate_content.return_value = mock_response
+        
+        with tempfile.TemporaryDirectory() as cache_dir:
+            with patch('google.generativeai.configure'):
+                with patch('google.generativeai.GenerativeModel', return_value=mock_model):
+                    client = GeminiClient(api_key="test_api_key", cache=TranslationCache(cache_dir))
+            
+            self.assertEqual(client.translate(b"image"), "번역된 이미지 텍스트")
+            self.assertEqual(client.translate(b"image"), "번역된 이미지 텍스트")
+            self.assertEqual(mock_model.generate_content.call_count, 1)
+            
+            # 대상 언어가 다르면 새로 요청
+            client.translate(b"image", target_language="일본어")
+            self.assertEqual(mock_model.generate_content.call_count, 2)
+    
+    @patch('pdf_translator.retry.time.sleep')
+    def test_translate_retries_empty_response(self, mock_sleep):
+        """텍스트가 없는 응답을 받으면 다시 요청하는지 테스트"""
+        empty_response = MagicMock(spec=[])  # text 속성 없음
+        mock_response = MagicMock()
+        mock_response.text = "번역된 이미지 텍스트"
+        
+        mock_model = MagicMock()
+        mock_model.generate_content.side_effect = [empty_response, mock_response]
+        
+        with patch('google.generativeai.configure'):
+            with patch('google.generativeai.GenerativeModel', return_value=mock_model):
+                client = GeminiClient(api_key="test_api_key")
+        
+        self.assertEqual(client.translate(b"image"), "번역된 이미지 텍스트")
+        self.assertEqual(mock_model.generate_content.call_count, 2)
+        mock_sleep.assert_called_once()
+    
+    def test_rate_limiter_shared_per_model(self):
+        """같은 모델의 요청이 하나의 속도 제한기를 공유하는지 테스트"""
+        with patch('google.generativeai.configure'):
+            with patch('google.generativeai.GenerativeModel'):
+                client = GeminiClient(api_key="test_api_key", requests_per_minute=10)
+                unlimited = GeminiClient(api_key="test_api_key", rate_limit=False)
+        
+        limiter = client.get_rate_limiter(client.text_model_id)
+        self.assertIs(limiter, client.get_rate_limiter(client.vision_model_id))
+        self.assertEqual(limiter.requests_per_minute, 10)
+        self.assertIsNone(unlimited.get_rate_limiter(unlimited.text_model_id))
+    
+    def test_translate_image_with_mime_type(self):
+        """이미지 MIME 타입이 요청에 반영되는지 테스트"""
+        mock_response = MagicMock()
+        mock_response.text = "번역된 이미지 텍스트"
+        mock_model = MagicMock()
+        mock_model.generate_content.return_value = mock_response
+        
+        with patch('google.generativeai.configure'):
+            with patch('google.generativeai.GenerativeModel', return_value=mock_model):
+                client = GeminiClient(api_key="test_api_key")
+        
+        client.translate(b"jpeg_data", mime_type="image/jpeg")
+        args, _ = mock_model.generate_content.call_args
+        self.assertEqual(args[0][1], {"mime_type": "image/jpeg", "data": b"jpeg_data"})
+    
+    def test_translate_text_batch(self):
+        """여러 페이지를 한 요청으로 번역하고 구분선으로 나누는지 테스트"""
+        mock_response = MagicMock()
+        mock_response.text = "[[[PAGE 1]]]\n첫 페이지\n\n[[[PAGE 2]]]\n둘째 페이지\n"
+        mock_model = MagicMock()
+        mock_model.generate_content.return_value = mock_response
+        
+        with tempfile.TemporaryDirectory() as cache_dir:
+            with patch('google.generativeai.configure'):
+                with patch('google.generativeai.GenerativeModel', return_value=mock_model):
+                    client = GeminiClient(api_key="test_api_key", cache=TranslationCache(cache_dir))
+            
+            self.assertEqual(client.translate_text_batch(["first page", "second page"]), ["첫 페이지", "둘째 페이지"])
+            args, _ = mock_model.generate_content.call_args
+            self.assertIn("[[[PAGE 2]]]\nsecond page", args[0])
+            
+            # 페이지별로 캐시되어 한 페이지씩 번역해도 다시 요청하지 않음
+            self.assertEqual(client.translate_text_only("second page"), "둘째 페이지")
+            self.assertEqual(mock_model.generate_content.call_count, 1)
+    
+    def test_translate_text_batch_falls_back_when_split_fails(self):
+        """응답을 페이지별로 나눌 수 없으면 페이지마다 다시 번역하는지 테스트"""
+        merged_response = MagicMock()
+        merged_response.text = "구분선 없이 합쳐진 번역"
+        first_response = MagicMock()
+        first_response.text = "첫 페이지"
+        second_response = MagicMock()
+        second_response.text = "둘째 페이지"
+        mock_model = MagicMock()
+        mock_model.generate_content.side_effect = [merged_response, first_response, second_response]
+        
+        with patch('google.generativeai.configure'):
+            with patch('google.generativeai.GenerativeModel', return_value=mock_model):
+                client = GeminiClient(api_key="test_api_key")
+        
+        self.assertEqual(client.translate_text_batch(["first page", "second page"]), ["첫 페이지", "둘째 페이지"])
+        self.assertEqual(mock_model.generate_content.call_count, 3)
+    
+    def test_translate_with_stream(self):
+        """스트리밍 응답 조각을 합쳐 반환하는지 테스트"""
+        chunks = [MagicMock(text="번역된 "), MagicMock(spec=[]), MagicMock(text="텍스트")]
+        mock_model = MagicMock()
+        mock_model.generate_content.return_value = iter(chunks)
+        
+        with patch('google.generativeai.configure'):
+            with patch('google.generativeai.GenerativeModel', return_value=mock_model):
+                client = GeminiClient(api_key="test_api_key", stream=True)
+        
+        self.assertEqual(client.translate_text_only("Hello"), "번역된 텍스트")
+        _, kwargs = mock_model.generate_content.call_args
+        self.assertEqual(kwargs, {"stream": True})
+    
+    def test_translate_text_stream(self):
+        """번역문을 조각 단위로 반환하고 끝나면 캐시하는지 테스트"""
+        mock_model = MagicMock()
+        mock_model.generate_content.return_value = iter([MagicMock(text="안녕"), MagicMock(text="하세요")])
+        
+        with tempfile.TemporaryDirectory() as cache_dir:
+            with patch('google.generativeai.configure'):
+                with patch('google.generativeai.GenerativeModel', return_value=mock_model):
+                    client = GeminiClient(api_key="test_api_key", cache=TranslationCache(cache_dir))
+            
+            self.assertEqual(list(client.translate_text_stream("Hello")), ["안녕", "하세요"])
+            self.assertEqual(list(client.translate_text_stream("Hello")), ["안녕하세요"])
+            self.assertEqual(mock_model.generate_content.call_count, 1)
+    
+    def test_records_request_metrics(self):
+        """요청 크기와 응답의 토큰 사용량을 지표에 기록하는지 테스트"""
+        mock_response = MagicMock()
+        mock_response.text = "번역된 텍스트"
+        mock_response.usage_metadata.prompt_token_count = 120
+        mock_response.usage_metadata.candidates_token_count = 80
+        mock_model = MagicMock()
+        mock_model.generate_content.return_value = mock_response
+        metrics = Metrics()
+        
+        with patch('google.generativeai.configure'):
+            with patch('google.generativeai.GenerativeModel', return_value=mock_model):
+                client = GeminiClient(api_key="test_api_key", metrics=metrics)
+        
+        client.translate(b"image_data")
+        report = metrics.report()
+        self.assertEqual(report["requests"]["count"], 1)
+        self.assertGreater(report["requests"]["bytes_sent"], len(b"image_data"))
+        self.assertEqual(report["tokens"], {client.vision_model_id: {"input": 120, "output": 80}})
+
+class TestAsyncGeminiClient(unittest.TestCase):
+    """
+    AsyncGeminiClient 클래스를 테스트하는 테스트 케이스
+    """
+    
+    def _create_client(self, mock_model):
+        with patch('google.generativeai.configure'):
+            with patch('google.generativeai.GenerativeModel', return_value=mock_model):
+                return AsyncGeminiClient(api_key="test_api_key")
+    
+    def test_translate_text_only_async(self):
+        """비동기 텍스트 번역 테스트"""
+        mock_response = MagicMock()
+        mock_response.text = "안녕하세요, 세계!"
+        mock_model = MagicMock()
+        mock_model.generate_content_async = AsyncMock(return_value=mock_response)
+        
+        client = self._create_client(mock_model)
+        result = asyncio.run(client.translate_text_only("Hello, world!"))
+        
+        self.assertEqual(result, "안녕하세요, 세계!")
+        mock_model.generate_content.assert_not_called()
+        args, _ = mock_model.generate_content_async.call_args
+        self.assertIn("Hello, world!", args[0])
+    
+    def test_translate_image_async(self):
+        """비동기 이미지 번역 테스트"""
+        mock_response = MagicMock()
+        mock_response.text = "번역된 이미지 텍스트"
+        mock_model = MagicMock()
+        mock_model.generate_content_async = AsyncMock(return_value=mock_response)
+        
+        client = self._create_client(mock_model)
+        result = asyncio.run(client.translate(b"test_image_data"))
+        
+        self.assertEqual(result, "번역된 이미지 텍스트")
+        args, _ = mock_model.generate_content_async.call_args
+        self.assertEqual(args[0][1]["data"], b"test_image_data")
 
 if __name__ == "__main__":
     unittest.main() 
\ No newline at end of file
@@ -0,0 +1,58 @@
+"""
+실행 지표 모듈 테스트
+"""
+
+import os
+import json
+import tempfile
+import unittest
+from pdf_translator.metrics import Metrics, percentile, timed
+
+class TestMetrics(unittest.TestCase):
+    """
+    Metrics 클래스를 테스트하는 테스트 케이스
+    """
+
+    def test_percentile(self):
+        """백분위수를 선형 보간으로 계산하는지 테스트"""
+        values = [4.0, 1.0, 3.0, 2.0, 5.0]
+        self.assertEqual(percentile(values, 50), 3.0)
+        self.assertAlmostEqual(percentile(values, 95), 4.8)
+        self.assertEqual(percentile([], 95), 0.0)
+
+    def test_report(self):
+        """단계 시간, 요청, 토큰, 예상 비용을 보고서에 모으는지 테스트"""
+        metrics = Metrics()
+        metrics.record_stage("render", 0.5)
+        metrics.record_stage("render", 1.5)
+        with metrics.stage("pdf_build"):
+            pass
+        metrics.count("pages", 3)
+        metrics.count("cache_hits")
+        metrics.record_request("gemini-1.5-flash", 2.0, 1000, input_tokens=1_000_000, output_tokens=1_000_000)
+        metrics.record_request("gemini-1.5-flash", 4.0, 500)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "metrics.json")
+            report = metrics.write_report(path)
+            with open(path, encoding='utf-8') as file:
+                self.assertEqual(json.load(file), report)
+
+        self.assertEqual(report["pages"], 3)
+        self.assertEqual(report["stages"]["render"]["count"], 2)
+        self.assertEqual(report["stages"]["render"]["p50_seconds"], 1.0)
+        self.assertIn("pdf_build", report["stages"])
+        self.assertEqual(report["requests"]["count"], 2)
+        self.assertEqual(report["requests"]["cache_hits"], 1)
+        self.assertEqual(report["requests"]["bytes_sent"], 1500)
+        self.assertEqual(report["requests"]["latency"]["max_seconds"], 4.0)
+        self.assertEqual(report["tokens"], {"gemini-1.5-flash": {"input": 1_000_000, "output": 1_000_000}})
+        self.assertAlmostEqual(report["cost_estimate_usd"], 0.375)
+
+    def test_timed_without_metrics(self):
+        """metrics가 없으면 아무것도 기록하지 않는지 테스트"""
+        with timed(None, "render"):
+            pass
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,66 @@
+"""
+가짜 Gemini HTTP 서버 테스트
+"""
+
+import unittest
+from benchmarks.fake_gemini import FakeGenerativeModel
+from benchmarks.mock_server import MockGeminiServer
+from pdf_translator.gemini_client import GeminiClient
+from pdf_translator.metrics import Metrics
+from pdf_translator.retry import RetryPolicy
+
+class TestMockGeminiServer(unittest.TestCase):
+    """
+    base_url로 가짜 서버에 연결한 GeminiClient를 테스트하는 테스트 케이스
+    """
+
+    def _client(self, server: MockGeminiServer, max_attempts: int = 1, **kwargs) -> GeminiClient:
+        return GeminiClient(api_key="test_api_key", base_url=server.url, rate_limit=False,
+                            retry_policy=RetryPolicy(max_attempts=max_attempts, base_delay=0, jitter=0), **kwargs)
+
+    def test_generate_content(self):
+        """텍스트, 이미지, 묶음 요청을 REST로 번역하고 토큰 사용량을 기록하는지 테스트"""
+        metrics = Metrics()
+        with MockGeminiServer() as server:
+            client = self._client(server, metrics=metrics)
+            self.assertEqual(client.translate_text_only("Hello"), "[번역] Hello")
+            self.assertEqual(client.translate(b"image_data"), "[번역] 이미지 1개의 텍스트")
+            self.assertEqual(client.translate_text_batch(["first", "second"]), ["[번역] first", "[번역] second"])
+
+        report = metrics.report()
+        self.assertEqual(report["requests"]["count"], 3)
+        self.assertGreater(report["tokens"][client.text_model_id]["output"], 0)
+
+    def test_stream_generate_content(self):
+        """스트리밍 응답 조각을 합쳐 반환하는지 테스트"""
+        with MockGeminiServer(FakeGenerativeModel(stream_chunks=3)) as server:
+            client = self._client(server, stream=True)
+            self.assertEqual(client.translate_text_only("Hello streaming world"), "[번역] Hello streaming world")
+            pieces = list(client.translate_text_stream("Stream again"))
+        self.assertGreater(len(pieces), 1)
+        self.assertEqual("".join(pieces), "[번역] Stream again")
+
+    def test_quota_returns_429(self):
+        """분당 요청 수 할당량을 넘으면 Retry-After가 있는 429 오류를 반환하는지 테스트"""
+        with MockGeminiServer(requests_per_minute=1) as server:
+            client = self._client(server)
+            client.translate_text_only("first")
+            with self.assertRaises(Exception) as context:
+                client.translate_text_only("second")
+        self.assertEqual(context.exception.code, 429)
+        self.assertTrue(RetryPolicy.is_retryable(context.exception))
+        self.assertGreater(RetryPolicy.get_retry_after(context.exception), 0)
+        self.assertEqual(server.rejected, 1)
+
+    def test_server_errors_are_retried(self):
+        """서버 오류를 재시도 가능한 오류로 받아 최대 시도 횟수만큼 다시 요청하는지 테스트"""
+        model = FakeGenerativeModel(error_rate=1.0, error_code=500)
+        with MockGeminiServer(model) as server:
+            client = self._client(server, max_attempts=3)
+            with self.assertRaises(Exception) as context:
+                client.translate_text_only("Hello")
+        self.assertEqual(context.exception.code, 500)
+        self.assertEqual(model.calls, 3)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,80 @@
+"""
+텍스트 출력 모듈 테스트
+"""
+
+import os
+import tempfile
+import unittest
+from pdf_translator.output_writer import OrderedTextWriter, format_page_header, format_text_page
+
+class TestOrderedTextWriter(unittest.TestCase):
+    """
+    OrderedTextWriter 클래스를 테스트하는 테스트 케이스
+    """
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.output_path = os.path.join(self.temp_dir.name, "output.txt")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def read_output(self) -> str:
+        with open(self.output_path, encoding='utf-8') as file:
+            return file.read()
+
+    def test_writes_pages_as_soon_as_they_are_in_order(self):
+        """앞 페이지가 완료되면 바로 기록하고, 순서가 바뀐 페이지는 앞 페이지를 기다리는지 테스트"""
+        with OrderedTextWriter(self.output_path, [1, 3, 4]) as writer:
+            writer.add(1, "one", "하나")
+            self.assertEqual(self.read_output(), format_text_page(1, "one", "하나"))
+
+            writer.add(4, "four", "넷")
+            self.assertEqual(self.read_output(), format_text_page(1, "one", "하나"))
+
+            writer.add(3, "three", "셋")
+            self.assertTrue(writer.complete)
+
+        self.assertEqual(self.read_output(), "".join([
+            format_text_page(1, "one", "하나"),
+            format_text_page(3, "three", "셋"),
+            format_text_page(4, "four", "넷"),
+        ]))
+
+    def test_streams_pieces_of_the_next_page(self):
+        """차례가 된 페이지는 조각이 도착하는 대로 기록하고, 아닌 페이지는 끝난 뒤 순서대로 기록하는지 테스트"""
+        with OrderedTextWriter(self.output_path, [1, 2, 3]) as writer:
+            outputs = []
+
+            def pieces():
+                yield "하"
+                outputs.append(self.read_output())
+                yield "나"
+                outputs.append(self.read_output())
+
+            writer.add(3, "three", "셋")
+            self.assertEqual(writer.add_stream(1, "one", pieces()), "하나")
+            self.assertEqual(outputs, [
+                format_page_header(1, "one") + "하",
+                format_page_header(1, "one") + "하나",
+            ])
+            self.assertEqual(writer.add_stream(2, "two", iter(["둘"])), "둘")
+            self.assertTrue(writer.complete)
+
+        self.assertEqual(self.read_output(), "".join([
+            format_text_page(1, "one", "하나"),
+            format_text_page(2, "two", "둘"),
+            format_text_page(3, "three", "셋"),
+        ]))
+
+    def test_buffers_streamed_page_until_its_turn(self):
+        """앞 페이지가 끝나지 않았으면 스트리밍 페이지를 보관했다가 순서대로 기록하는지 테스트"""
+        with OrderedTextWriter(self.output_path, [1, 2]) as writer:
+            self.assertEqual(writer.add_stream(2, "two", iter(["둘", "째"])), "둘째")
+            self.assertEqual(self.read_output(), "")
+            writer.add(1, "one", "하나")
+
+        self.assertEqual(self.read_output(), format_text_page(1, "one", "하나") + format_text_page(2, "two", "둘째"))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,26 @@
+"""
+페이지 묶음 모듈 테스트
+"""
+
+import unittest
+from pdf_translator.packing import pack_pages
+
+class TestPackPages(unittest.TestCase):
+    """
+    pack_pages 함수를 테스트하는 테스트 케이스
+    """
+
+    def test_packs_consecutive_pages_within_budget(self):
+        """예산 안의 연속한 페이지를 묶고 큰 페이지는 단독으로 두는지 테스트"""
+        pages = [(1, "a" * 40), (2, "b" * 40), (3, "c" * 40), (4, "d" * 400), (5, "e" * 40)]
+        groups = pack_pages(pages, token_budget=25)
+        self.assertEqual([[page_num for page_num, _ in group] for group in groups], [[1, 2], [3], [4], [5]])
+
+    def test_max_pages(self):
+        """한 묶음의 페이지 수가 제한을 넘지 않는지 테스트"""
+        pages = [(n, "x") for n in range(1, 8)]
+        groups = pack_pages(pages, token_budget=1000, max_pages=3)
+        self.assertEqual([len(group) for group in groups], [3, 3, 1])
+
+if __name__ == "__main__":
+    unittest.main()
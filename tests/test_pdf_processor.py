@@ -3,10 +3,16 @@ PDF 프로세서 테스트 모듈
 """
 
 import os
+import asyncio
+import tempfile
+import threading
 import unittest
-from unittest.mock import patch, MagicMock, mock_open
-from pdf_translator.pdf_processor import PDFProcessor
-from pdf_translator.gemini_client import GeminiClient
+from unittest.mock import patch, MagicMock, AsyncMock, mock_open
+from pdf_translator.pdf_processor import PDFProcessor, select_page_dpi, classify_page
+from pdf_translator.gemini_client import GeminiClient, AsyncGeminiClient
+from pdf_translator.metrics import Metrics
+from pdf_translator.checkpoint import TranslationCheckpoint
+from pdf_translator.output_writer import format_text_page
 
 class TestPDFProcessor(unittest.TestCase):
     """
@@ -45,7 +51,7 @@ class TestPDFProcessor(unittest.TestCase):
     @patch('os.path.exists')
     @patch('PyPDF2.PdfReader')
     def test_extract_text_from_pdf(self, mock_pdf_reader_class, mock_exists):
-        """PDF에서 텍스트 추출 테스트"""
+        """PyPDF2 백엔드로 PDF에서 텍스트 추출 테스트"""
         mock_exists.return_value = True
         
         # 목 페이지 설정
@@ -64,8 +70,9 @@ class TestPDFProcessor(unittest.TestCase):
         mock_pdf_reader_class.return_value = mock_pdf_reader
         
         # open 함수 목
+        processor = PDFProcessor(gemini_client=self.mock_gemini_client, text_backend="pypdf2")
         with patch('builtins.open', mock_open()) as mock_file:
-            result = self.pdf_processor.extract_text_from_pdf("test.pdf")
+            result = processor.extract_text_from_pdf("test.pdf")
             
             # 결과 확인
             self.assertEqual(len(result), 2)  # 비어 있지 않은 페이지만 포함
@@ -75,6 +82,32 @@ class TestPDFProcessor(unittest.TestCase):
             # 파일 열기 확인
             mock_file.assert_called_once_with("test.pdf", 'rb')
     
+    def test_extract_text_from_pdf_pymupdf(self):
+        """기본(PyMuPDF) 백엔드로 PDF에서 텍스트 추출 테스트"""
+        import fitz
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            pdf_path = os.path.join(temp_dir, "test.pdf")
+            document = fitz.open()
+            document.new_page().insert_text((72, 72), "Page one text")
+            document.new_page()  # 빈 페이지
+            document.new_page().insert_text((72, 72), "Page three text")
+            document.save(pdf_path)
+            document.close()
+            
+            self.assertEqual(self.pdf_processor.text_backend, "pymupdf")
+            result = self.pdf_processor.extract_text_from_pdf(pdf_path)
+            
+            # 빈 페이지는 제외
+            self.assertEqual([page_num for page_num, _ in result], [1, 3])
+            self.assertIn("Page one text", result[0][1])
+            self.assertIn("Page three text", result[1][1])
+    
+    def test_invalid_text_backend(self):
+        """지원되지 않는 텍스트 추출 백엔드에 대한 예외 처리 테스트"""
+        with self.assertRaises(ValueError):
+            PDFProcessor(gemini_client=self.mock_gemini_client, text_backend="pdfminer")
+    
     @patch('os.path.exists')
     @patch('fitz.open')
     def test_extract_page_images(self, mock_fitz_open, mock_exists):
@@ -108,6 +141,172 @@ class TestPDFProcessor(unittest.TestCase):
         mock_fitz_open.assert_called_once_with("test.pdf")
         mock_pdf_document.close.assert_called_once()
     
+    @patch('os.path.exists')
+    @patch('fitz.open')
+    def test_iter_page_images_is_lazy(self, mock_fitz_open, mock_exists):
+        """iter_page_images가 소비될 때만 페이지를 렌더링하는지 테스트"""
+        mock_exists.return_value = True
+        
+        mock_pages = []
+        for i in range(3):
+            mock_page = MagicMock()
+            mock_page.get_pixmap.return_value.tobytes.return_value = f"page{i + 1}".encode()
+            mock_pages.append(mock_page)
+        
+        mock_pdf_document = MagicMock()
+        mock_pdf_document.__iter__.return_value = mock_pages
+        mock_fitz_open.return_value = mock_pdf_document
+        
+        page_images = self.pdf_processor.iter_page_images("test.pdf")
+        self.assertEqual(next(page_images), (1, b"page1"))
+        
+        # 첫 페이지만 렌더링되어야 함
+        mock_pages[0].get_pixmap.assert_called_once()
+        mock_pages[1].get_pixmap.assert_not_called()
+        
+        self.assertEqual(list(page_images), [(2, b"page2"), (3, b"page3")])
+        mock_pdf_document.close.assert_called_once()
+    
+    def test_select_page_dpi(self):
+        """글자 크기에 따라 렌더링 해상도를 선택하는지 테스트"""
+        import fitz
+        
+        document = fitz.open()
+        document.new_page().insert_text((72, 72), "Body text in a large font. " * 3, fontsize=14)
+        document.new_page().insert_text((72, 72), "Body text in a large font. " * 3, fontsize=14)
+        document[1].insert_text((72, 700), "Footnote in fine print.", fontsize=5)
+        document.new_page()  # 텍스트 레이어가 없는 스캔 페이지
+        
+        self.assertEqual(select_page_dpi(document[0]), 125)
+        self.assertEqual(select_page_dpi(document[1]), 300)
+        self.assertEqual(select_page_dpi(document[2]), 300)
+        document.close()
+    
+    def test_iter_page_images_multiprocess(self):
+        """여러 프로세스로 렌더링해도 단일 프로세스와 같은 결과를 순서대로 반환하는지 테스트"""
+        import fitz
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            pdf_path = os.path.join(temp_dir, "test.pdf")
+            document = fitz.open()
+            for i in range(6):
+                document.new_page().insert_text((72, 72), f"Page {i + 1}", fontsize=12)
+            document.save(pdf_path)
+            document.close()
+            
+            sequential = PDFProcessor(gemini_client=self.mock_gemini_client, dpi=72)
+            parallel = PDFProcessor(gemini_client=self.mock_gemini_client, dpi=72, render_workers=2)
+            
+            expected = list(sequential.iter_page_images(pdf_path, skip_pages={2}))
+            result = list(parallel.iter_page_images(pdf_path, skip_pages={2}))
+        
+        self.assertEqual([page_num for page_num, _ in result], [1, 3, 4, 5, 6])
+        self.assertEqual(result, expected)
+    
+    def test_render_timings_recorded(self):
+        """페이지마다 렌더링과 인코딩 시간을 지표에 기록하는지 테스트 (다중 프로세스 포함)"""
+        import fitz
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            pdf_path = os.path.join(temp_dir, "test.pdf")
+            document = fitz.open()
+            for i in range(3):
+                document.new_page().insert_text((72, 72), f"Page {i + 1}", fontsize=12)
+            document.save(pdf_path)
+            document.close()
+            
+            for render_workers in (1, 2):
+                metrics = Metrics()
+                processor = PDFProcessor(gemini_client=self.mock_gemini_client, dpi=72,
+                                         render_workers=render_workers, metrics=metrics)
+                list(processor.iter_page_images(pdf_path))
+                stages = metrics.report()["stages"]
+                self.assertEqual(stages["render"]["count"], 3)
+                self.assertEqual(stages["encode"]["count"], 3)
+    
+    @patch('os.path.exists', return_value=True)
+    @patch('fitz.open')
+    def test_iter_page_images_jpeg(self, mock_fitz_open, mock_exists):
+        """JPEG 형식으로 인코딩하고 MIME 타입을 전달하는지 테스트"""
+        mock_page = MagicMock()
+        mock_pixmap = mock_page.get_pixmap.return_value
+        mock_pixmap.tobytes.return_value = b"jpeg_data"
+        mock_pdf_document = MagicMock()
+        mock_pdf_document.__iter__.return_value = [mock_page]
+        mock_fitz_open.return_value = mock_pdf_document
+        
+        processor = PDFProcessor(gemini_client=self.mock_gemini_client, image_format="jpeg", image_quality=70)
+        result = processor.extract_page_images("test.pdf")
+        
+        self.assertEqual(result, [(1, b"jpeg_data")])
+        mock_pixmap.tobytes.assert_called_once_with("jpeg", jpg_quality=70)
+        self.assertEqual(processor.image_mime_type, "image/jpeg")
+    
+    def test_classify_page(self):
+        """텍스트 레이어와 그림 면적에 따라 페이지를 분류하는지 테스트"""
+        import fitz
+        
+        document = fitz.open()
+        document.new_page().insert_text((72, 72), "Born-digital paragraph text. " * 3)
+        document.new_page()  # 텍스트 레이어가 없는 스캔 페이지
+        document.new_page().insert_text((72, 72), "Caption for a large figure. " * 3)
+        figure = fitz.Pixmap(fitz.csRGB, fitz.IRect(0, 0, 10, 10), False)
+        document[2].insert_image(fitz.Rect(72, 100, 540, 700), pixmap=figure)
+        
+        self.assertEqual(classify_page(document[0]), "text")
+        self.assertEqual(classify_page(document[1]), "image")
+        self.assertEqual(classify_page(document[2]), "image")
+        document.close()
+    
+    @patch('pdf_translator.pdf_processor.PDFProcessor.open_document', return_value=MagicMock(page_count=3))
+    @patch('pdf_translator.pdf_processor.PDFProcessor.iter_hybrid_pages')
+    def test_translate_hybrid(self, mock_iter_hybrid, mock_open_document):
+        """하이브리드 모드에서 페이지 종류에 맞는 번역 메서드를 사용하는지 테스트"""
+        mock_iter_hybrid.return_value = iter([
+            (1, "text", "Page 1 text"),
+            (2, "image", b"page2_image_data"),
+            (3, "text", "Page 3 text"),
+        ])
+        self.mock_gemini_client.translate_text_only.side_effect = ["페이지 1 번역", "페이지 3 번역"]
+        self.mock_gemini_client.translate.return_value = "페이지 2 번역"
+        
+        result = self.pdf_processor.translate("test.pdf", hybrid=True)
+        
+        self.assertEqual(result, [(1, "페이지 1 번역"), (2, "페이지 2 번역"), (3, "페이지 3 번역")])
+        self.assertEqual(self.mock_gemini_client.translate_text_only.call_count, 2)
+        self.mock_gemini_client.translate.assert_called_once_with(b"page2_image_data", "한국어", mime_type="image/png")
+    
+    @patch('pdf_translator.pdf_processor.PDFProcessor.open_document', return_value=MagicMock(page_count=2))
+    @patch('pdf_translator.pdf_processor.PDFProcessor.iter_hybrid_pages')
+    def test_translate_hybrid_chunks_run_concurrently(self, mock_iter_hybrid, mock_open_document):
+        """하이브리드 모드에서 긴 페이지의 조각을 별도 요청으로 동시에 번역하고 순서대로 합치는지 테스트"""
+        long_page = "\n\n".join(f"Paragraph {n} " * 10 for n in range(3))
+        mock_iter_hybrid.return_value = iter([(1, "text", long_page), (2, "image", b"page2_image_data")])
+        # 세 조각이 모두 동시에 번역 중이어야 통과
+        barrier = threading.Barrier(3)
+        
+        def translate_chunk(text, lang):
+            barrier.wait(timeout=5)
+            return text.split()[1] + " 번역"
+        
+        self.mock_gemini_client.translate_text_only.side_effect = translate_chunk
+        self.mock_gemini_client.translate.return_value = "페이지 2 번역"
+        processor = PDFProcessor(gemini_client=self.mock_gemini_client, max_workers=3, chunk_tokens=50)
+        
+        result = processor.translate("test.pdf", hybrid=True)
+        
+        self.assertEqual(result, [(1, "0 번역\n\n1 번역\n\n2 번역"), (2, "페이지 2 번역")])
+        self.assertEqual(self.mock_gemini_client.translate_text_only.call_count, 3)
+    
+    def test_invalid_dpi(self):
+        """잘못된 dpi 값에 대한 예외 처리 테스트"""
+        with self.assertRaises(ValueError):
+            PDFProcessor(gemini_client=self.mock_gemini_client, dpi=0)
+        with self.assertRaises(ValueError):
+            PDFProcessor(gemini_client=self.mock_gemini_client, dpi="high")
+        with self.assertRaises(ValueError):
+            PDFProcessor(gemini_client=self.mock_gemini_client, image_format="gif")
+    
     @patch('pdf_translator.pdf_processor.PDFProcessor.extract_text_from_pdf')
     def test_translate_text_only(self, mock_extract):
         """텍스트 기반 PDF 번역 테스트"""
@@ -133,6 +332,65 @@ class TestPDFProcessor(unittest.TestCase):
         self.mock_gemini_client.translate_text_only.assert_any_call("Page 1 text", "한국어")
         self.mock_gemini_client.translate_text_only.assert_any_call("Page 2 text", "한국어")
     
+    @patch('pdf_translator.pdf_processor.PDFProcessor.extract_text_from_pdf')
+    def test_translate_text_only_packed(self, mock_extract):
+        """짧은 페이지를 토큰 예산 안에서 묶어 요청하는지 테스트"""
+        mock_extract.return_value = [(1, "a" * 40), (2, "b" * 40), (3, "c" * 400), (4, "d" * 40)]
+        self.mock_gemini_client.translate_text_batch.return_value = ["가", "나"]
+        self.mock_gemini_client.translate_text_only.side_effect = ["다", "라"]
+        
+        processor = PDFProcessor(gemini_client=self.mock_gemini_client, pack_tokens=50)
+        result = processor.translate_text_only("test.pdf")
+        
+        self.assertEqual([translated for _, _, translated in result], ["가", "나", "다", "라"])
+        self.mock_gemini_client.translate_text_batch.assert_called_once_with(["a" * 40, "b" * 40], "한국어")
+        self.assertEqual(self.mock_gemini_client.translate_text_only.call_count, 2)
+    
+    @patch('pdf_translator.pdf_processor.PDFProcessor.extract_text_from_pdf')
+    def test_translate_text_only_chunks_long_pages(self, mock_extract):
+        """긴 페이지를 조각으로 나누어 번역하고 순서대로 합치는지 테스트"""
+        long_page = "First paragraph " * 10 + "\n\n" + "Second paragraph " * 10
+        mock_extract.return_value = [(1, "Short page"), (2, long_page)]
+        self.mock_gemini_client.translate_text_only.side_effect = lambda text, language: text.split()[0].upper()
+        
+        processor = PDFProcessor(gemini_client=self.mock_gemini_client, max_workers=3, chunk_tokens=50)
+        result = processor.translate_text_only("test.pdf")
+        
+        self.assertEqual(result, [(1, "Short page", "SHORT"), (2, long_page, "FIRST\n\nSECOND")])
+        self.assertEqual(self.mock_gemini_client.translate_text_only.call_count, 3)
+    
+    @patch('pdf_translator.pdf_processor.PDFProcessor.extract_text_from_pdf')
+    def test_translate_text_only_without_collect(self, mock_extract):
+        """collect=False이면 출력 파일에만 기록하고 결과를 모으지 않는지 테스트"""
+        mock_extract.return_value = [(1, "Page 1 text"), (2, "Page 2 text")]
+        self.mock_gemini_client.translate_text_only.side_effect = ["페이지 1 텍스트", "페이지 2 텍스트"]
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            output_path = os.path.join(temp_dir, "output.txt")
+            result = self.pdf_processor.translate_text_only("test.pdf", output_path, collect=False)
+            with open(output_path, encoding='utf-8') as file:
+                output = file.read()
+        
+        self.assertIsNone(result)
+        self.assertEqual(output, format_text_page(1, "Page 1 text", "페이지 1 텍스트") + format_text_page(2, "Page 2 text", "페이지 2 텍스트"))
+    
+    @patch('pdf_translator.pdf_processor.PDFProcessor.extract_text_from_pdf')
+    def test_translate_text_only_streams_to_output(self, mock_extract):
+        """스트리밍 클라이언트의 번역문 조각을 출력 파일에 기록하는지 테스트"""
+        mock_extract.return_value = [(1, "Page 1 text"), (2, "Page 2 text")]
+        self.mock_gemini_client.stream = True
+        self.mock_gemini_client.translate_text_stream.side_effect = lambda text, language: iter([text[:4], " 번역"])
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            output_path = os.path.join(temp_dir, "output.txt")
+            result = self.pdf_processor.translate_text_only("test.pdf", output_path)
+            with open(output_path, encoding='utf-8') as file:
+                output = file.read()
+        
+        self.assertEqual(result, [(1, "Page 1 text", "Page 번역"), (2, "Page 2 text", "Page 번역")])
+        self.assertEqual(output, format_text_page(1, "Page 1 text", "Page 번역") + format_text_page(2, "Page 2 text", "Page 번역"))
+        self.mock_gemini_client.translate_text_only.assert_not_called()
+    
     @patch('pdf_translator.pdf_processor.PDFProcessor.translate_text_only')
     def test_translate_with_text_only_param(self, mock_translate_text_only):
         """text_only 매개변수를 사용한 번역 테스트"""
@@ -151,17 +409,18 @@ class TestPDFProcessor(unittest.TestCase):
         self.assertEqual(result[1], (2, "페이지 2 텍스트"))
         
         # translate_text_only 메서드 호출 확인
-        mock_translate_text_only.assert_called_once_with("test.pdf", None, "한국어")
+        mock_translate_text_only.assert_called_once_with("test.pdf", None, "한국어", resume=False)
     
-    @patch('pdf_translator.pdf_processor.PDFProcessor.extract_page_images')
+    @patch('pdf_translator.pdf_processor.PDFProcessor.open_document', return_value=MagicMock(page_count=2))
+    @patch('pdf_translator.pdf_processor.PDFProcessor.iter_page_images')
     @patch('pdf_translator.pdf_processor.PDFProcessor._create_translated_pdf')
-    def test_translate_multimodal(self, mock_create_pdf, mock_extract_images):
+    def test_translate_multimodal(self, mock_create_pdf, mock_iter_images, mock_open_document):
         """멀티모달 PDF 번역 테스트"""
-        # 추출된 이미지 목 설정
-        mock_extract_images.return_value = [
+        # 렌더링된 이미지 목 설정
+        mock_iter_images.return_value = iter([
             (1, b"page1_image_data"),
             (2, b"page2_image_data")
-        ]
+        ])
         
         # GeminiClient의 번역 메서드 목 설정
         self.mock_gemini_client.translate.side_effect = ["페이지 1 번역", "페이지 2 번역"]
@@ -176,8 +435,8 @@ class TestPDFProcessor(unittest.TestCase):
         
         # translate 메서드 호출 확인
         self.assertEqual(self.mock_gemini_client.translate.call_count, 2)
-        self.mock_gemini_client.translate.assert_any_call(b"page1_image_data", "한국어")
-        self.mock_gemini_client.translate.assert_any_call(b"page2_image_data", "한국어")
+        self.mock_gemini_client.translate.assert_any_call(b"page1_image_data", "한국어", mime_type="image/png")
+        self.mock_gemini_client.translate.assert_any_call(b"page2_image_data", "한국어", mime_type="image/png")
         
         # PDF 생성 메서드 호출 확인
         mock_create_pdf.assert_called_once_with(
@@ -185,6 +444,136 @@ class TestPDFProcessor(unittest.TestCase):
             "output.pdf"
         )
     
+    @patch('pdf_translator.pdf_processor.PDFProcessor.open_document', return_value=MagicMock(page_count=8))
+    @patch('pdf_translator.pdf_processor.PDFProcessor.iter_page_images')
+    def test_translate_multimodal_concurrent_preserves_order(self, mock_iter_images, mock_open_document):
+        """여러 워커로 번역해도 페이지 순서가 유지되는지 테스트"""
+        mock_iter_images.return_value = iter([(i, f"page{i}".encode()) for i in range(1, 9)])
+        self.mock_gemini_client.translate.side_effect = lambda data, lang, mime_type: data.decode() + " 번역"
+
+        processor = PDFProcessor(gemini_client=self.mock_gemini_client, max_workers=4)
+        result = processor.translate("test.pdf")
+
+        self.assertEqual(result, [(i, f"page{i} 번역") for i in range(1, 9)])
+        self.assertEqual(self.mock_gemini_client.translate.call_count, 8)
+
+    def test_open_checkpoint_reads_journal_once(self):
+        """이어서 번역할 때 체크포인트를 한 번만 읽는지 테스트"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            output_path = os.path.join(temp_dir, "output.pdf")
+            checkpoint = TranslationCheckpoint(TranslationCheckpoint.path_for(output_path), "test.pdf", "text", "한국어")
+            checkpoint.start()
+            checkpoint.record(1, "페이지 1 번역")
+            checkpoint.close()
+            
+            with patch.object(TranslationCheckpoint, 'load', autospec=True,
+                              side_effect=TranslationCheckpoint.load) as mock_load:
+                checkpoint, completed = self.pdf_processor.open_checkpoint(
+                    "test.pdf", output_path, "text", "한국어", resume=True
+                )
+                checkpoint.close()
+            
+        self.assertEqual(list(completed), [1])
+        self.assertEqual(mock_load.call_count, 1)
+    
+    @patch('pdf_translator.pdf_processor.PDFProcessor.open_document', return_value=MagicMock(page_count=3))
+    @patch('pdf_translator.pdf_processor.PDFProcessor.iter_page_images')
+    @patch('pdf_translator.pdf_processor.PDFProcessor._create_translated_pdf')
+    def test_translate_resume_skips_completed_pages(self, mock_create_pdf, mock_iter_images, mock_open_document):
+        """실패 후 resume으로 남은 페이지만 번역하는 테스트"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            output_path = os.path.join(temp_dir, "output.pdf")
+            processor = PDFProcessor(gemini_client=self.mock_gemini_client, checkpoint=True)
+            
+            # 첫 실행: 3페이지에서 실패
+            mock_iter_images.return_value = iter([(1, b"page1"), (2, b"page2"), (3, b"page3")])
+            self.mock_gemini_client.translate.side_effect = ["페이지 1 번역", "페이지 2 번역", RuntimeError("429")]
+            with self.assertRaises(RuntimeError):
+                processor.translate("test.pdf", output_path=output_path)
+            mock_create_pdf.assert_not_called()
+            
+            # 재실행: 완료된 페이지는 렌더링과 번역을 건너뜀
+            mock_iter_images.return_value = iter([(3, b"page3")])
+            self.mock_gemini_client.translate.side_effect = ["페이지 3 번역"]
+            result = processor.translate("test.pdf", output_path=output_path, resume=True)
+            
+            self.assertEqual(result, [(1, "페이지 1 번역"), (2, "페이지 2 번역"), (3, "페이지 3 번역")])
+            mock_iter_images.assert_called_with(mock_open_document.return_value, skip_pages={1, 2})
+            self.mock_gemini_client.translate.assert_called_with(b"page3", "한국어", mime_type="image/png")
+            
+            # 완료 후 체크포인트 삭제
+            self.assertFalse(os.path.exists(output_path + ".checkpoint.jsonl"))
+    
+    @patch('pdf_translator.pdf_processor.PDFProcessor.iter_page_images')
+    def test_atranslate_with_async_client(self, mock_iter_images):
+        """비동기 클라이언트를 사용한 atranslate 테스트"""
+        mock_iter_images.return_value = iter([(1, b"page1"), (2, b"page2"), (3, b"page3")])
+        
+        async def fake_translate(data, lang, mime_type):
+            # 뒤 페이지가 먼저 끝나도 순서가 유지되어야 함
+            await asyncio.sleep(0.01 * (4 - int(data[-1:])))
+            return data.decode() + " 번역"
+        
+        mock_async_client = MagicMock(spec=AsyncGeminiClient)
+        mock_async_client.translate = AsyncMock(side_effect=fake_translate)
+        processor = PDFProcessor(gemini_client=mock_async_client, max_workers=3)
+        
+        result = asyncio.run(processor.atranslate("test.pdf"))
+        
+        self.assertEqual(result, [(1, "page1 번역"), (2, "page2 번역"), (3, "page3 번역")])
+        self.assertEqual(mock_async_client.translate.await_count, 3)
+    
+    @patch('pdf_translator.pdf_processor.PDFProcessor.extract_text_from_pdf')
+    def test_atranslate_text_only_with_sync_client(self, mock_extract):
+        """동기 클라이언트로 atranslate 텍스트 모드를 실행하는 테스트"""
+        mock_extract.return_value = [(1, "Page 1 text"), (2, "Page 2 text")]
+        self.mock_gemini_client.translate_text_only.side_effect = lambda text, lang: text + " 번역"
+        
+        result = asyncio.run(self.pdf_processor.atranslate("test.pdf", text_only=True))
+        
+        self.assertEqual(result, [(1, "Page 1 text 번역"), (2, "Page 2 text 번역")])
+    
+    @patch('pdf_translator.pdf_processor.PDFProcessor.extract_text_from_pdf')
+    def test_atranslate_text_only_packed(self, mock_extract):
+        """atranslate 텍스트 모드도 짧은 페이지를 묶어 translate_text_batch로 요청하는지 테스트"""
+        mock_extract.return_value = [(1, "a" * 40), (2, "b" * 40), (3, "c" * 400), (4, "d" * 40)]
+        mock_async_client = MagicMock(spec=AsyncGeminiClient)
+        mock_async_client.translate_text_batch = AsyncMock(return_value=["가", "나"])
+        mock_async_client.translate_text_only = AsyncMock(side_effect=["다", "라"])
+        processor = PDFProcessor(gemini_client=mock_async_client, pack_tokens=50)
+        
+        result = asyncio.run(processor.atranslate("test.pdf", text_only=True))
+        
+        self.assertEqual(result, [(1, "가"), (2, "나"), (3, "다"), (4, "라")])
+        mock_async_client.translate_text_batch.assert_awaited_once_with(["a" * 40, "b" * 40], "한국어")
+        self.assertEqual(mock_async_client.translate_text_only.await_count, 2)
+    
+    @patch('pdf_translator.pdf_processor.PDFProcessor.extract_text_from_pdf')
+    def test_atranslate_chunks_share_worker_limit(self, mock_extract):
+        """긴 페이지의 조각 요청도 max_workers개를 넘어 동시에 보내지 않는지 테스트"""
+        long_page = "\n\n".join(f"Paragraph {n} " * 10 for n in range(6))
+        mock_extract.return_value = [(1, long_page), (2, long_page)]
+        active = 0
+        peak = 0
+        
+        async def fake_translate(text, lang):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return text
+        
+        mock_async_client = MagicMock(spec=AsyncGeminiClient)
+        mock_async_client.translate_text_only = AsyncMock(side_effect=fake_translate)
+        processor = PDFProcessor(gemini_client=mock_async_client, max_workers=2, chunk_tokens=50)
+        
+        result = asyncio.run(processor.atranslate("test.pdf", text_only=True))
+        
+        self.assertEqual(len(result), 2)
+        self.assertGreater(mock_async_client.translate_text_only.await_count, 4)
+        self.assertEqual(peak, 2)
+    
     @patch('pdf_translator.pdf_processor.PDFProcessor.extract_text_from_pdf')
     def test_translate_text_only_with_output(self, mock_extract):
         """출력 파일이 있는 텍스트 기반 PDF 번역 테스트"""
@@ -209,42 +598,36 @@ class TestPDFProcessor(unittest.TestCase):
             # 파일 열기 확인
             mock_open_file.assert_called_once_with("output.txt", 'w', encoding='utf-8')
     
-    @patch('io.BytesIO')
-    @patch('reportlab.pdfgen.canvas.Canvas')
-    def test_create_translated_pdf(self, mock_canvas_class, mock_bytesio_class):
-        """번역된 PDF 생성 테스트"""
-        # 목 객체 설정
-        mock_buffer = MagicMock()
-        mock_bytesio_class.return_value = mock_buffer
+    def test_create_translated_pdf(self):
+        """번역된 PDF를 임시 파일에 만든 뒤 출력 경로로 교체하는지 테스트"""
+        import fitz
         
-        mock_canvas = MagicMock()
-        mock_text_object = MagicMock()
-        mock_canvas.beginText.return_value = mock_text_object
-        mock_canvas_class.return_value = mock_canvas
-        
-        # 테스트 데이터
         translated_results = [
-            (1, "페이지 1 번역 텍스트"),
-            (2, "페이지 2 번역 텍스트\n여러 줄 테스트")
+            (2, "Page two translation\nsecond line"),
+            (1, "Page one translation")
         ]
         
-        # 파일 쓰기 테스트 패치
-        mock_open_file = mock_open()
-        with patch('builtins.open', mock_open_file):
-            # PDF 생성 메서드 호출
-            self.pdf_processor._create_translated_pdf(translated_results, "output.pdf")
-            
-            # Canvas 생성 확인
-            mock_canvas_class.assert_called_once()
-            
-            # showPage 호출 확인 (페이지 수만큼)
-            self.assertEqual(mock_canvas.showPage.call_count, 2)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            output_path = os.path.join(temp_dir, "output.pdf")
+            self.pdf_processor._create_translated_pdf(translated_results, output_path)
             
-            # save 호출 확인
-            mock_canvas.save.assert_called_once()
+            # 임시 파일은 남지 않음
+            self.assertEqual(os.listdir(temp_dir), ["output.pdf"])
+            with fitz.open(output_path) as document:
+                text = "".join(page.get_text() for page in document)
+        
+        self.assertLess(text.index("Page one translation"), text.index("Page two translation"))
+        self.assertIn("second line", text)
+    
+    @patch('reportlab.platypus.SimpleDocTemplate.build', side_effect=RuntimeError("build failed"))
+    def test_create_translated_pdf_failure(self, mock_build):
+        """PDF 빌드에 실패해도 출력 파일을 남기고 예외를 다시 발생시키는지 테스트"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            output_path = os.path.join(temp_dir, "output.pdf")
+            with self.assertRaises(RuntimeError):
+                self.pdf_processor._create_translated_pdf([(1, "text")], output_path)
             
-            # 파일 열기 확인
-            mock_open_file.assert_called_once_with("output.pdf", 'wb')
+            self.assertEqual(os.listdir(temp_dir), ["output.pdf"])
 
 if __name__ == "__main__":
     unittest.main() 
\ No newline at end of file
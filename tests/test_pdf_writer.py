@@ -0,0 +1,100 @@
+"""
+번역 PDF 작성 모듈 테스트
+"""
+
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+import fitz
+from reportlab.platypus import Paragraph, Spacer
+from pdf_translator.pdf_writer import build_story, paragraph_styles, split_shards, text_flowables, write_translated_pdf
+
+class TestPdfWriter(unittest.TestCase):
+    """
+    번역 PDF 작성 함수를 테스트하는 테스트 케이스
+    """
+
+    def test_text_flowables_split_lines(self):
+        """줄마다 Paragraph를 만들고 빈 줄은 Spacer로 바꾸는지 테스트"""
+        _, body_style = paragraph_styles()
+        flowables = text_flowables("first line\nsecond line\n\nnext paragraph", body_style)
+
+        self.assertEqual([type(flowable) for flowable in flowables], [Paragraph, Paragraph, Spacer, Paragraph])
+        self.assertEqual(flowables[2].height, body_style.leading)
+
+    def test_text_flowables_keep_multiline_markup(self):
+        """여러 줄에 걸친 인라인 마크업을 하나의 Paragraph로 묶어 렌더링하는지 테스트"""
+        _, body_style = paragraph_styles()
+        text = "intro\n<b>bold start\n\nbold end</b> after\n<i>one line</i>\nlast"
+        flowables = text_flowables(text, body_style)
+
+        self.assertEqual([type(flowable) for flowable in flowables], [Paragraph] * 4)
+        self.assertEqual(flowables[1].text, "<b>bold start<br/><br/>bold end</b> after")
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            output_path = os.path.join(temp_dir, "output.pdf")
+            write_translated_pdf([(1, text)], output_path)
+            with fitz.open(output_path) as document:
+                rendered = "".join(page.get_text() for page in document)
+
+        self.assertIn("bold start", rendered)
+        self.assertIn("bold end after", rendered)
+        self.assertIn("one line", rendered)
+
+    def test_styles_are_cached(self):
+        """같은 폰트의 문단 스타일을 한 번만 만드는지 테스트"""
+        self.assertIs(paragraph_styles(), paragraph_styles())
+        self.assertEqual(paragraph_styles("Courier")[1].fontName, "Courier")
+        self.assertNotEqual(paragraph_styles()[1].fontName, "Courier")
+
+    def test_story_is_sorted_by_page(self):
+        """페이지 번호 순서로 제목과 본문을 배치하는지 테스트"""
+        story = build_story([(2, "two"), (1, "one")])
+        texts = [flowable.getPlainText() for flowable in story if isinstance(flowable, Paragraph)]
+        self.assertEqual(texts, ["=== 페이지 1 ===", "one", "=== 페이지 2 ===", "two"])
+
+    def test_long_page_spans_output_pages(self):
+        """여러 출력 페이지에 걸치는 긴 번역문을 빠짐없이 기록하는지 테스트"""
+        lines = [f"line {number}" for number in range(300)]
+        with tempfile.TemporaryDirectory() as temp_dir:
+            output_path = os.path.join(temp_dir, "output.pdf")
+            write_translated_pdf([(1, "\n".join(lines))], output_path)
+            with fitz.open(output_path) as document:
+                self.assertGreater(document.page_count, 1)
+                text = "".join(page.get_text() for page in document)
+
+        self.assertIn("line 0\n", text)
+        self.assertIn("line 299\n", text)
+
+    def test_split_shards(self):
+        """정렬된 연속 범위를 글자 수가 비슷하게 나누는지 테스트"""
+        results = [(page_num, "x" * 99) for page_num in range(8, 0, -1)]
+        shards = split_shards(results, 3)
+
+        self.assertEqual([page_num for shard in shards for page_num, _ in shard], list(range(1, 9)))
+        self.assertEqual([len(shard) for shard in shards], [3, 3, 2])
+        self.assertEqual(len(split_shards(results[:2], 4)), 2)
+
+    @patch('pdf_translator.pdf_writer.PDF_SHARD_MIN_PAGES', 2)
+    @patch('os.cpu_count', return_value=4)
+    def test_parallel_build_matches_sequential(self, mock_cpu_count):
+        """여러 프로세스에서 나누어 빌드해도 순차 빌드와 같은 내용을 기록하는지 테스트"""
+        results = [(page_num, f"page {page_num} text\nsecond line") for page_num in range(1, 7)]
+        with tempfile.TemporaryDirectory() as temp_dir:
+            texts, page_counts = [], []
+            for workers in (1, 3):
+                output_path = os.path.join(temp_dir, f"output_{workers}.pdf")
+                write_translated_pdf(results, output_path, workers=workers)
+                with fitz.open(output_path) as document:
+                    texts.append("".join(page.get_text() for page in document))
+                    page_counts.append(document.page_count)
+
+            self.assertEqual(sorted(os.listdir(temp_dir)), ["output_1.pdf", "output_3.pdf"])
+
+        self.assertEqual(texts[0], texts[1])
+        # 조각마다 새 출력 페이지에서 시작
+        self.assertEqual(page_counts, [1, 3])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,73 @@
+"""
+요청 속도 제한 테스트 모듈
+"""
+
+import asyncio
+import unittest
+from unittest.mock import patch
+from pdf_translator.rate_limiter import RateLimiter, TokenBucket
+from pdf_translator.tokens import estimate_tokens
+
+class TestRateLimiter(unittest.TestCase):
+    """
+    RateLimiter 클래스를 테스트하는 테스트 케이스
+    """
+    
+    def test_token_bucket_reserve(self):
+        """버킷 잔량이 부족하면 대기 시간을 반환하는지 테스트"""
+        bucket = TokenBucket(capacity=2, refill_per_second=1.0)
+        self.assertEqual(bucket.reserve(1, bucket.updated_at), 0.0)
+        self.assertEqual(bucket.reserve(1, bucket.updated_at), 0.0)
+        # 세 번째 요청은 1초, 네 번째 요청은 2초 기다려야 함
+        self.assertAlmostEqual(bucket.reserve(1, bucket.updated_at), 1.0)
+        self.assertAlmostEqual(bucket.reserve(1, bucket.updated_at), 2.0)
+        # 시간이 지나면 다시 채워짐
+        self.assertAlmostEqual(bucket.reserve(1, bucket.updated_at + 4.0), 0.0)
+    
+    @patch('pdf_translator.rate_limiter.time.sleep')
+    def test_acquire_waits_when_requests_exhausted(self, mock_sleep):
+        """버스트 용량을 넘은 요청은 할당량 속도에 맞춰 간격을 두고 보내는지 테스트"""
+        limiter = RateLimiter(requests_per_minute=60, burst_seconds=2.0)
+        limiter.acquire()
+        limiter.acquire()
+        mock_sleep.assert_not_called()
+        
+        # 분당 60개이면 이후 요청은 1초 간격으로 예약됨 (1분 분량이 한꺼번에 나가지 않음)
+        for _ in range(3):
+            limiter.acquire()
+        waits = [call.args[0] for call in mock_sleep.call_args_list]
+        self.assertEqual(len(waits), 3)
+        for expected, wait in zip([1.0, 2.0, 3.0], waits):
+            self.assertAlmostEqual(wait, expected, places=1)
+    
+    @patch('pdf_translator.rate_limiter.time.sleep')
+    def test_acquire_waits_when_tokens_exhausted(self, mock_sleep):
+        """분당 토큰 수를 넘으면 대기하는지 테스트"""
+        limiter = RateLimiter(requests_per_minute=1000, tokens_per_minute=6000, burst_seconds=2.0)
+        limiter.acquire(tokens=200)
+        mock_sleep.assert_not_called()
+        
+        limiter.acquire(tokens=600)
+        self.assertAlmostEqual(mock_sleep.call_args[0][0], 6.0, places=1)
+    
+    def test_aacquire(self):
+        """비동기 대기 테스트"""
+        limiter = RateLimiter(requests_per_minute=600, burst_seconds=2.0)
+        
+        async def run():
+            with patch('pdf_translator.rate_limiter.asyncio.sleep') as mock_sleep:
+                for _ in range(21):
+                    await limiter.aacquire()
+                return mock_sleep.call_count
+        
+        # 20개(2초 분량)까지는 바로 보내고 그다음 요청부터 대기
+        self.assertEqual(asyncio.run(run()), 1)
+    
+    def test_estimate_tokens(self):
+        """토큰 수 추정 테스트"""
+        self.assertEqual(estimate_tokens("abcd" * 10), 10)
+        self.assertEqual(estimate_tokens("안녕하세요"), 5)
+        self.assertEqual(estimate_tokens(""), 1)
+
+if __name__ == "__main__":
+    unittest.main()
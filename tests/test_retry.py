@@ -0,0 +1,93 @@
+"""
+재시도 정책 테스트 모듈
+"""
+
+import asyncio
+import unittest
+import requests
+from unittest.mock import patch, MagicMock
+from google.api_core import exceptions as google_exceptions
+from pdf_translator.retry import RetryPolicy, EmptyResponseError
+
+class TestRetryPolicy(unittest.TestCase):
+    """
+    RetryPolicy 클래스를 테스트하는 테스트 케이스
+    """
+    
+    def test_is_retryable(self):
+        """재시도 가능한 오류와 치명적인 오류 구분 테스트"""
+        self.assertTrue(RetryPolicy.is_retryable(google_exceptions.TooManyRequests("quota")))
+        self.assertTrue(RetryPolicy.is_retryable(google_exceptions.ServiceUnavailable("down")))
+        self.assertTrue(RetryPolicy.is_retryable(EmptyResponseError("empty")))
+        self.assertTrue(RetryPolicy.is_retryable(requests.exceptions.ConnectionError("dropped")))
+        self.assertTrue(RetryPolicy.is_retryable(requests.exceptions.ReadTimeout("slow")))
+        self.assertFalse(RetryPolicy.is_retryable(google_exceptions.InvalidArgument("bad")))
+        self.assertFalse(RetryPolicy.is_retryable(google_exceptions.PermissionDenied("key")))
+        self.assertFalse(RetryPolicy.is_retryable(KeyError("bug")))
+    
+    @patch('pdf_translator.retry.time.sleep')
+    def test_call_retries_then_succeeds(self, mock_sleep):
+        """일시적인 오류 후 성공하는 경우 테스트"""
+        func = MagicMock(side_effect=[google_exceptions.TooManyRequests("quota"), EmptyResponseError("empty"), "ok"])
+        policy = RetryPolicy(max_attempts=5, base_delay=1.0, jitter=0)
+        
+        self.assertEqual(policy.call(func), "ok")
+        self.assertEqual(func.call_count, 3)
+        self.assertEqual([c.args[0] for c in mock_sleep.call_args_list], [1.0, 2.0])
+    
+    @patch('pdf_translator.retry.time.sleep')
+    def test_call_gives_up(self, mock_sleep):
+        """최대 시도 횟수를 넘거나 치명적인 오류이면 예외를 전달하는 테스트"""
+        policy = RetryPolicy(max_attempts=3, jitter=0)
+        
+        func = MagicMock(side_effect=google_exceptions.ServiceUnavailable("down"))
+        with self.assertRaises(google_exceptions.ServiceUnavailable):
+            policy.call(func)
+        self.assertEqual(func.call_count, 3)
+        
+        func = MagicMock(side_effect=google_exceptions.Unauthenticated("key"))
+        with self.assertRaises(google_exceptions.Unauthenticated):
+            policy.call(func)
+        self.assertEqual(func.call_count, 1)
+    
+    @patch('random.random', return_value=1.0)
+    def test_delay_with_jitter_is_capped(self, mock_random):
+        """지터를 더해도 max_delay를 넘지 않는지 테스트"""
+        policy = RetryPolicy(base_delay=1.0, max_delay=10.0, jitter=0.5)
+        
+        self.assertEqual(policy.get_delay(2, ConnectionError()), 3.0)
+        self.assertEqual(policy.get_delay(10, ConnectionError()), 10.0)
+    
+    def test_delay_honors_retry_after(self):
+        """서버가 알려준 대기 시간을 지키는지 테스트"""
+        policy = RetryPolicy(base_delay=1.0, max_delay=60.0, jitter=0)
+        
+        error = google_exceptions.TooManyRequests("Quota exceeded. Please retry in 12.5s.")
+        self.assertEqual(policy.get_delay(1, error), 12.5)
+        
+        response = MagicMock()
+        response.headers = {"Retry-After": "7"}
+        error = google_exceptions.TooManyRequests("quota", response=response)
+        self.assertEqual(policy.get_delay(1, error), 7.0)
+        
+        # 안내가 없으면 지수 백오프 (최대값 제한)
+        error = google_exceptions.ServiceUnavailable("down")
+        self.assertEqual(policy.get_delay(3, error), 4.0)
+        self.assertEqual(policy.get_delay(10, error), 60.0)
+    
+    def test_acall_retries(self):
+        """비동기 호출 재시도 테스트"""
+        attempts = []
+        
+        async def func():
+            attempts.append(1)
+            if len(attempts) < 2:
+                raise google_exceptions.TooManyRequests("quota")
+            return "ok"
+        
+        policy = RetryPolicy(base_delay=0.0, jitter=0)
+        self.assertEqual(asyncio.run(policy.acall(func)), "ok")
+        self.assertEqual(len(attempts), 2)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,137 @@
+"""
+문서 간 페이지 스케줄러 테스트 모듈
+"""
+
+import threading
+import unittest
+from unittest.mock import MagicMock, patch
+from pdf_translator.scheduler import PageScheduler
+
+class FakeProcessor:
+    """페이지 콘텐츠와 번역 호출 순서를 기록하는 PDFProcessor 대역"""
+
+    def __init__(self, page_counts, max_workers=1, fail_on=None, completed=None, empty=None, chunks=None):
+        self.page_counts = page_counts
+        self.completed = completed or {}
+        self.empty = empty or set()
+        self.chunks = chunks or {}
+        self.chunk_barrier = None
+        self.max_workers = max_workers
+        self.executor = None
+        self.fail_on = fail_on
+        self.translated = []
+        self.outputs = {}
+        self._lock = threading.Lock()
+
+    def get_page_count(self, pdf_path):
+        return self.page_counts[pdf_path]
+
+    def open_checkpoint(self, pdf_path, output_path, mode, target_language, resume):
+        return None, {page_num: {"translated": "done"} for page_num in self.completed.get(pdf_path, ())}
+
+    def open_document(self, pdf_path):
+        return MagicMock(path=pdf_path)
+
+    def iter_page_contents(self, document, hybrid, skip_pages):
+        for page_num in range(1, self.page_counts[document.path] + 1):
+            content = f"{document.path}:{page_num}"
+            if page_num not in skip_pages and content not in self.empty:
+                yield page_num, "image", content
+
+    def iter_page_requests(self, pages):
+        for page_num, kind, content in pages:
+            count = self.chunks.get(content, 1)
+            if count == 1:
+                yield page_num, kind, content, 0, 1
+            else:
+                for index in range(count):
+                    yield page_num, kind, f"{content}/{index}", index, count
+
+    def translate_content(self, kind, content, target_language):
+        if content == self.fail_on:
+            raise RuntimeError("boom")
+        if self.chunk_barrier and "/" in content:
+            # 같은 페이지의 조각이 모두 동시에 번역 중이어야 통과
+            self.chunk_barrier.wait(timeout=5)
+        with self._lock:
+            self.translated.append(content)
+        return content.upper()
+
+    def count_page(self):
+        pass
+
+    def save_translated_pdf(self, results, output_path):
+        self.outputs[output_path] = results
+
+class TestPageScheduler(unittest.TestCase):
+    """
+    PageScheduler 클래스를 테스트하는 테스트 케이스
+    """
+
+    def run_scheduler(self, processor, policy, deadlines=None):
+        scheduler = PageScheduler(processor, "English", policy=policy)
+        for pdf_path in processor.page_counts:
+            scheduler.add(pdf_path, f"{pdf_path}.out", deadline=(deadlines or {}).get(pdf_path))
+        return scheduler.run()
+
+    def test_shortest_document_first(self):
+        """짧은 문서의 페이지가 긴 문서보다 먼저 번역되는지 테스트"""
+        processor = FakeProcessor({"big": 5, "small": 2, "medium": 3})
+        jobs = self.run_scheduler(processor, "shortest")
+
+        self.assertEqual(processor.translated[:2], ["small:1", "small:2"])
+        self.assertEqual(processor.translated[2:5], ["medium:1", "medium:2", "medium:3"])
+        self.assertEqual([job.status for job in jobs], ["ok", "ok", "ok"])
+        self.assertEqual(processor.outputs["big.out"], [(n, f"BIG:{n}") for n in range(1, 6)])
+
+    def test_deadline_first(self):
+        """마감 시각이 이른 문서부터 번역하고 마감이 없는 문서는 마지막에 번역하는지 테스트"""
+        processor = FakeProcessor({"a": 1, "b": 1, "c": 1})
+        self.run_scheduler(processor, "deadline", deadlines={"a": 200.0, "c": 100.0})
+        self.assertEqual(processor.translated, ["c:1", "a:1", "b:1"])
+
+    def test_pages_are_reassembled_in_order_with_concurrency(self):
+        """여러 워커로 번역해도 문서별 결과가 페이지 순서대로 저장되는지 테스트"""
+        processor = FakeProcessor({"x": 7, "y": 4}, max_workers=4)
+        self.run_scheduler(processor, "fifo")
+        self.assertEqual(processor.outputs["x.out"], [(n, f"X:{n}") for n in range(1, 8)])
+        self.assertEqual(processor.outputs["y.out"], [(n, f"Y:{n}") for n in range(1, 5)])
+
+    def test_page_chunks_are_translated_concurrently(self):
+        """긴 페이지의 조각을 별도 작업으로 동시에 번역하고 순서대로 합치는지 테스트"""
+        processor = FakeProcessor({"x": 3}, max_workers=3, chunks={"x:2": 3})
+        processor.chunk_barrier = threading.Barrier(3)
+        jobs = self.run_scheduler(processor, "fifo")
+
+        self.assertEqual(jobs[0].status, "ok")
+        self.assertEqual(processor.outputs["x.out"], [(1, "X:1"), (2, "X:2/0\n\nX:2/1\n\nX:2/2"), (3, "X:3")])
+
+    def test_failure_is_isolated(self):
+        """한 문서가 실패해도 다른 문서는 완료되고 실패한 문서의 결과는 저장되지 않는지 테스트"""
+        processor = FakeProcessor({"ok": 2, "broken": 3}, max_workers=2, fail_on="broken:2")
+        jobs = self.run_scheduler(processor, "fifo")
+
+        self.assertEqual([job.status for job in jobs], ["ok", "failed"])
+        self.assertEqual(jobs[1].error, "boom")
+        self.assertNotIn("broken.out", processor.outputs)
+        self.assertIn("ok.out", processor.outputs)
+
+    @patch('pdf_translator.scheduler.tqdm')
+    def test_progress_total_matches_scheduled_pages(self, mock_tqdm):
+        """건너뛴 페이지, 빈 페이지, 실패로 남은 페이지를 빼고 진행률이 끝까지 차는지 테스트"""
+        progress = mock_tqdm.return_value
+        processor = FakeProcessor({"resumed": 4, "sparse": 3, "broken": 5}, fail_on="broken:1",
+                                  completed={"resumed": {1, 2}}, empty={"sparse:2"}, chunks={"sparse:3": 2})
+        self.run_scheduler(processor, "fifo")
+
+        self.assertEqual(mock_tqdm.call_args.kwargs["total"], 12)
+        updated = sum(call.args[0] for call in progress.update.call_args_list)
+        self.assertEqual(updated, progress.total)
+
+    def test_invalid_policy(self):
+        """지원되지 않는 정책 테스트"""
+        with self.assertRaises(ValueError):
+            PageScheduler(FakeProcessor({}), policy="random")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,27 @@
+"""
+CLI 시작 시간 관련 테스트
+"""
+
+import unittest
+from benchmarks.startup import loaded_heavy_modules
+
+class TestStartup(unittest.TestCase):
+    """
+    번역하지 않는 명령이 무거운 모듈을 불러오지 않는지 테스트하는 테스트 케이스
+    """
+
+    def test_list_models_does_not_load_heavy_modules(self):
+        """--list-models가 google.generativeai, PyMuPDF, reportlab 등을 불러오지 않는지 테스트"""
+        heavy = loaded_heavy_modules("import sys; sys.argv = ['main.py', '--list-models']; import main; main.main()")
+        self.assertEqual(heavy, [])
+
+    def test_pdf_processor_import_has_no_side_effects(self):
+        """pdf_processor를 불러올 때 reportlab을 불러오거나 폰트를 등록하지 않는지 테스트"""
+        heavy = loaded_heavy_modules(
+            "import pdf_translator.pdf_processor, pdf_translator.fonts as f; assert not f._korean_font_checked"
+        )
+        self.assertNotIn("reportlab", heavy)
+        self.assertNotIn("google.generativeai", heavy)
+
+if __name__ == "__main__":
+    unittest.main()
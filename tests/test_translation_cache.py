@@ -0,0 +1,63 @@
+"""
+번역 캐시 테스트 모듈
+"""
+
+import os
+import time
+import tempfile
+import unittest
+from pdf_translator.translation_cache import TranslationCache
+
+class TestTranslationCache(unittest.TestCase):
+    """
+    TranslationCache 클래스를 테스트하는 테스트 케이스
+    """
+    
+    def setUp(self):
+        """각 테스트 전에 임시 캐시 디렉터리 생성"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cache = TranslationCache(self.temp_dir.name)
+    
+    def tearDown(self):
+        """임시 캐시 디렉터리 삭제"""
+        self.temp_dir.cleanup()
+    
+    def test_set_and_get(self):
+        """저장한 번역 결과를 다시 읽는 테스트"""
+        key = TranslationCache.make_key("Hello", "한국어", "models/gemini-1.5-flash", "1")
+        self.assertIsNone(self.cache.get(key))
+        
+        self.cache.set(key, "안녕하세요")
+        self.assertEqual(self.cache.get(key), "안녕하세요")
+        
+        # 같은 디렉터리를 사용하는 새 인스턴스에서도 조회 가능
+        self.assertEqual(TranslationCache(self.temp_dir.name).get(key), "안녕하세요")
+    
+    def test_key_depends_on_all_parts(self):
+        """콘텐츠, 언어, 모델, 프롬프트 버전이 모두 키에 반영되는지 테스트"""
+        base = TranslationCache.make_key(b"image", "한국어", "model-a", "1")
+        self.assertEqual(base, TranslationCache.make_key(b"image", "한국어", "model-a", "1"))
+        self.assertNotEqual(base, TranslationCache.make_key(b"image2", "한국어", "model-a", "1"))
+        self.assertNotEqual(base, TranslationCache.make_key(b"image", "일본어", "model-a", "1"))
+        self.assertNotEqual(base, TranslationCache.make_key(b"image", "한국어", "model-b", "1"))
+        self.assertNotEqual(base, TranslationCache.make_key(b"image", "한국어", "model-a", "2"))
+    
+    def test_lru_eviction(self):
+        """크기 제한을 넘으면 가장 오래 사용되지 않은 항목이 삭제되는지 테스트"""
+        cache = TranslationCache(self.temp_dir.name, max_size_bytes=25)
+        
+        cache.set("aa01", "x" * 10)
+        cache.set("aa02", "y" * 10)
+        # 첫 번째 항목을 최근에 사용한 것으로 표시
+        past = time.time() - 100
+        os.utime(cache._path_for("aa02"), (past, past))
+        self.assertEqual(cache.get("aa01"), "x" * 10)
+        
+        cache.set("aa03", "z" * 10)
+        
+        self.assertIsNone(cache.get("aa02"))
+        self.assertEqual(cache.get("aa01"), "x" * 10)
+        self.assertEqual(cache.get("aa03"), "z" * 10)
+
+if __name__ == "__main__":
+    unittest.main()